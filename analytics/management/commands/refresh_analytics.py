@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from analytics.rollup import DEFAULT_BATCH_SIZE, DEFAULT_LAG_SECONDS, refresh_daily_stats
+
+
+class Command(BaseCommand):
+    help = "Fold new ticket status transitions into the daily analytics buckets."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+        parser.add_argument("--lag", type=int, default=DEFAULT_LAG_SECONDS)
+
+    def handle(self, *args, **options):
+        processed = refresh_daily_stats(options["batch_size"], options["lag"])
+        self.stdout.write(self.style.SUCCESS(f"Processed {processed} transition(s)"))
@@ -0,0 +1,48 @@
+from django.db import models
+from projects.models import Project
+
+
+class ProjectDailyStats(models.Model):
+    """
+    Per project and day: flow counts, lead/cycle time sums and the net
+    change of each status column. Built incrementally from
+    StatusTransition by analytics.rollup.
+    """
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name="daily_stats"
+    )
+
+    day = models.DateField()
+
+    created = models.PositiveIntegerField(default=0)
+    started = models.PositiveIntegerField(default=0)
+    completed = models.PositiveIntegerField(default=0)
+
+    # Seconds, summed over the tickets completed that day
+    lead_time_total = models.FloatField(default=0)
+    cycle_time_total = models.FloatField(default=0)
+    cycle_time_count = models.PositiveIntegerField(default=0)
+
+    # Net change of tickets per status column (for cumulative flow)
+    todo_delta = models.IntegerField(default=0)
+    in_progress_delta = models.IntegerField(default=0)
+    done_delta = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ("project", "day")
+
+    def __str__(self):
+        return f"{self.project_id} {self.day}"
+
+
+class RollupCursor(models.Model):
+    """Last StatusTransition id folded into a rollup."""
+
+    name = models.CharField(max_length=50, primary_key=True)
+    last_id = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} @ {self.last_id}"
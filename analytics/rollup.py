@@ -0,0 +1,157 @@
+"""
+Incremental daily rollup of status transitions.
+
+Each run folds StatusTransition rows after the stored cursor into
+ProjectDailyStats, so dashboards read one row per project and day
+instead of scanning tickets. Rows younger than `lag` seconds are left
+for the next run, giving concurrent writers time to commit so that no
+id is skipped.
+
+Deleting a ticket appends a transition from its status to none, which
+takes it out of that column's delta on the day of the deletion. A
+soft-deleted project keeps its buckets for a restore; purging it
+removes them with the project. Transitions to or from a status outside
+DELTA_FIELDS are logged and skipped so they can't stall the cursor.
+"""
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Min
+from django.utils import timezone
+
+from analytics.models import ProjectDailyStats, RollupCursor
+from tickets.models import StatusTransition, Ticket
+
+logger = logging.getLogger(__name__)
+
+CURSOR_NAME = "project_daily_stats"
+DEFAULT_BATCH_SIZE = 5000
+DEFAULT_LAG_SECONDS = 60
+
+DELTA_FIELDS = {
+    "TODO": "todo_delta",
+    "IN_PROGRESS": "in_progress_delta",
+    "DONE": "done_delta",
+}
+
+COUNTER_FIELDS = [
+    "created",
+    "started",
+    "completed",
+    "lead_time_total",
+    "cycle_time_total",
+    "cycle_time_count",
+    *DELTA_FIELDS.values(),
+]
+
+
+def bucket_transitions(batch) -> dict:
+    """{(project_id, day): {field: increment}} for one batch of transitions."""
+    done_ids = {row["ticket_id"] for row in batch if row["to_status"] == "DONE"}
+
+    created_at = dict(
+        Ticket.objects.filter(id__in=done_ids).values_list("id", "created_at")
+    )
+    started_at = dict(
+        StatusTransition.objects.filter(ticket_id__in=done_ids, to_status="IN_PROGRESS")
+        .values("ticket_id")
+        .annotate(first=Min("at"))
+        .values_list("ticket_id", "first")
+    )
+
+    buckets = defaultdict(lambda: defaultdict(int))
+
+    for row in batch:
+        # Empty from_status: created; empty to_status: deleted
+        statuses = [status for status in (row["from_status"], row["to_status"]) if status]
+        if not statuses or any(status not in DELTA_FIELDS for status in statuses):
+            logger.warning(
+                "Skipping status transition %s with unknown status %r -> %r",
+                row["id"], row["from_status"], row["to_status"],
+            )
+            continue
+
+        bucket = buckets[(row["project_id"], timezone.localdate(row["at"]))]
+
+        if not row["from_status"]:
+            bucket["created"] += 1
+        else:
+            bucket[DELTA_FIELDS[row["from_status"]]] -= 1
+
+        if not row["to_status"]:
+            continue
+        bucket[DELTA_FIELDS[row["to_status"]]] += 1
+
+        if row["to_status"] == "IN_PROGRESS":
+            bucket["started"] += 1
+
+        if row["to_status"] == "DONE":
+            bucket["completed"] += 1
+            ticket_id = row["ticket_id"]
+
+            if ticket_id in created_at:
+                bucket["lead_time_total"] += (row["at"] - created_at[ticket_id]).total_seconds()
+
+            started = started_at.get(ticket_id)
+            if started and started <= row["at"]:
+                bucket["cycle_time_total"] += (row["at"] - started).total_seconds()
+                bucket["cycle_time_count"] += 1
+
+    return buckets
+
+
+def apply_buckets(buckets: dict):
+    keys = list(buckets)
+    existing = {
+        (row.project_id, row.day): row
+        for row in ProjectDailyStats.objects.filter(
+            project_id__in={project_id for project_id, _ in keys},
+            day__in={day for _, day in keys},
+        )
+    }
+
+    to_update, to_create = [], []
+    for key, increments in buckets.items():
+        row = existing.get(key)
+        if row is None:
+            row = ProjectDailyStats(project_id=key[0], day=key[1])
+            to_create.append(row)
+        else:
+            to_update.append(row)
+
+        for field, value in increments.items():
+            setattr(row, field, getattr(row, field) + value)
+
+    ProjectDailyStats.objects.bulk_update(to_update, COUNTER_FIELDS)
+    ProjectDailyStats.objects.bulk_create(to_create)
+
+
+def refresh_daily_stats(batch_size: int = DEFAULT_BATCH_SIZE, lag: int = DEFAULT_LAG_SECONDS) -> int:
+    """Fold new transitions into the daily buckets. Returns rows processed."""
+    RollupCursor.objects.get_or_create(name=CURSOR_NAME)
+    cutoff = timezone.now() - timedelta(seconds=lag)
+    processed = 0
+
+    while True:
+        with transaction.atomic():
+            cursor = RollupCursor.objects.select_for_update().get(name=CURSOR_NAME)
+
+            batch = list(
+                StatusTransition.objects
+                .filter(id__gt=cursor.last_id, at__lte=cutoff)
+                .order_by("id")
+                .values("id", "ticket_id", "project_id", "from_status", "to_status", "at")[:batch_size]
+            )
+            if not batch:
+                break
+
+            apply_buckets(bucket_transitions(batch))
+
+            cursor.last_id = batch[-1]["id"]
+            cursor.save(update_fields=["last_id", "updated_at"])
+
+        processed += len(batch)
+
+    return processed
@@ -0,0 +1,7 @@
+from analytics.rollup import refresh_daily_stats
+from jobs.queue import register
+
+
+@register("analytics.refresh_daily_stats", concurrency=1)
+def refresh():
+    return {"processed": refresh_daily_stats()}
@@ -0,0 +1,133 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from analytics.models import ProjectDailyStats, RollupCursor
+from analytics.rollup import CURSOR_NAME, refresh_daily_stats
+from analytics.timeseries import status_timeseries
+from api.dashboard.routes import get_workload
+from api.tickets.routes import bulk_delete_tickets, delete_ticket
+from api.tickets.schemas import TicketBulkDelete
+from projects.models import Project, ProjectMember
+from tickets.models import StatusTransition, Ticket
+from users.models import User
+
+
+class TransitionTestCase(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user("owner@example.com", "pw", name="Owner")
+        self.project = Project.objects.create(name="Stats", owner=self.owner)
+        self.ticket = Ticket.objects.create(
+            title="T", description="", project=self.project, created_by=self.owner
+        )
+
+    def transition(self, from_status, to_status):
+        return StatusTransition.objects.create(
+            ticket=self.ticket,
+            project=self.project,
+            from_status=from_status,
+            to_status=to_status,
+        )
+
+
+class DailyRollupTests(TransitionTestCase):
+    def test_transitions_fold_into_daily_buckets(self):
+        self.transition("", "TODO")
+        self.transition("TODO", "IN_PROGRESS")
+        self.transition("IN_PROGRESS", "DONE")
+
+        self.assertEqual(refresh_daily_stats(lag=0), 3)
+        self.assertEqual(refresh_daily_stats(lag=0), 0)
+
+        stats = ProjectDailyStats.objects.get(project=self.project, day=timezone.localdate())
+        self.assertEqual((stats.created, stats.started, stats.completed), (1, 1, 1))
+        self.assertEqual((stats.todo_delta, stats.in_progress_delta, stats.done_delta), (0, 0, 1))
+        self.assertEqual(stats.cycle_time_count, 1)
+
+    def test_unknown_status_is_skipped_without_stalling(self):
+        self.transition("", "TODO")
+        self.transition("TODO", "BOGUS")
+        last = self.transition("BOGUS", "DONE")
+
+        with self.assertLogs("analytics.rollup", "WARNING"):
+            self.assertEqual(refresh_daily_stats(lag=0), 3)
+
+        self.assertEqual(RollupCursor.objects.get(name=CURSOR_NAME).last_id, last.id)
+        stats = ProjectDailyStats.objects.get(project=self.project)
+        self.assertEqual((stats.created, stats.todo_delta, stats.done_delta), (1, 1, 0))
+
+    def test_deleted_tickets_leave_their_column(self):
+        ProjectMember.objects.create(user=self.owner, project=self.project, role="ADMIN")
+        others = Ticket.objects.bulk_create([
+            Ticket(title=title, description="", project=self.project, created_by=self.owner)
+            for title in ("A", "B")
+        ])
+        self.transition("", "TODO")
+        self.transition("TODO", "DONE")
+        for ticket in others:
+            StatusTransition.objects.create(ticket=ticket, project=self.project, to_status="TODO")
+        refresh_daily_stats(lag=0)
+
+        Ticket.objects.filter(id=self.ticket.id).update(status="DONE")
+        delete_ticket(self.ticket.id, current_user=self.owner)
+        bulk_delete_tickets(TicketBulkDelete(ticket_ids=[others[0].id]), current_user=self.owner)
+
+        self.assertEqual(refresh_daily_stats(lag=0), 2)
+        stats = ProjectDailyStats.objects.get(project=self.project)
+        self.assertEqual((stats.created, stats.completed), (3, 1))
+        self.assertEqual((stats.todo_delta, stats.in_progress_delta, stats.done_delta), (1, 0, 0))
+
+        today = timezone.localdate()
+        series = status_timeseries(self.project.id, today, today)
+        self.assertEqual((series["todo"], series["done"]), ([1], [0]))
+
+
+class WorkloadTests(TestCase):
+    def test_unknown_priority_or_status_is_left_out(self):
+        owner = User.objects.create_user("owner@example.com", "pw", name="Owner")
+        project = Project.objects.create(name="Load", owner=owner)
+        ProjectMember.objects.create(user=owner, project=project, role="ADMIN")
+        for title in ("A", "B", "C"):
+            Ticket.objects.create(
+                title=title, description="", project=project, created_by=owner,
+                assigned_to=owner, priority="HIGH",
+            )
+        Ticket.objects.filter(title="B").update(priority="BOGUS")
+        Ticket.objects.filter(title="C").update(status="BOGUS")
+
+        result = get_workload(refresh=True, current_user=owner)
+
+        self.assertEqual(sum(result["matrix"][0]), 1)
+        self.assertEqual(sum(result["by_status"]["TODO"][0]), 1)
+
+
+class StatusTimeseriesTests(TransitionTestCase):
+    def transition_at(self, from_status, to_status, days_ago):
+        transition = self.transition(from_status, to_status)
+        StatusTransition.objects.filter(id=transition.id).update(
+            at=timezone.now() - timedelta(days=days_ago)
+        )
+        return transition
+
+    def test_counts_include_transitions_before_the_range(self):
+        self.transition_at("", "TODO", 10)
+        self.transition_at("", "TODO", 3)
+        self.transition_at("TODO", "DONE", 1)
+        today = timezone.localdate()
+
+        series = status_timeseries(self.project.id, today - timedelta(days=4), today)
+
+        self.assertEqual(series["todo"], [1, 2, 2, 1, 1])
+        self.assertEqual(series["done"], [0, 0, 0, 1, 1])
+        self.assertEqual(series["remaining"], [1, 2, 2, 1, 1])
+
+    def test_deleted_transitions_invalidate_the_cache(self):
+        self.transition_at("", "TODO", 2)
+        early = self.transition_at("", "TODO", 1)
+        today = timezone.localdate()
+        self.assertEqual(status_timeseries(self.project.id, today, today)["todo"], [2])
+
+        early.delete()
+
+        self.assertEqual(status_timeseries(self.project.id, today, today)["todo"], [1])
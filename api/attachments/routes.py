@@ -0,0 +1,237 @@
+"""
+Ticket and comment attachments.
+
+Uploads send the raw file as the request body (filename in the query
+string) and are streamed to disk chunk by chunk, so memory use does not
+depend on file size. Downloads are served from the content-addressed
+store with HTTP range support.
+"""
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+from typing import List
+
+from django.conf import settings
+
+from attachments.models import Attachment
+from attachments.service import save_attachment
+from attachments.storage import BlobTooLarge, BlobWriter, blob_path
+from comments.models import Comments
+from projects.models import ProjectMember
+from tickets.models import ArchivedTicket, Ticket
+from users.models import User
+
+from .schemas import AttachmentResponse
+from api.core.dependencies import get_current_user
+
+
+router = APIRouter(prefix="/attachments", tags=["Attachments"])
+
+
+# --------------------
+# Helper functions
+# --------------------
+
+def attachment_to_response(attachment: Attachment) -> dict:
+    return {
+        "id": attachment.id,
+        "ticket_id": attachment.ticket_id,
+        "comment_id": attachment.comment_id,
+        "filename": attachment.filename,
+        "content_type": attachment.content_type,
+        "size": attachment.size,
+        "sha256": attachment.blob_id,
+        "uploaded_by_id": attachment.uploaded_by_id,
+        "created_at": attachment.created_at,
+    }
+
+
+def member_role(user: User, project_id: int):
+    return ProjectMember.objects.filter(
+        user=user,
+        project_id=project_id
+    ).values_list("role", flat=True).first()
+
+
+def ticket_upload_target(ticket_id: int, user: User) -> dict:
+    ticket = Ticket.objects.filter(id=ticket_id).only("id", "project_id").first()
+    if not ticket:
+        raise HTTPException(404, "Ticket not found")
+
+    if member_role(user, ticket.project_id) not in ("ADMIN", "DEV"):
+        raise HTTPException(403, "You do not have permission to modify this ticket")
+
+    return {"project_id": ticket.project_id, "ticket_id": ticket.id, "comment_id": None}
+
+
+def comment_upload_target(comment_id: int, user: User) -> dict:
+    comment = Comments.objects.select_related("ticket").filter(id=comment_id).first()
+    if not comment:
+        raise HTTPException(404, "Comment not found.")
+
+    if comment.user_id != user.id:
+        raise HTTPException(403, "You can only attach files to your own comments.")
+
+    return {
+        "project_id": comment.ticket.project_id,
+        "ticket_id": comment.ticket_id,
+        "comment_id": comment.id,
+    }
+
+
+def too_large() -> HTTPException:
+    return HTTPException(413, f"Attachments are limited to {settings.ATTACHMENT_MAX_BYTES} bytes.")
+
+
+def check_upload_size(request: Request):
+    length = request.headers.get("content-length")
+    if length and length.isdigit() and int(length) > settings.ATTACHMENT_MAX_BYTES:
+        raise too_large()
+
+
+async def receive_upload(request: Request, target: dict, user: User, filename: str) -> dict:
+    """Stream the request body into the blob store and record the attachment."""
+    writer = await run_in_threadpool(BlobWriter)
+
+    try:
+        async for chunk in request.stream():
+            if chunk:
+                await run_in_threadpool(writer.write, chunk)
+    except BlobTooLarge:
+        await run_in_threadpool(writer.discard)
+        raise too_large()
+    except BaseException:
+        await run_in_threadpool(writer.discard)
+        raise
+
+    content_type = request.headers.get("content-type") or "application/octet-stream"
+
+    try:
+        attachment = await run_in_threadpool(
+            save_attachment,
+            writer,
+            user=user,
+            filename=filename,
+            content_type=content_type[:100],
+            **target
+        )
+    except BaseException:
+        await run_in_threadpool(writer.discard)
+        raise
+
+    return attachment_to_response(attachment)
+
+
+def get_readable_attachment(attachment_id: int, user: User) -> Attachment:
+    attachment = Attachment.objects.filter(id=attachment_id).first()
+    if not attachment:
+        raise HTTPException(404, "Attachment not found")
+
+    if member_role(user, attachment.project_id) is None:
+        raise HTTPException(403, "You are not a member of this project.")
+
+    return attachment
+
+
+# --------------------
+# Upload
+# --------------------
+
+@router.post(
+    "/tickets/{ticket_id}",
+    response_model=AttachmentResponse,
+    status_code=status.HTTP_201_CREATED
+)
+async def upload_ticket_attachment(
+    ticket_id: int,
+    request: Request,
+    filename: str = Query(..., min_length=1, max_length=255),
+    current_user: User = Depends(get_current_user)
+):
+    check_upload_size(request)
+    target = await run_in_threadpool(ticket_upload_target, ticket_id, current_user)
+    return await receive_upload(request, target, current_user, filename)
+
+
+@router.post(
+    "/comments/{comment_id}",
+    response_model=AttachmentResponse,
+    status_code=status.HTTP_201_CREATED
+)
+async def upload_comment_attachment(
+    comment_id: int,
+    request: Request,
+    filename: str = Query(..., min_length=1, max_length=255),
+    current_user: User = Depends(get_current_user)
+):
+    check_upload_size(request)
+    target = await run_in_threadpool(comment_upload_target, comment_id, current_user)
+    return await receive_upload(request, target, current_user, filename)
+
+
+# --------------------
+# List / Download
+# --------------------
+
+@router.get("/tickets/{ticket_id}", response_model=List[AttachmentResponse])
+def list_ticket_attachments(
+    ticket_id: int,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Metadata only, including attachments of the ticket's comments.
+    Archived tickets keep their attachments and are listed too.
+    """
+    project_id = (
+        Ticket.objects.filter(id=ticket_id).values_list("project_id", flat=True).first()
+        or ArchivedTicket.objects.filter(id=ticket_id).values_list("project_id", flat=True).first()
+    )
+    if project_id is None:
+        raise HTTPException(404, "Ticket not found")
+
+    if member_role(current_user, project_id) is None:
+        raise HTTPException(403, "You are not a member of this project.")
+
+    attachments = Attachment.objects.filter(ticket_id=ticket_id).order_by("created_at", "id")
+    return [attachment_to_response(attachment) for attachment in attachments]
+
+
+@router.get("/{attachment_id}/download")
+def download_attachment(
+    attachment_id: int,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Serve the file. Range requests get 206 partial content, so large
+    downloads can be resumed; the ETag is the content hash.
+    """
+    attachment = get_readable_attachment(attachment_id, current_user)
+
+    return FileResponse(
+        blob_path(attachment.blob_id),
+        media_type=attachment.content_type,
+        filename=attachment.filename,
+        headers={"ETag": f'"{attachment.blob_id}"'},
+    )
+
+
+# --------------------
+# Delete
+# --------------------
+
+@router.delete("/{attachment_id}", status_code=204)
+def delete_attachment(
+    attachment_id: int,
+    current_user: User = Depends(get_current_user)
+):
+    attachment = get_readable_attachment(attachment_id, current_user)
+
+    if (
+        attachment.uploaded_by_id != current_user.id
+        and member_role(current_user, attachment.project_id) != "ADMIN"
+    ):
+        raise HTTPException(403, "Only the uploader or a project admin can delete this attachment.")
+
+    # The blob stays until gc_attachment_blobs finds it unreferenced
+    attachment.delete()
+    return
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+
+class AttachmentResponse(BaseModel):
+    id: int
+    ticket_id: int
+    comment_id: Optional[int] = None
+    filename: str
+    content_type: str
+    size: int
+    sha256: str
+    uploaded_by_id: Optional[int] = None
+    created_at: datetime
@@ -1,10 +1,16 @@
 from fastapi import APIRouter, HTTPException, Depends, status
 from typing import List
 
-from comments.models import Comments
-from tickets.models import Ticket
+from django.db import transaction
+
+from attachments.models import Attachment
+from comments.models import ArchivedComment, Comments
+from tickets.models import ArchivedTicket, Ticket
 from users.models import User
-from projects.models import ProjectMember
+from projects.changes import record_change
+from projects.models import ProjectChange, ProjectMember
+from notifications.fanout import notify
+from tickets.watchers import add_watchers, ticket_audience
 
 from .schemas import CommentCreate, CommentResponse, CommentUpdate
 from api.core.dependencies import get_current_user
@@ -62,6 +68,10 @@ def create_comment(
         ticket=ticket
     )
 
+    record_change(ticket.project_id, ProjectChange.COMMENT, new_comment.id)
+    add_watchers([ticket.id], [current_user.id], "COMMENTER")
+    notify("COMMENTED", current_user, [(ticket.id, ticket_audience(ticket.id))])
+
     return {
         "id": new_comment.id,
         "comment": new_comment.comment,
@@ -85,9 +95,12 @@ def get_comments(
     ticket_id: int,
     current_user: User = Depends(get_current_user)
 ):
-    try:
-        ticket = Ticket.objects.select_related("project").get(id=ticket_id)
-    except Ticket.DoesNotExist:
+    ticket = (
+        Ticket.objects.filter(id=ticket_id).first()
+        or ArchivedTicket.objects.filter(id=ticket_id).first()
+    )
+
+    if ticket is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Ticket with ID {ticket_id} not found."
@@ -99,8 +112,11 @@ def get_comments(
             detail="You are not a member of this project."
         )
 
+    # Comments of archived tickets live in the archive table
+    model = ArchivedComment if isinstance(ticket, ArchivedTicket) else Comments
+
     comments = (
-        Comments.objects
+        model.objects
         .select_related("user")
         .filter(ticket_id=ticket_id)
         .order_by("created_at")
@@ -130,7 +146,7 @@ def update_comment(
     payload: CommentUpdate,
     current_user: User = Depends(get_current_user)
 ):
-    comment = Comments.objects.select_related("user").filter(id=comment_id).first()
+    comment = Comments.objects.select_related("user", "ticket").filter(id=comment_id).first()
 
     if not comment:
         raise HTTPException(
@@ -146,6 +162,7 @@ def update_comment(
 
     comment.comment = payload.comment
     comment.save(update_fields=["comment"])
+    record_change(comment.ticket.project_id, ProjectChange.COMMENT, comment.id)
 
     return {
         "id": comment.id,
@@ -170,7 +187,7 @@ def delete_comment(
     comment_id: int,
     current_user: User = Depends(get_current_user)
 ):
-    comment = Comments.objects.filter(id=comment_id).first()
+    comment = Comments.objects.select_related("ticket").filter(id=comment_id).first()
 
     if not comment:
         raise HTTPException(
@@ -184,4 +201,7 @@ def delete_comment(
             detail="You can only delete your own comments."
         )
 
-    comment.delete()
+    with transaction.atomic():
+        Attachment.objects.filter(comment_id=comment_id).delete()
+        comment.delete()
+        record_change(comment.ticket.project_id, ProjectChange.COMMENT, comment_id, deleted=True)
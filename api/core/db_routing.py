@@ -0,0 +1,76 @@
+"""
+Send API reads to the read replica.
+
+GET and HEAD requests read from the replica, except for a user who
+wrote something in the last READ_YOUR_WRITES_SECONDS: every successful
+mutating request leaves a short-lived marker in the Django cache, keyed
+by the user id from the bearer token, and while it exists that user's
+reads stay on the primary so they see their own changes. Use a shared
+cache (REDIS_URL) when running more than one worker.
+
+Sync endpoints run in a copy of the request's context, so the routing
+flag set here reaches the ORM calls in the threadpool. The marker is
+read and written with the cache's async API, so a network cache doesn't
+block the event loop.
+"""
+from jose import JWTError, jwt
+
+from api.core.security import ALGORITHM, SECRET_KEY
+
+READ_METHODS = {"GET", "HEAD"}
+
+
+def marker_key(user_id) -> str:
+    return f"db:primary-reads:{user_id}"
+
+
+def token_user_id(scope) -> str | None:
+    for name, value in scope.get("headers", ()):
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() != "bearer":
+                return None
+            try:
+                return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM]).get("sub")
+            except JWTError:
+                return None
+    return None
+
+
+class ReplicaRoutingMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Django is configured in the lifespan, after the app is built
+        from django.conf import settings
+        from django.core.cache import cache
+        from devtrack.db_router import REPLICA_ALIAS, read_from_replica
+
+        if REPLICA_ALIAS not in settings.DATABASES:
+            await self.app(scope, receive, send)
+            return
+
+        user_id = token_user_id(scope)
+
+        if scope["method"] in READ_METHODS:
+            recently_wrote = user_id is not None and await cache.aget(marker_key(user_id)) is not None
+            with read_from_replica(not recently_wrote):
+                await self.app(scope, receive, send)
+            return
+
+        status_code = None
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if user_id is not None and status_code < 400:
+                    await cache.aset(marker_key(user_id), 1, settings.READ_YOUR_WRITES_SECONDS)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,9 +1,14 @@
 import os
 import django
+from django.apps import apps
 
-os.environ.setdefault(
-    "DJANGO_SETTINGS_MODULE",
-    "devtrack.settings"
-)
 
-django.setup()
\ No newline at end of file
+def setup_django(settings_module: str = "devtrack.settings_api"):
+    """
+    Configure Django once per process. Safe to call more than once;
+    DJANGO_SETTINGS_MODULE in the environment wins over settings_module.
+    """
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+
+    if not apps.ready:
+        django.setup()
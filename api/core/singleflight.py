@@ -0,0 +1,90 @@
+"""
+Single-flight coalescing for read endpoints.
+
+Identical reads that arrive while one is already running wait for it and
+share its result instead of hitting the database again. Sync endpoints
+run in the threadpool, so this is thread based. Keys must include
+everything the result depends on: route, parameters and the caller's
+authorization scope (a project id once membership has been checked, or
+the user id for per-user views).
+
+A waiter gives up after SINGLEFLIGHT_TIMEOUT seconds and computes the
+result itself, so a stuck leader only slows its followers down to the
+uncoalesced path.
+"""
+import os
+import threading
+from collections import defaultdict
+
+from devtrack.db_router import replica_reads_enabled
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._stats = defaultdict(lambda: {"executed": 0, "shared": 0, "timeouts": 0})
+
+    def do(self, name: str, key, fn):
+        """
+        Return fn(), sharing one run among concurrent callers with the
+        same (name, key). `name` groups the metrics, usually the route.
+        """
+        # Primary and replica reads never share a result
+        full_key = (name, key, replica_reads_enabled())
+
+        with self._lock:
+            call = self._calls.get(full_key)
+            leader = call is None
+            if leader:
+                call = self._calls[full_key] = _Call()
+                self._stats[name]["executed"] += 1
+            else:
+                self._stats[name]["shared"] += 1
+
+        if leader:
+            try:
+                call.result = fn()
+                return call.result
+            except BaseException as exc:
+                call.error = exc
+                raise
+            finally:
+                with self._lock:
+                    del self._calls[full_key]
+                call.done.set()
+
+        if not call.done.wait(self.timeout):
+            with self._lock:
+                self._stats[name]["timeouts"] += 1
+            return fn()
+
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def metrics(self) -> dict:
+        with self._lock:
+            stats = {name: dict(counts) for name, counts in self._stats.items()}
+            in_flight = len(self._calls)
+
+        for counts in stats.values():
+            total = counts["executed"] + counts["shared"]
+            # Waiters that timed out ran the query themselves
+            saved = counts["shared"] - counts["timeouts"]
+            counts["coalescing_ratio"] = round(saved / total, 4) if total else 0.0
+
+        return {"in_flight": in_flight, "routes": stats}
+
+
+singleflight = SingleFlight(timeout=float(os.environ.get("SINGLEFLIGHT_TIMEOUT", "5")))
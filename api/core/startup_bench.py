@@ -0,0 +1,124 @@
+"""
+Cold-start benchmark for the API process.
+
+    python -m api.core.startup_bench
+    python -m api.core.startup_bench --settings devtrack.settings --runs 5 --top 20
+
+Each run starts a fresh interpreter with `-X importtime`, imports
+api.main, runs Django setup and router registration (what the lifespan
+does), and reports wall-clock time per phase plus the packages that
+spent the most time importing.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+CHILD_CODE = """
+import json, time
+t0 = time.perf_counter()
+import api.main
+t1 = time.perf_counter()
+from api.core.django_setup import setup_django
+setup_django()
+t2 = time.perf_counter()
+api.main.register_routers(api.main.app)
+t3 = time.perf_counter()
+from django.conf import settings
+print(json.dumps({
+    "import_main": t1 - t0,
+    "django_setup": t2 - t1,
+    "register_routers": t3 - t2,
+    "total": t3 - t0,
+    "installed_apps": len(settings.INSTALLED_APPS),
+}))
+"""
+
+
+def run_once(settings_module: str) -> tuple[dict, dict]:
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": settings_module}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD_CODE],
+        cwd=BASE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    phases = json.loads(proc.stdout.strip().splitlines()[-1])
+    return phases, parse_importtime(proc.stderr)
+
+
+def parse_importtime(stderr: str) -> dict:
+    """
+    Sum `-X importtime` self time (microseconds) per top-level package.
+    """
+    per_package = defaultdict(int)
+
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_us, _cumulative, name = line[len("import time:"):].split("|")
+        per_package[name.strip().split(".")[0]] += int(self_us)
+
+    return per_package
+
+
+def benchmark(settings_module: str, runs: int, top: int):
+    samples = []
+    packages = defaultdict(list)
+
+    for _ in range(runs):
+        phases, per_package = run_once(settings_module)
+        samples.append(phases)
+        for name, us in per_package.items():
+            packages[name].append(us)
+
+    print(f"\n{settings_module} ({samples[0]['installed_apps']} apps, median of {runs} runs)")
+    for phase in ("import_main", "django_setup", "register_routers", "total"):
+        median = statistics.median(s[phase] for s in samples)
+        print(f"  {phase:<18} {median * 1000:8.1f} ms")
+
+    print(f"  slowest packages (self import time):")
+    ranked = sorted(
+        ((statistics.median(us), name) for name, us in packages.items()),
+        reverse=True
+    )
+    for us, name in ranked[:top]:
+        print(f"    {name:<30} {us / 1000:8.1f} ms")
+
+    return statistics.median(s["total"] for s in samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--settings",
+        action="append",
+        help="Settings module to benchmark (repeatable). "
+             "Defaults to comparing devtrack.settings and devtrack.settings_api.",
+    )
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    profiles = args.settings or ["devtrack.settings", "devtrack.settings_api"]
+    totals = {name: benchmark(name, args.runs, args.top) for name in profiles}
+
+    if len(totals) > 1:
+        baseline = totals[profiles[0]]
+        print()
+        for name, total in totals.items():
+            print(f"{name:<28} {total * 1000:8.1f} ms ({total / baseline:.0%} of {profiles[0]})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,20 @@
-from fastapi import APIRouter, Depends
-from django.db.models import Count, Q
+from datetime import date, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Query
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
 from api.core.dependencies import get_current_user
+from api.core.singleflight import singleflight
+from analytics.models import ProjectDailyStats
+from analytics.timeseries import status_timeseries
 from projects.models import Project, ProjectMember
 from tickets.models import Ticket
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
+MAX_TIMESERIES_DAYS = 5 * 366
+WORKLOAD_CACHE_TIMEOUT = 60
+
 
 @router.get("/stats")
 def get_dashboard_stats(current_user=Depends(get_current_user)):
@@ -71,4 +80,255 @@ def get_recent_activity(current_user=Depends(get_current_user)):
             "created_at": ticket.created_at
         }
         for ticket in recent_tickets
-    ]
\ No newline at end of file
+    ]
+
+
+def require_project_member(project_id: int, user):
+    if not ProjectMember.objects.filter(user=user, project_id=project_id).exists():
+        raise HTTPException(status_code=403, detail="Access denied")
+
+
+@router.get("/projects/{project_id}/flow")
+def get_cumulative_flow(
+    project_id: int,
+    start: date | None = None,
+    end: date | None = None,
+    current_user=Depends(get_current_user)
+):
+    """
+    Cumulative flow: tickets per status at the end of each day,
+    read from the daily rollup (one row per day).
+    """
+    require_project_member(project_id, current_user)
+
+    end = end or timezone.localdate()
+    start = start or end - timedelta(days=29)
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must be before end")
+
+    def load():
+        stats = ProjectDailyStats.objects.filter(project_id=project_id)
+
+        totals = stats.filter(day__lt=start).aggregate(
+            todo=Sum("todo_delta"),
+            in_progress=Sum("in_progress_delta"),
+            done=Sum("done_delta"),
+        )
+        todo = totals["todo"] or 0
+        in_progress = totals["in_progress"] or 0
+        done = totals["done"] or 0
+
+        deltas = {
+            row["day"]: row
+            for row in stats.filter(day__gte=start, day__lte=end).values(
+                "day", "todo_delta", "in_progress_delta", "done_delta"
+            )
+        }
+
+        days, todo_series, in_progress_series, done_series = [], [], [], []
+        day = start
+        while day <= end:
+            row = deltas.get(day)
+            if row:
+                todo += row["todo_delta"]
+                in_progress += row["in_progress_delta"]
+                done += row["done_delta"]
+
+            days.append(day)
+            todo_series.append(todo)
+            in_progress_series.append(in_progress)
+            done_series.append(done)
+            day += timedelta(days=1)
+
+        return {
+            "days": days,
+            "todo": todo_series,
+            "in_progress": in_progress_series,
+            "done": done_series,
+        }
+
+    return singleflight.do("dashboard.flow", (project_id, start, end), load)
+
+
+@router.get("/projects/{project_id}/timeseries")
+def get_status_timeseries(
+    project_id: int,
+    start: date | None = None,
+    end: date | None = None,
+    current_user=Depends(get_current_user)
+):
+    """
+    Burndown and cumulative-flow series computed from the status
+    transitions: one number per day from start to end for each status,
+    plus `remaining` (not done).
+    """
+    require_project_member(project_id, current_user)
+
+    end = end or timezone.localdate()
+    start = start or end - timedelta(days=29)
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must be before end")
+    if (end - start).days >= MAX_TIMESERIES_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Range is limited to {MAX_TIMESERIES_DAYS} days"
+        )
+
+    series = singleflight.do(
+        "dashboard.timeseries",
+        (project_id, start, end),
+        lambda: status_timeseries(project_id, start, end)
+    )
+
+    return {
+        "start": start,
+        "end": end,
+        **series,
+    }
+
+
+@router.get("/projects/{project_id}/throughput")
+def get_throughput(
+    project_id: int,
+    weeks: int = Query(12, ge=1, le=104),
+    current_user=Depends(get_current_user)
+):
+    """
+    Completed tickets, average lead time and average cycle time per
+    week (weeks start on Monday), read from the daily rollup.
+    """
+    require_project_member(project_id, current_user)
+
+    def load():
+        today = timezone.localdate()
+        first_week = today - timedelta(days=today.weekday(), weeks=weeks - 1)
+
+        per_week = {
+            first_week + timedelta(weeks=i): {
+                "completed": 0, "started": 0, "created": 0,
+                "lead": 0.0, "cycle": 0.0, "cycle_count": 0,
+            }
+            for i in range(weeks)
+        }
+
+        rows = ProjectDailyStats.objects.filter(
+            project_id=project_id,
+            day__gte=first_week
+        ).values(
+            "day", "created", "started", "completed",
+            "lead_time_total", "cycle_time_total", "cycle_time_count"
+        )
+
+        for row in rows:
+            week = per_week.get(row["day"] - timedelta(days=row["day"].weekday()))
+            if week is None:
+                continue
+            week["created"] += row["created"]
+            week["started"] += row["started"]
+            week["completed"] += row["completed"]
+            week["lead"] += row["lead_time_total"]
+            week["cycle"] += row["cycle_time_total"]
+            week["cycle_count"] += row["cycle_time_count"]
+
+        day_seconds = 86400
+
+        return [
+            {
+                "week_start": week_start,
+                "created": week["created"],
+                "started": week["started"],
+                "completed": week["completed"],
+                "avg_lead_time_days": (
+                    round(week["lead"] / week["completed"] / day_seconds, 2)
+                    if week["completed"] else None
+                ),
+                "avg_cycle_time_days": (
+                    round(week["cycle"] / week["cycle_count"] / day_seconds, 2)
+                    if week["cycle_count"] else None
+                ),
+            }
+            for week_start, week in per_week.items()
+        ]
+
+    return singleflight.do("dashboard.throughput", (project_id, weeks), load)
+
+
+@router.get("/workload")
+def get_workload(
+    refresh: bool = False,
+    current_user=Depends(get_current_user)
+):
+    """
+    Open tickets per assignee and priority across every project the
+    current user administers, as a heatmap matrix:
+    matrix[assignee][priority], with the same split per status.
+    Computed in one grouped query and cached briefly per user;
+    pass refresh=true to recompute.
+    """
+    key = f"dashboard:workload:{current_user.id}"
+    if not refresh:
+        result = cache.get(key)
+        if result is not None:
+            return result
+
+    def load():
+        admin_projects = ProjectMember.objects.filter(
+            user=current_user,
+            role="ADMIN"
+        ).values("project_id")
+
+        rows = (
+            Ticket.objects
+            .filter(project_id__in=admin_projects)
+            .exclude(status="DONE")
+            .values("assigned_to", "assigned_to__name", "assigned_to__email", "priority", "status")
+            .annotate(count=Count("id"))
+            .order_by()
+        )
+
+        priorities = [priority for priority, _ in Ticket.PRIORITY]
+        statuses = [status for status, _ in Ticket.STATUS if status != "DONE"]
+        priority_index = {priority: i for i, priority in enumerate(priorities)}
+
+        assignees = {}
+        matrix = {}
+        by_status = {status: {} for status in statuses}
+
+        for row in rows:
+            # Values outside the model choices have no cell; leave them out
+            column = priority_index.get(row["priority"])
+            if column is None or row["status"] not in by_status:
+                continue
+
+            user_id = row["assigned_to"]
+            if user_id not in assignees:
+                assignees[user_id] = {
+                    "id": user_id,
+                    "name": row["assigned_to__name"],
+                    "email": row["assigned_to__email"],
+                }
+                matrix[user_id] = [0] * len(priorities)
+                for status in statuses:
+                    by_status[status][user_id] = [0] * len(priorities)
+
+            matrix[user_id][column] += row["count"]
+            by_status[row["status"]][user_id][column] += row["count"]
+
+        # Busiest first, unassigned last
+        order = sorted(assignees, key=lambda user_id: (user_id is None, -sum(matrix[user_id])))
+
+        result = {
+            "priorities": priorities,
+            "statuses": statuses,
+            "assignees": [assignees[user_id] for user_id in order],
+            "matrix": [matrix[user_id] for user_id in order],
+            "by_status": {
+                status: [cells[user_id] for user_id in order]
+                for status, cells in by_status.items()
+            },
+        }
+        return result
+
+    result = singleflight.do("dashboard.workload", current_user.id, load)
+    cache.set(key, result, WORKLOAD_CACHE_TIMEOUT)
+    return result
@@ -0,0 +1,47 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List
+
+from api.core.dependencies import get_current_user
+from api.jobs.schemas import JobResponse
+from jobs.models import Job
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+
+def get_own_job(job_id: int, user) -> Job:
+    job = Job.objects.filter(id=job_id, created_by=user).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.get("/", response_model=List[JobResponse])
+def list_my_jobs(
+    status: str | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    current_user=Depends(get_current_user),
+):
+    jobs = Job.objects.filter(created_by=current_user)
+    if status:
+        jobs = jobs.filter(status=status)
+
+    return jobs[:limit]
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+def get_job(job_id: int, current_user=Depends(get_current_user)):
+    return get_own_job(job_id, current_user)
+
+
+@router.post("/{job_id}/cancel", response_model=JobResponse)
+def cancel_job(job_id: int, current_user=Depends(get_current_user)):
+    """
+    Cancel a job that has not started yet. Running jobs cannot be cancelled.
+    """
+    job = get_own_job(job_id, current_user)
+
+    if not Job.objects.filter(id=job.id, status="QUEUED").update(status="CANCELLED"):
+        raise HTTPException(status_code=409, detail=f"Job is {job.status.lower()}, not queued")
+
+    job.refresh_from_db()
+    return job
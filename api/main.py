@@ -1,45 +1,78 @@
 import os
-import django
-
-# Set the Django settings module
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "devtrack.settings")
-
-# Initialize Django
-django.setup()
+from contextlib import asynccontextmanager
 
+import anyio
 from fastapi import FastAPI
-from api.users.routes import router as auth_router
-from api.projects.routes import router as project_router
-from api.tickets.routes import router as ticket_router
-from api.dashboard.routes import router as dashboard_router
-from api.comments.routes import router as comment_router
 from fastapi.middleware.cors import CORSMiddleware
 
+from api.core.db_routing import ReplicaRoutingMiddleware
+from api.core.django_setup import setup_django
+
 origins = [
-    "http://localhost:5173",  # Vite React dev server
+    "https://devtrack-bug-issue-tracking-system-react.onrender.com",  # Production frontend
+    "http://localhost:5173",   # Vite frontend (local)
+    "http://127.0.0.1:5173",   # Vite frontend (local)
 ]
 
-app = FastAPI(title="DevTrack API")
 
-app = FastAPI(title="DevTrack API")
+def register_routers(app: FastAPI):
+    """
+    Import and mount the API routers. Route modules import Django models,
+    so this must run after setup_django(). Safe to call more than once.
+    """
+    if getattr(app.state, "routers_registered", False):
+        return
+
+    from api.users.routes import router as auth_router
+    from api.projects.routes import router as project_router
+    from api.tickets.routes import router as ticket_router
+    from api.dashboard.routes import router as dashboard_router
+    from api.comments.routes import router as comment_router
+    from api.jobs.routes import router as job_router
+    from api.notifications.routes import router as notification_router
+    from api.attachments.routes import router as attachment_router
+    from api.sprints.routes import router as sprint_router
+    from api.metrics.routes import router as metrics_router
+
+    app.include_router(auth_router)
+    app.include_router(project_router)
+    app.include_router(ticket_router)
+    app.include_router(dashboard_router)
+    app.include_router(comment_router)
+    app.include_router(job_router)
+    app.include_router(notification_router)
+    app.include_router(attachment_router)
+    app.include_router(sprint_router)
+    app.include_router(metrics_router)
+
+    app.state.routers_registered = True
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    setup_django()
+    register_routers(app)
+
+    # Sync endpoints run in this threadpool; sized by api.server
+    threadpool_size = os.environ.get("API_THREADPOOL_SIZE")
+    if threadpool_size:
+        anyio.to_thread.current_default_thread_limiter().total_tokens = int(threadpool_size)
+
+    yield
+
+
+app = FastAPI(title="DevTrack API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "https://devtrack-bug-issue-tracking-system-react.onrender.com",  # Production frontend
-        "http://localhost:5173",   # Vite frontend (local)
-        "http://127.0.0.1:5173",   # Vite frontend (local)
-    ],
+    allow_origins=origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-app.include_router(auth_router)
-app.include_router(project_router)
-app.include_router(ticket_router)
-app.include_router(dashboard_router)
-app.include_router(comment_router)
+app.add_middleware(ReplicaRoutingMiddleware)
+
 
 @app.get("/")
 def health():
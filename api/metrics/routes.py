@@ -0,0 +1,15 @@
+from fastapi import APIRouter, Depends, HTTPException
+
+from api.core.dependencies import get_current_user
+from api.core.singleflight import singleflight
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get("/coalescing")
+def coalescing_metrics(current_user=Depends(get_current_user)):
+    """Single-flight counters per route: executed, shared, timeouts and ratio. Staff only."""
+    if not current_user.is_staff:
+        raise HTTPException(status_code=403, detail="Staff only")
+
+    return singleflight.metrics()
@@ -0,0 +1,64 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List
+
+from api.core.dependencies import get_current_user
+from api.notifications.schemas import MarkRead, NotificationResponse, UnreadCountResponse
+from notifications.fanout import mark_read, unread_count
+from notifications.models import Notification
+
+router = APIRouter(prefix="/notifications", tags=["Notifications"])
+
+
+@router.get("/", response_model=List[NotificationResponse])
+def list_notifications(
+    unread_only: bool = False,
+    before_id: int | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    current_user=Depends(get_current_user),
+):
+    """
+    Newest first. Pass the last id of a page as before_id for the next one.
+    """
+    qs = (
+        Notification.objects
+        .filter(user=current_user)
+        .select_related("ticket", "actor")
+        .order_by("-id")
+    )
+
+    if unread_only:
+        qs = qs.filter(read_at__isnull=True)
+
+    if before_id is not None:
+        qs = qs.filter(id__lt=before_id)
+
+    return [
+        {
+            "id": n.id,
+            "verb": n.verb,
+            "ticket_id": n.ticket_id,
+            "ticket_title": n.ticket.title,
+            "project_id": n.ticket.project_id,
+            "actor_email": n.actor.email if n.actor else None,
+            "created_at": n.created_at,
+            "read": n.read_at is not None,
+        }
+        for n in qs[:limit]
+    ]
+
+
+@router.get("/unread-count", response_model=UnreadCountResponse)
+def get_unread_count(current_user=Depends(get_current_user)):
+    return {"unread": unread_count(current_user)}
+
+
+@router.post("/read", response_model=UnreadCountResponse)
+def mark_notifications_read(
+    data: MarkRead,
+    current_user=Depends(get_current_user),
+):
+    if not data.all and not data.ids:
+        raise HTTPException(status_code=400, detail="Provide ids or all=true.")
+
+    mark_read(current_user, None if data.all else data.ids)
+    return {"unread": unread_count(current_user)}
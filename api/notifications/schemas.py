@@ -0,0 +1,23 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import datetime
+
+
+class NotificationResponse(BaseModel):
+    id: int
+    verb: str
+    ticket_id: int
+    ticket_title: str
+    project_id: int
+    actor_email: Optional[str] = None
+    created_at: datetime
+    read: bool
+
+
+class MarkRead(BaseModel):
+    ids: Optional[List[int]] = Field(default=None, max_length=1000)
+    all: bool = False
+
+
+class UnreadCountResponse(BaseModel):
+    unread: int
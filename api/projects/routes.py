@@ -1,5 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from django.contrib.auth import get_user_model
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Window
+from django.db.models.functions import Coalesce, RowNumber
+from django.utils import timezone
 
 from api.core.dependencies import get_current_user
 from api.projects.schemas import (
@@ -8,8 +11,20 @@ from api.projects.schemas import (
     ProjectUpdate,
     ProjectMemberResponse,
     AddProjectMember,
+    BulkAddProjectMembers,
+    BulkAddProjectMembersResponse,
+    ProjectSummaryPage,
+    ProjectMemberPage,
+    ProjectBoard,
+    ProjectChanges,
 )
-from projects.models import Project, ProjectMember
+from api.tickets.routes import ticket_to_response
+from comments.models import Comments
+from projects.changes import record_change
+from projects.members import bulk_add_members
+from projects.models import Project, ProjectChange, ProjectMember
+from jobs.queue import enqueue
+from tickets.models import Ticket
 
 User = get_user_model()
 
@@ -48,10 +63,72 @@ def create_project(data: ProjectCreate, current_user=Depends(get_current_user)):
         project=project,
         role="ADMIN",
     )
+    record_change(project.id, ProjectChange.MEMBER, current_user.id)
 
     return project
 
 
+def count_per_project(queryset):
+    """Correlated COUNT(*) of queryset rows for the outer row's project."""
+    return Coalesce(
+        Subquery(
+            queryset.filter(project_id=OuterRef("project_id"))
+            .order_by()
+            .values("project_id")
+            .annotate(count=Count("id"))
+            .values("count"),
+            output_field=IntegerField(),
+        ),
+        0,
+    )
+
+
+# -------------------------
+# Project Overview (paginated, with counts)
+# -------------------------
+@router.get("/overview", response_model=ProjectSummaryPage)
+def list_my_projects_overview(
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    current_user=Depends(get_current_user)
+):
+    """
+    The current user's projects with ticket and member counts, so the
+    sidebar renders from one request. Counts are correlated subqueries
+    on the page query.
+    """
+    memberships = ProjectMember.objects.filter(user=current_user)
+
+    page = (
+        memberships
+        .select_related("project")
+        .annotate(
+            ticket_count=count_per_project(Ticket.objects.all()),
+            open_ticket_count=count_per_project(Ticket.objects.exclude(status="DONE")),
+            member_count=count_per_project(ProjectMember.all_objects.all()),
+        )
+        .order_by("project__name", "project_id")[offset:offset + limit]
+    )
+
+    return {
+        "total": memberships.count(),
+        "limit": limit,
+        "offset": offset,
+        "results": [
+            {
+                "project_id": m.project.id,
+                "name": m.project.name,
+                "description": m.project.description,
+                "role": m.role,
+                "ticket_count": m.ticket_count,
+                "open_ticket_count": m.open_ticket_count,
+                "member_count": m.member_count,
+            }
+            for m in page
+        ],
+    }
+
+
 @router.get("/{project_id}")
 def get_project(project_id: int, current_user=Depends(get_current_user)):
     if not ProjectMember.objects.filter(
@@ -68,6 +145,193 @@ def get_project(project_id: int, current_user=Depends(get_current_user)):
     }
 
 
+# -------------------------
+# Board (project, members and tickets in one request)
+# -------------------------
+@router.get("/{project_id}/board", response_model=ProjectBoard)
+def get_project_board(
+    project_id: int,
+    per_column: int = Query(200, ge=1, le=1000),
+    current_user=Depends(get_current_user)
+):
+    """
+    Everything needed to open a board in five queries: membership and
+    project, members, the first per_column tickets of each status
+    column in board order, their labels, and the per-column totals.
+    """
+    membership = ProjectMember.objects.select_related("project").filter(
+        user=current_user,
+        project_id=project_id
+    ).first()
+
+    if not membership:
+        raise HTTPException(403, "Access denied")
+
+    project = membership.project
+
+    members = ProjectMember.objects.select_related("user").filter(
+        project_id=project_id
+    ).order_by("user__email")
+
+    tickets = (
+        Ticket.objects
+        .filter(project_id=project_id)
+        .select_related("assigned_to")
+        .prefetch_related("labels")
+        .annotate(position=Window(
+            RowNumber(),
+            partition_by=F("status"),
+            order_by=[F("order").asc(), F("id").asc()],
+        ))
+        .filter(position__lte=per_column)
+        .order_by("status", "order", "id")
+    )
+
+    counts = dict(
+        Ticket.objects.filter(project_id=project_id)
+        .values("status")
+        .annotate(count=Count("id"))
+        .order_by()
+        .values_list("status", "count")
+    )
+
+    columns = {
+        status: {"status": status, "count": counts.get(status, 0), "tickets": []}
+        for status, _ in Ticket.STATUS
+    }
+    for ticket in tickets:
+        columns[ticket.status]["tickets"].append(ticket_to_response(ticket))
+
+    return {
+        "seq": project.change_seq,
+        "project": {
+            "id": project.id,
+            "name": project.name,
+            "description": project.description,
+            "owner_id": project.owner_id,
+        },
+        "me": {
+            "id": current_user.id,
+            "email": current_user.email,
+            "name": current_user.name,
+            "role": membership.role,
+        },
+        "members": [
+            {
+                "user_id": m.user.id,
+                "email": m.user.email,
+                "name": m.user.name,
+                "role": m.role,
+            }
+            for m in members
+        ],
+        "columns": list(columns.values()),
+    }
+
+
+# -------------------------
+# Delta sync
+# -------------------------
+@router.get("/{project_id}/changes", response_model=ProjectChanges)
+def get_project_changes(
+    project_id: int,
+    since: int = Query(0, ge=0),
+    limit: int = Query(500, ge=1, le=1000),
+    current_user=Depends(get_current_user)
+):
+    """
+    Tickets, comments and members written after seq `since`, in their
+    current state, plus the ids deleted since then. Pass the returned
+    seq back as `since`; keep going while has_more is true. Rows that
+    no longer exist (e.g. comments of a deleted ticket) are reported
+    as deleted.
+    """
+    if not ProjectMember.objects.filter(
+        user=current_user,
+        project_id=project_id
+    ).exists():
+        raise HTTPException(403, "Access denied")
+
+    entries = list(
+        ProjectChange.objects
+        .filter(project_id=project_id, seq__gt=since)
+        .order_by("seq")
+        .values_list("seq", "kind", "object_id", "deleted")[:limit + 1]
+    )
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+
+    # Latest entry per object wins
+    latest = {}
+    for _, kind, object_id, deleted in entries:
+        latest[(kind, object_id)] = deleted
+
+    def changed(kind):
+        return [
+            object_id for (entry_kind, object_id), deleted in latest.items()
+            if entry_kind == kind and not deleted
+        ]
+
+    tickets = list(
+        Ticket.objects
+        .filter(project_id=project_id, id__in=changed(ProjectChange.TICKET))
+        .select_related("assigned_to")
+        .prefetch_related("labels")
+    )
+    comments = list(
+        Comments.objects
+        .filter(ticket__project_id=project_id, id__in=changed(ProjectChange.COMMENT))
+        .select_related("user")
+    )
+    members = list(
+        ProjectMember.objects
+        .filter(project_id=project_id, user_id__in=changed(ProjectChange.MEMBER))
+        .select_related("user")
+    )
+
+    present = {
+        (ProjectChange.TICKET, ticket.id) for ticket in tickets
+    } | {
+        (ProjectChange.COMMENT, comment.id) for comment in comments
+    } | {
+        (ProjectChange.MEMBER, member.user_id) for member in members
+    }
+
+    deleted = {"tickets": [], "comments": [], "members": []}
+    for (kind, object_id) in latest:
+        if (kind, object_id) not in present:
+            deleted[kind + "s"].append(object_id)
+
+    return {
+        "since": since,
+        "seq": entries[-1][0] if entries else since,
+        "has_more": has_more,
+        "tickets": [ticket_to_response(ticket) for ticket in tickets],
+        "comments": [
+            {
+                "id": comment.id,
+                "comment": comment.comment,
+                "user_id": comment.user_id,
+                "ticket_id": comment.ticket_id,
+                "created_at": comment.created_at,
+                "username": comment.user.name,
+                "user_email": comment.user.email
+            }
+            for comment in comments
+        ],
+        "members": [
+            {
+                "user_id": m.user.id,
+                "email": m.user.email,
+                "name": m.user.name,
+                "role": m.role,
+            }
+            for m in members
+        ],
+        "deleted": deleted,
+    }
+
+
 # -------------------------
 # Add Project Member (EMAIL based)
 # -------------------------
@@ -103,10 +367,36 @@ def add_project_member(
         user=user,
         role=data.role,
     )
+    record_change(project_id, ProjectChange.MEMBER, user.id)
 
     return member
 
 
+# -------------------------
+# Bulk Add Project Members
+# -------------------------
+@router.post(
+    "/{project_id}/member/bulk",
+    response_model=BulkAddProjectMembersResponse,
+)
+def bulk_add_project_members(
+    project_id: int,
+    data: BulkAddProjectMembers,
+    current_user=Depends(get_current_user),
+):
+    require_admin(project_id, current_user)
+
+    results = bulk_add_members(
+        project_id,
+        [(member.email, member.role) for member in data.members]
+    )
+
+    return {
+        "added": sum(result["status"] == "added" for result in results),
+        "results": results,
+    }
+
+
 # -------------------------
 # List Project Members
 # -------------------------
@@ -135,6 +425,37 @@ def list_project_members(
     ]
 
 
+@router.get("/{project_id}/member/page", response_model=ProjectMemberPage)
+def list_project_members_page(
+    project_id: int,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    current_user=Depends(get_current_user)
+):
+    if not ProjectMember.objects.filter(
+        user=current_user,
+        project_id=project_id
+    ).exists():
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    members = ProjectMember.objects.filter(project_id=project_id)
+    page = members.select_related("user").order_by("user__email")[offset:offset + limit]
+
+    return {
+        "total": members.count(),
+        "limit": limit,
+        "offset": offset,
+        "results": [
+            {
+                "user_id": m.user.id,
+                "email": m.user.email,
+                "name": m.user.name,
+                "role": m.role,
+            }
+            for m in page
+        ],
+    }
+
 
 # -------------------------
 # List My Projects
@@ -170,17 +491,19 @@ def update_project(
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    for field, value in data.model_dump(exclude_unset=True).items():
+    updates = data.model_dump(exclude_unset=True)
+    for field, value in updates.items():
         setattr(project, field, value)
 
-    project.save()
+    # Limited to the edited columns so change_seq is never written back stale
+    project.save(update_fields=list(updates))
     return project
 
 
 # -------------------------
-# Delete Project (Hard delete)
+# Delete Project (Soft delete + background purge job)
 # -------------------------
-@router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete("/{project_id}", status_code=status.HTTP_202_ACCEPTED)
 def delete_project(
     project_id: int,
     current_user=Depends(get_current_user),
@@ -200,9 +523,56 @@ def delete_project(
             detail="Only ADMIN can delete projects"
         )
 
-    project = Project.objects.filter(id=project_id).first()
-    if not project:
+    # Hidden immediately; tickets and comments are removed in batches afterwards
+    if not Project.objects.filter(id=project_id).update(deleted_at=timezone.now()):
         raise HTTPException(status_code=404, detail="Project not found")
 
-    project.delete()
-    return
+    job = enqueue("projects.purge", {"project_id": project_id}, user=current_user)
+    return {"job_id": job.id}
+
+
+def require_deleted_project_admin(project_id: int, user) -> Project:
+    project = Project.all_objects.filter(
+        id=project_id,
+        deleted_at__isnull=False
+    ).first()
+    if not project:
+        raise HTTPException(status_code=404, detail="Deleted project not found")
+
+    if not ProjectMember.all_objects.filter(
+        project_id=project_id,
+        user=user,
+        role="ADMIN"
+    ).exists():
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+    return project
+
+
+# -------------------------
+# Purge progress / Restore (cancels the purge)
+# -------------------------
+@router.get("/{project_id}/purge")
+def get_purge_status(
+    project_id: int,
+    current_user=Depends(get_current_user),
+):
+    project = require_deleted_project_admin(project_id, current_user)
+
+    return {
+        "project_id": project.id,
+        "deleted_at": project.deleted_at,
+        "remaining_tickets": Ticket.objects.filter(project_id=project_id).count(),
+    }
+
+
+@router.post("/{project_id}/restore", response_model=ProjectResponse)
+def restore_project(
+    project_id: int,
+    current_user=Depends(get_current_user),
+):
+    project = require_deleted_project_admin(project_id, current_user)
+
+    project.deleted_at = None
+    project.save(update_fields=["deleted_at"])
+    return project
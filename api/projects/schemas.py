@@ -1,5 +1,7 @@
-from pydantic import BaseModel
-from typing import Optional, Literal
+from pydantic import BaseModel, Field
+from typing import List, Optional, Literal
+from api.comments.schemas import CommentResponse
+from api.tickets.schemas import TicketResponse
 
 class ProjectCreate(BaseModel):
     name: str
@@ -28,4 +30,85 @@ class ProjectMemberResponse(BaseModel):
     role: str
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class BulkAddProjectMembers(BaseModel):
+    members: List[AddProjectMember] = Field(min_length=1, max_length=1000)
+
+class BulkMemberResult(BaseModel):
+    email: str
+    status: Literal["added", "already_member", "user_not_found", "invalid_role", "duplicate"]
+    user_id: Optional[int] = None
+
+class BulkAddProjectMembersResponse(BaseModel):
+    added: int
+    results: List[BulkMemberResult]
+
+
+class ProjectSummary(BaseModel):
+    project_id: int
+    name: str
+    description: str
+    role: str
+    ticket_count: int
+    open_ticket_count: int
+    member_count: int
+
+class ProjectSummaryPage(BaseModel):
+    total: int
+    limit: int
+    offset: int
+    results: List[ProjectSummary]
+
+class ProjectMemberDetail(BaseModel):
+    user_id: int
+    email: str
+    name: str
+    role: str
+
+class ProjectMemberPage(BaseModel):
+    total: int
+    limit: int
+    offset: int
+    results: List[ProjectMemberDetail]
+
+
+class BoardProject(BaseModel):
+    id: int
+    name: str
+    description: str
+    owner_id: int
+
+class BoardUser(BaseModel):
+    id: int
+    email: str
+    name: str
+    role: str
+
+class BoardColumn(BaseModel):
+    status: str
+    count: int
+    tickets: List[TicketResponse]
+
+class ProjectBoard(BaseModel):
+    # Pass as `since` to /projects/{id}/changes to keep the board current
+    seq: int
+    project: BoardProject
+    me: BoardUser
+    members: List[ProjectMemberDetail]
+    columns: List[BoardColumn]
+
+
+class DeletedObjects(BaseModel):
+    tickets: List[int] = []
+    comments: List[int] = []
+    members: List[int] = []
+
+class ProjectChanges(BaseModel):
+    since: int
+    seq: int
+    has_more: bool
+    tickets: List[TicketResponse]
+    comments: List[CommentResponse]
+    members: List[ProjectMemberDetail]
+    deleted: DeletedObjects
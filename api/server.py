@@ -0,0 +1,134 @@
+"""
+Production launcher: runs the API under gunicorn with uvicorn workers.
+
+    python -m api.server                  # FastAPI only (api.main:app)
+    python -m api.server --combined       # FastAPI + Django admin
+    python -m api.server --print-config   # show the sizing plan and exit
+
+Worker count, threadpool size and DB pool size are derived together
+from the CPU count and the database connection budget, so that
+workers x threads never exceeds what the database will accept.
+Every value can be overridden through the environment or CLI flags.
+"""
+import argparse
+import json
+import os
+
+API_APP = "api.main:app"
+COMBINED_APP = "devtrack.combined_asgi:application"
+
+# Threads per worker below this are not worth a separate process
+MIN_THREADS_PER_WORKER = 4
+# anyio's default threadpool size
+MAX_THREADS_PER_WORKER = 40
+# Share of DB_MAX_CONNECTIONS left for migrations, admin, psql, etc.
+DB_RESERVED_FRACTION = 0.1
+
+
+def env_int(name: str, default: int | None = None) -> int | None:
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+def build_plan(
+    cpu_count: int | None = None,
+    workers: int | None = None,
+    threads: int | None = None,
+    db_max_connections: int | None = None,
+) -> dict:
+    """
+    Size workers, threads and DB pool coherently.
+
+    Sync endpoints run in each worker's threadpool and every thread
+    holds at most one DB connection, so the pool per worker equals the
+    threadpool size and the total is workers x threads.
+    """
+    cpu_count = cpu_count or os.cpu_count() or 1
+    db_max_connections = db_max_connections or env_int("DB_MAX_CONNECTIONS", 100)
+    db_budget = max(1, int(db_max_connections * (1 - DB_RESERVED_FRACTION)))
+
+    workers = workers or env_int("WEB_CONCURRENCY") or cpu_count * 2 + 1
+    workers = max(1, min(workers, db_budget // MIN_THREADS_PER_WORKER or 1))
+
+    threads = threads or env_int("API_THREADPOOL_SIZE")
+    if not threads:
+        threads = min(MAX_THREADS_PER_WORKER, db_budget // workers)
+    threads = max(1, threads)
+
+    max_requests = env_int("GUNICORN_MAX_REQUESTS", 1000)
+
+    return {
+        "cpu_count": cpu_count,
+        "workers": workers,
+        "threads_per_worker": threads,
+        "db_pool_per_worker": threads,
+        "db_connections_total": workers * threads,
+        "db_max_connections": db_max_connections,
+        "bind": f"0.0.0.0:{env_int('PORT', 8000)}",
+        "keepalive": env_int("GUNICORN_KEEPALIVE", 5),
+        "timeout": env_int("GUNICORN_TIMEOUT", 30),
+        "graceful_timeout": env_int("GUNICORN_GRACEFUL_TIMEOUT", 30),
+        "max_requests": max_requests,
+        "max_requests_jitter": max_requests // 10,
+    }
+
+
+def gunicorn_options(plan: dict) -> dict:
+    return {
+        "bind": plan["bind"],
+        "workers": plan["workers"],
+        "worker_class": "uvicorn.workers.UvicornWorker",
+        "keepalive": plan["keepalive"],
+        "timeout": plan["timeout"],
+        "graceful_timeout": plan["graceful_timeout"],
+        "max_requests": plan["max_requests"],
+        "max_requests_jitter": plan["max_requests_jitter"],
+        "accesslog": "-",
+        "errorlog": "-",
+    }
+
+
+def run(app_path: str, plan: dict):
+    from gunicorn.app.base import BaseApplication
+
+    # Read by the workers: api.main lifespan and devtrack.settings
+    os.environ["API_THREADPOOL_SIZE"] = str(plan["threads_per_worker"])
+    os.environ["DB_POOL_MAX_SIZE"] = str(plan["db_pool_per_worker"])
+
+    class DevTrackServer(BaseApplication):
+        def load_config(self):
+            for key, value in gunicorn_options(plan).items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return app_path
+
+    DevTrackServer().run()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the DevTrack API under gunicorn.")
+    parser.add_argument("--combined", action="store_true",
+                        help="Also serve the Django admin from the same workers.")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--threads", type=int, help="Threadpool size per worker.")
+    parser.add_argument("--db-max-connections", type=int)
+    parser.add_argument("--print-config", action="store_true")
+    args = parser.parse_args()
+
+    plan = build_plan(
+        workers=args.workers,
+        threads=args.threads,
+        db_max_connections=args.db_max_connections,
+    )
+    app_path = COMBINED_APP if args.combined else API_APP
+
+    if args.print_config:
+        print(json.dumps({"app": app_path, **plan}, indent=2))
+        return
+
+    run(app_path, plan)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import List
+
+from django.db import transaction
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+from api.core.dependencies import get_current_user
+from api.sprints.schemas import (
+    SprintBoard,
+    SprintClose,
+    SprintCloseResponse,
+    SprintCreate,
+    SprintProgress,
+    SprintResponse,
+    SprintTicketsResult,
+    SprintTicketsUpdate,
+    SprintUpdate,
+)
+from api.tickets.routes import ticket_to_response
+from projects.changes import record_changes
+from projects.models import ProjectChange, ProjectMember
+from sprints.counters import SprintError, close_sprint, move_tickets, progress, start_sprint
+from sprints.models import Sprint
+from tickets.models import Ticket
+
+
+router = APIRouter(prefix="/sprints", tags=["Sprints"])
+
+
+# -------------------------
+# Helpers
+# -------------------------
+def sprint_to_response(sprint: Sprint) -> dict:
+    return {
+        "id": sprint.id,
+        "project_id": sprint.project_id,
+        "name": sprint.name,
+        "goal": sprint.goal,
+        "start_date": sprint.start_date,
+        "end_date": sprint.end_date,
+        "state": sprint.state,
+        "started_at": sprint.started_at,
+        "closed_at": sprint.closed_at,
+        "progress": progress(sprint),
+    }
+
+
+def member_role(user, project_id: int):
+    return ProjectMember.objects.filter(
+        user=user,
+        project_id=project_id
+    ).values_list("role", flat=True).first()
+
+
+def require_sprint(sprint_id: int, user, roles=None) -> Sprint:
+    sprint = Sprint.objects.filter(id=sprint_id).first()
+    if not sprint:
+        raise HTTPException(404, "Sprint not found")
+
+    role = member_role(user, sprint.project_id)
+    if role is None:
+        raise HTTPException(403, "Access denied")
+    if roles and role not in roles:
+        raise HTTPException(403, "You do not have permission to manage this sprint")
+
+    return sprint
+
+
+# -------------------------
+# Sprints
+# -------------------------
+@router.get("/project/{project_id}", response_model=List[SprintResponse])
+def list_sprints(
+    project_id: int,
+    current_user=Depends(get_current_user)
+):
+    if member_role(current_user, project_id) is None:
+        raise HTTPException(403, "Access denied")
+
+    return [
+        sprint_to_response(sprint)
+        for sprint in Sprint.objects.filter(project_id=project_id)
+    ]
+
+
+@router.post("/project/{project_id}", response_model=SprintResponse, status_code=status.HTTP_201_CREATED)
+def create_sprint(
+    project_id: int,
+    data: SprintCreate,
+    current_user=Depends(get_current_user)
+):
+    if member_role(current_user, project_id) != "ADMIN":
+        raise HTTPException(403, "Only project admins can create sprints")
+
+    sprint = Sprint.objects.create(project_id=project_id, **data.model_dump())
+    return sprint_to_response(sprint)
+
+
+@router.get("/{sprint_id}", response_model=SprintResponse)
+def get_sprint(
+    sprint_id: int,
+    current_user=Depends(get_current_user)
+):
+    return sprint_to_response(require_sprint(sprint_id, current_user))
+
+
+@router.patch("/{sprint_id}", response_model=SprintResponse)
+def update_sprint(
+    sprint_id: int,
+    data: SprintUpdate,
+    current_user=Depends(get_current_user)
+):
+    sprint = require_sprint(sprint_id, current_user, roles=("ADMIN",))
+
+    changes = data.model_dump(exclude_unset=True)
+
+    start_date = changes.get("start_date", sprint.start_date)
+    end_date = changes.get("end_date", sprint.end_date)
+    if end_date < start_date:
+        raise HTTPException(400, "end_date must not be before start_date")
+
+    for field, value in changes.items():
+        setattr(sprint, field, value)
+
+    if changes:
+        sprint.save(update_fields=list(changes))
+    return sprint_to_response(sprint)
+
+
+@router.delete("/{sprint_id}", status_code=204)
+def delete_sprint(
+    sprint_id: int,
+    current_user=Depends(get_current_user)
+):
+    """Only planned sprints can be deleted; their tickets go back to the backlog."""
+    sprint = require_sprint(sprint_id, current_user, roles=("ADMIN",))
+
+    if sprint.state != Sprint.PLANNED:
+        raise HTTPException(400, "Only a planned sprint can be deleted.")
+
+    with transaction.atomic():
+        moved = move_tickets(
+            Ticket.objects.filter(sprint_id=sprint.id).values_list("id", flat=True),
+            None
+        )
+        sprint.delete()
+        record_changes(ProjectChange.TICKET, [(sprint.project_id, ticket_id) for ticket_id in moved])
+    return
+
+
+@router.post("/{sprint_id}/start", response_model=SprintResponse)
+def start(
+    sprint_id: int,
+    current_user=Depends(get_current_user)
+):
+    """Activate the sprint and snapshot its scope for scope-change metrics."""
+    require_sprint(sprint_id, current_user, roles=("ADMIN",))
+
+    try:
+        sprint = start_sprint(sprint_id)
+    except SprintError as exc:
+        raise HTTPException(409, str(exc))
+
+    return sprint_to_response(sprint)
+
+
+@router.post("/{sprint_id}/close", response_model=SprintCloseResponse)
+def close(
+    sprint_id: int,
+    data: SprintClose,
+    current_user=Depends(get_current_user)
+):
+    """Close the sprint; unfinished tickets move to `move_open_to` or the backlog."""
+    require_sprint(sprint_id, current_user, roles=("ADMIN",))
+
+    try:
+        sprint, moved = close_sprint(sprint_id, data.move_open_to)
+    except SprintError as exc:
+        raise HTTPException(409, str(exc))
+
+    record_changes(ProjectChange.TICKET, [(sprint.project_id, ticket_id) for ticket_id in moved])
+    return {"sprint": sprint_to_response(sprint), "moved": moved}
+
+
+# -------------------------
+# Scope
+# -------------------------
+@router.post("/{sprint_id}/tickets", response_model=SprintTicketsResult)
+def update_sprint_tickets(
+    sprint_id: int,
+    data: SprintTicketsUpdate,
+    current_user=Depends(get_current_user)
+):
+    """Add tickets to the sprint or move them back to the backlog."""
+    sprint = require_sprint(sprint_id, current_user, roles=("ADMIN", "DEV"))
+
+    if sprint.state == Sprint.CLOSED:
+        raise HTTPException(400, "Tickets cannot be added to a closed sprint.")
+
+    add = set(data.add)
+    if Ticket.objects.filter(id__in=add, project_id=sprint.project_id).count() != len(add):
+        raise HTTPException(400, "Tickets must exist and belong to the sprint's project.")
+
+    with transaction.atomic():
+        added = move_tickets(add, sprint.id)
+        removed = move_tickets(
+            Ticket.objects.filter(id__in=set(data.remove) - add, sprint_id=sprint.id).values_list("id", flat=True),
+            None
+        )
+        record_changes(
+            ProjectChange.TICKET,
+            [(sprint.project_id, ticket_id) for ticket_id in added + removed]
+        )
+
+    sprint.refresh_from_db()
+    return {"added": added, "removed": removed, "progress": progress(sprint)}
+
+
+# -------------------------
+# Board / progress
+# -------------------------
+@router.get("/{sprint_id}/progress", response_model=SprintProgress)
+def get_sprint_progress(
+    sprint_id: int,
+    current_user=Depends(get_current_user)
+):
+    """Remaining work, completion percentage and scope change, read from the sprint's counters."""
+    return progress(require_sprint(sprint_id, current_user))
+
+
+@router.get("/{sprint_id}/board", response_model=SprintBoard)
+def get_sprint_board(
+    sprint_id: int,
+    per_column: int = Query(200, ge=1, le=1000),
+    current_user=Depends(get_current_user)
+):
+    """
+    The sprint's tickets by status column in board order, capped at
+    per_column each; column totals come from the sprint counters.
+    """
+    sprint = require_sprint(sprint_id, current_user)
+
+    tickets = (
+        Ticket.objects
+        .filter(sprint_id=sprint.id)
+        .select_related("assigned_to")
+        .prefetch_related("labels")
+        .annotate(position=Window(
+            RowNumber(),
+            partition_by=F("status"),
+            order_by=[F("order").asc(), F("id").asc()],
+        ))
+        .filter(position__lte=per_column)
+        .order_by("status", "order", "id")
+    )
+
+    totals = {
+        "TODO": sprint.todo_count,
+        "IN_PROGRESS": sprint.in_progress_count,
+        "DONE": sprint.done_count,
+    }
+    columns = {
+        status: {"status": status, "count": totals[status], "tickets": []}
+        for status, _ in Ticket.STATUS
+    }
+    for ticket in tickets:
+        if ticket.status in columns:
+            columns[ticket.status]["tickets"].append(ticket_to_response(ticket))
+
+    return {"sprint": sprint_to_response(sprint), "columns": list(columns.values())}
@@ -0,0 +1,85 @@
+from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import List, Literal, Optional
+from datetime import date, datetime
+
+from api.projects.schemas import BoardColumn
+
+
+class SprintCreate(BaseModel):
+    name: str = Field(..., min_length=1, max_length=100)
+    goal: str = ""
+    start_date: date
+    end_date: date
+
+    @model_validator(mode="after")
+    def check_dates(self):
+        if self.end_date < self.start_date:
+            raise ValueError("end_date must not be before start_date")
+        return self
+
+
+class SprintUpdate(BaseModel):
+    name: Optional[str] = Field(None, min_length=1, max_length=100)
+    goal: Optional[str] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+
+    # Fields may be omitted, but none of the columns accept null
+    @field_validator("name", "goal", "start_date", "end_date")
+    @classmethod
+    def not_null(cls, value, info):
+        if value is None:
+            raise ValueError(f"{info.field_name} cannot be null")
+        return value
+
+
+class SprintProgress(BaseModel):
+    total: int
+    done: int
+    remaining: int
+    completion_percent: float
+    committed: int
+    committed_done: int
+    added: int
+    removed: int
+    days_total: int
+    days_left: int
+
+
+class SprintResponse(BaseModel):
+    id: int
+    project_id: int
+    name: str
+    goal: str
+    start_date: date
+    end_date: date
+    state: Literal["PLANNED", "ACTIVE", "CLOSED"]
+    started_at: Optional[datetime] = None
+    closed_at: Optional[datetime] = None
+    progress: SprintProgress
+
+
+class SprintTicketsUpdate(BaseModel):
+    add: List[int] = Field(default_factory=list, max_length=1000)
+    remove: List[int] = Field(default_factory=list, max_length=1000)
+
+
+class SprintTicketsResult(BaseModel):
+    added: List[int]
+    removed: List[int]
+    progress: SprintProgress
+
+
+class SprintClose(BaseModel):
+    # Unfinished tickets go here; None moves them to the backlog
+    move_open_to: Optional[int] = None
+
+
+class SprintCloseResponse(BaseModel):
+    sprint: SprintResponse
+    moved: List[int]
+
+
+class SprintBoard(BaseModel):
+    sprint: SprintResponse
+    columns: List[BoardColumn]
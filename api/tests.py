@@ -0,0 +1,186 @@
+import asyncio
+import threading
+import time
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import router
+from django.test import SimpleTestCase, TestCase, override_settings
+from fastapi import HTTPException
+
+from api.core.db_routing import ReplicaRoutingMiddleware
+from api.core.security import create_access_token
+from api.core.singleflight import SingleFlight
+from api.metrics.routes import coalescing_metrics
+from devtrack.db_router import REPLICA_ALIAS, read_from_replica, replica_reads_enabled
+from tickets.models import Ticket
+from users.models import User
+
+
+class SingleFlightTests(SimpleTestCase):
+    def setUp(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.calls = 0
+
+    def run_concurrently(self, flight, fn, followers=3):
+        """Start a leader, wait until `followers` callers share its call, then let it finish."""
+        results = [None] * (followers + 1)
+
+        def call(index):
+            try:
+                results[index] = flight.do("route", "key", fn)
+            except Exception as exc:
+                results[index] = exc
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(followers + 1)]
+        threads[0].start()
+        self.assertTrue(self.started.wait(5))
+        for thread in threads[1:]:
+            thread.start()
+
+        deadline = time.monotonic() + 5
+        while flight.metrics()["routes"]["route"]["shared"] < followers:
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.001)
+
+        self.release.set()
+        for thread in threads:
+            thread.join(5)
+        return results
+
+    def slow(self, outcome):
+        def fn():
+            self.calls += 1
+            self.started.set()
+            self.release.wait(5)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        return fn
+
+    def test_followers_share_the_leaders_result(self):
+        flight = SingleFlight(timeout=5)
+
+        results = self.run_concurrently(flight, self.slow({"rows": 1}))
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(results, [{"rows": 1}] * 4)
+        self.assertEqual(
+            flight.metrics(),
+            {
+                "in_flight": 0,
+                "routes": {"route": {"executed": 1, "shared": 3, "timeouts": 0, "coalescing_ratio": 0.75}},
+            },
+        )
+
+    def test_errors_reach_every_waiter(self):
+        flight = SingleFlight(timeout=5)
+        error = ValueError("boom")
+
+        results = self.run_concurrently(flight, self.slow(error))
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(results, [error] * 4)
+
+    def test_waiter_runs_the_call_itself_after_the_timeout(self):
+        flight = SingleFlight(timeout=0.05)
+
+        def fn():
+            self.calls += 1
+            if self.calls == 1:
+                self.started.set()
+                self.release.wait(5)
+                return "leader"
+            return "own"
+
+        leader = threading.Thread(target=flight.do, args=("route", "key", fn))
+        leader.start()
+        self.assertTrue(self.started.wait(5))
+
+        self.assertEqual(flight.do("route", "key", fn), "own")
+        self.release.set()
+        leader.join(5)
+
+        counts = flight.metrics()["routes"]["route"]
+        self.assertEqual((counts["timeouts"], counts["coalescing_ratio"]), (1, 0.0))
+
+    def test_keys_are_released_after_completion(self):
+        flight = SingleFlight(timeout=5)
+
+        def fail():
+            raise ValueError("boom")
+
+        self.assertEqual(flight.do("route", "key", lambda: 1), 1)
+        self.assertEqual(flight.do("route", "key", lambda: 2), 2)
+        with self.assertRaises(ValueError):
+            flight.do("route", "key", fail)
+        self.assertEqual(flight.do("route", "key", lambda: 3), 3)
+
+        self.assertEqual(flight.metrics()["in_flight"], 0)
+        self.assertEqual(flight.metrics()["routes"]["route"]["executed"], 4)
+
+
+class CoalescingMetricsTests(TestCase):
+    def test_staff_only(self):
+        staff = User.objects.create_user("staff@example.com", "pw", name="Staff", is_staff=True)
+        member = User.objects.create_user("member@example.com", "pw", name="Member")
+
+        self.assertIn("routes", coalescing_metrics(current_user=staff))
+        with self.assertRaises(HTTPException) as ctx:
+            coalescing_metrics(current_user=member)
+
+        self.assertEqual(ctx.exception.status_code, 403)
+
+
+@override_settings(
+    DATABASE_ROUTERS=["devtrack.db_router.PrimaryReplicaRouter"],
+    READ_YOUR_WRITES_SECONDS=60,
+)
+class ReplicaRoutingTests(SimpleTestCase):
+    def setUp(self):
+        replica = {**settings.DATABASES["default"], "TEST": {"MIRROR": "default"}}
+        patcher = mock.patch.dict(settings.DATABASES, {REPLICA_ALIAS: replica})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        cache.clear()
+
+    def request(self, method, user_id=None, status=200):
+        """Run one request through the middleware; returns whether it read from the replica."""
+        seen = {}
+
+        async def app(scope, receive, send):
+            seen["replica"] = replica_reads_enabled()
+            await send({"type": "http.response.start", "status": status, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        async def send(message):
+            pass
+
+        headers = []
+        if user_id is not None:
+            token = create_access_token({"sub": str(user_id)})
+            headers.append((b"authorization", f"Bearer {token}".encode()))
+
+        scope = {"type": "http", "method": method, "headers": headers}
+        asyncio.run(ReplicaRoutingMiddleware(app)(scope, None, send))
+        return seen["replica"]
+
+    def test_reads_go_to_the_replica_and_writes_to_the_primary(self):
+        self.assertEqual(Ticket.objects.all().db, "default")
+
+        with read_from_replica():
+            self.assertEqual(Ticket.objects.all().db, REPLICA_ALIAS)
+            self.assertEqual(router.db_for_write(Ticket), "default")
+
+    def test_recent_writers_read_from_the_primary(self):
+        self.assertTrue(self.request("GET", user_id=1))
+
+        self.assertFalse(self.request("POST", user_id=1))
+        self.assertFalse(self.request("GET", user_id=1))
+
+        # Other users, and failed writes, keep reading from the replica
+        self.assertTrue(self.request("GET", user_id=2))
+        self.request("PATCH", user_id=3, status=409)
+        self.assertTrue(self.request("GET", user_id=3))
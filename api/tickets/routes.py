@@ -1,10 +1,54 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
-from django.db.models import Max, Q
+from fastapi import APIRouter, HTTPException, status, Depends, Header, Query, Response
+from typing import List, Literal
+from datetime import datetime
+from django.db import transaction
+from django.db.models import Count, F, Max, Q
+from django.utils import timezone
 from api.core.dependencies import get_current_user
-from api.tickets.schemas import TicketCreate, TicketResponse, TicketUpdate
-from tickets.models import Ticket
-from projects.models import ProjectMember
+from api.core.singleflight import singleflight
+from api.tickets.schemas import (
+    TicketCreate,
+    TicketResponse,
+    TicketUpdate,
+    TicketFilter,
+    TicketSearchResponse,
+    SavedFilterCreate,
+    SavedFilterResponse,
+    WatcherResponse,
+    WatchedTicketsPage,
+    TicketHistoryPage,
+    TicketStateAt,
+    TicketBulkFilter,
+    TicketBulkUpdate,
+    TicketBulkDelete,
+    TicketBulkResponse,
+    TicketLinkCreate,
+    TicketLinkResponse,
+    TicketDependencies,
+    LabelCreate,
+    LabelResponse,
+    TicketLabelsUpdate,
+)
+from attachments.models import Attachment
+from tickets.models import ArchivedTicket, Label, Ticket, SavedFilter, TicketWatcher, TicketChange, TicketLink
+from tickets.labels import delete_label, filter_by_labels, set_labels
+from sprints.counters import SprintError, count_moves, tickets_deleted, validate_sprint
+from tickets.hierarchy import HierarchyError, detach, place, validate_parent
+from tickets.links import DOWNSTREAM, UPSTREAM, LinkError, add_link, closure_tickets
+from tickets.archive import RestoreConflict, restore_ticket
+from tickets.watchers import add_watchers
+from tickets.history import (
+    TRACKED_FIELDS,
+    ticket_state,
+    created_entry,
+    change_entry,
+    record,
+    record_deletions,
+    state_at,
+)
+from projects.changes import record_change, record_changes
+from projects.models import ProjectChange, ProjectMember
+from notifications.fanout import forget_tickets, notify
 
 
 router = APIRouter(prefix="/tickets", tags=["Tickets"])
@@ -26,6 +70,99 @@ def require_ticket_write_access(ticket_id: int, user):
     return ticket
 
 
+def validate_assignee(project_id: int, assigned_to_id: int):
+    assignee_membership = ProjectMember.objects.filter(
+        user_id=assigned_to_id,
+        project_id=project_id
+    ).first()
+
+    if not assignee_membership:
+        raise HTTPException(400, "Assignee must be a project member.")
+
+    if assignee_membership.role == "VIEWER":
+        raise HTTPException(400, "Cannot assign tickets to VIEWER role members.")
+
+
+def parse_if_match(if_match: str | None) -> int | None:
+    """
+    Parse an If-Match header into a ticket version.
+    Accepts `3`, `"3"` and `W/"3"`.
+    """
+    if if_match is None:
+        return None
+
+    value = if_match.strip()
+    if value.startswith("W/"):
+        value = value[2:]
+    value = value.strip('"')
+
+    if not value.isdigit():
+        raise HTTPException(400, "If-Match must be a ticket version.")
+
+    return int(value)
+
+
+def label_to_response(label: Label) -> dict:
+    return {"id": label.id, "name": label.name, "color": label.color}
+
+
+def ticket_to_response(ticket: Ticket | ArchivedTicket) -> dict:
+    return {
+        "id": ticket.id,
+        "title": ticket.title,
+        "description": ticket.description,
+        "issue_type": ticket.issue_type,
+        "status": ticket.status,
+        "priority": ticket.priority,
+        "order": ticket.order,
+        "version": ticket.version,
+        "project_id": ticket.project_id,
+        "created_by_id": ticket.created_by_id,
+        "assigned_to_id": ticket.assigned_to_id,
+        "created_at": ticket.created_at,
+        "assigned_to_email": ticket.assigned_to.email if ticket.assigned_to else None,
+        "archived": isinstance(ticket, ArchivedTicket),
+        "parent_id": getattr(ticket, "parent_id", None),
+        "subtask_total": getattr(ticket, "subtask_total", 0),
+        "subtask_done": getattr(ticket, "subtask_done", 0),
+        "subtask_max_priority": getattr(ticket, "subtask_max_priority", ""),
+        # Lists prefetch labels (one extra query); archived tickets have none
+        "labels": [
+            label_to_response(label) for label in ticket.labels.all()
+        ] if isinstance(ticket, Ticket) else [],
+        "sprint_id": getattr(ticket, "sprint_id", None),
+    }
+
+
+def write_ticket_changes(ticket: Ticket, changes: dict, expected_version: int) -> Ticket:
+    """
+    Write only the changed columns in a single
+    UPDATE ... WHERE id = ... AND version = ...
+    Raises 409 when another writer bumped the version first.
+    """
+    if not changes:
+        return ticket
+
+    now = timezone.now()
+    updated = Ticket.objects.filter(
+        id=ticket.id,
+        version=expected_version
+    ).update(**changes, version=F("version") + 1, updated_at=now)
+
+    if not updated:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Ticket was modified by someone else. Reload and try again."
+        )
+
+    for field, value in changes.items():
+        setattr(ticket, field, value)
+    ticket.version = expected_version + 1
+    ticket.updated_at = now
+
+    return ticket
+
+
 @router.post("/", response_model=TicketResponse)
 def create_ticket(
     data: TicketCreate,
@@ -45,52 +182,93 @@ def create_ticket(
 
     # Validate assignee
     if data.assigned_to_id:
-        assignee_membership = ProjectMember.objects.filter(
-            user_id=data.assigned_to_id,
-            project_id=data.project_id
-        ).first()
+        validate_assignee(data.project_id, data.assigned_to_id)
 
-        if not assignee_membership:
-            raise HTTPException(400, "Assignee must be a project member.")
+    try:
+        validate_parent(None, data.project_id, data.parent_id)
+        validate_sprint(data.project_id, data.sprint_id)
+    except (HierarchyError, SprintError) as exc:
+        raise HTTPException(400, str(exc))
 
-        if assignee_membership.role == "VIEWER":
-            raise HTTPException(400, "Cannot assign tickets to VIEWER role members.")
+    with transaction.atomic():
+        # KANBAN ORDER LOGIC
+        if data.order is None:
+            max_order = Ticket.objects.filter(
+                project_id=data.project_id,
+                status=data.status
+            ).aggregate(max=Max("order"))["max"]
+            order = (max_order or 0) + 1
+        else:
+            order = data.order
 
-    # KANBAN ORDER LOGIC
-    if data.order is None:
-        max_order = Ticket.objects.filter(
+        ticket = Ticket.objects.create(
+            title=data.title,
+            description=data.description,
+            issue_type=data.issue_type,
+            status=data.status,
+            priority=data.priority,
             project_id=data.project_id,
-            status=data.status
-        ).aggregate(max=Max("order"))["max"]
-        order = (max_order or 0) + 1
-    else:
-        order = data.order
-
-    ticket = Ticket.objects.create(
-        title=data.title,
-        description=data.description,
-        issue_type=data.issue_type,
-        status=data.status,
-        priority=data.priority,
-        project_id=data.project_id,
-        created_by=current_user,
-        assigned_to_id=data.assigned_to_id,
-        order=order
+            created_by=current_user,
+            assigned_to_id=data.assigned_to_id,
+            parent_id=data.parent_id,
+            sprint_id=data.sprint_id,
+            order=order
+        )
+
+        if ticket.parent_id:
+            place(ticket, ticket.parent_id)
+        count_moves([(None, ticket.sprint_id, ticket.status)])
+
+        record([created_entry(ticket, current_user)])
+        record_change(ticket.project_id, ProjectChange.TICKET, ticket.id)
+        add_watchers([ticket.id], [current_user.id], "CREATOR")
+
+        if ticket.assigned_to_id:
+            add_watchers([ticket.id], [ticket.assigned_to_id], "ASSIGNEE")
+            notify("ASSIGNED", current_user, [(ticket.id, [ticket.assigned_to_id])])
+
+    return ticket_to_response(ticket)
+
+
+# -------------------------
+# Watching
+# -------------------------
+@router.get("/watching", response_model=WatchedTicketsPage)
+def list_watched_tickets(
+    cursor: int | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    current_user=Depends(get_current_user)
+):
+    """
+    Tickets the current user watches, newest ticket first.
+    Pass next_cursor back as cursor for the next page.
+    """
+    watched = TicketWatcher.objects.filter(
+        user=current_user,
+        ticket__project_id__in=ProjectMember.objects.filter(
+            user=current_user
+        ).values("project_id")
+    )
+
+    if cursor is not None:
+        watched = watched.filter(ticket_id__lt=cursor)
+
+    ticket_ids = list(
+        watched.order_by("-ticket_id").values_list("ticket_id", flat=True)[:limit + 1]
+    )
+    next_cursor = ticket_ids[limit - 1] if len(ticket_ids) > limit else None
+
+    tickets = (
+        Ticket.objects
+        .filter(id__in=ticket_ids[:limit])
+        .select_related("assigned_to")
+        .prefetch_related("labels")
+        .order_by("-id")
     )
 
     return {
-        "id": ticket.id,
-        "title": ticket.title,
-        "description": ticket.description,
-        "issue_type": ticket.issue_type,
-        "status": ticket.status,
-        "priority": ticket.priority,
-        "order": ticket.order,  # 🔥
-        "project_id": ticket.project_id,
-        "created_by_id": ticket.created_by_id,
-        "assigned_to_id": ticket.assigned_to_id,
-        "created_at": ticket.created_at,
-        "assigned_to_email": ticket.assigned_to.email if ticket.assigned_to else None
+        "results": [ticket_to_response(ticket) for ticket in tickets],
+        "next_cursor": next_cursor,
     }
 
 
@@ -98,38 +276,180 @@ def create_ticket(
 @router.get("/{ticket_id}", response_model=TicketResponse)
 def get_ticket(
     ticket_id: int,
+    response: Response,
     current_user=Depends(get_current_user)
 ):
-    ticket = Ticket.objects.select_related("project", "assigned_to").get(id=ticket_id)
+    ticket = Ticket.objects.select_related("assigned_to").filter(id=ticket_id).first()
+
+    # Fall through to the cold archive
+    if ticket is None:
+        ticket = ArchivedTicket.objects.select_related("assigned_to").filter(id=ticket_id).first()
+
+    if ticket is None:
+        raise HTTPException(404, "Ticket not found")
 
     if not ProjectMember.objects.filter(
         user=current_user,
-        project=ticket.project
+        project_id=ticket.project_id
     ).exists():
         raise HTTPException(403, "Access denied")
 
-    return {
-        "id": ticket.id,
-        "title": ticket.title,
-        "description": ticket.description,
-        "issue_type": ticket.issue_type,
-        "status": ticket.status,
-        "priority": ticket.priority,
-        "project_id": ticket.project_id,
-        "created_by_id": ticket.created_by_id,
-        "assigned_to_id": ticket.assigned_to_id,
-        "created_at": ticket.created_at,
-        "assigned_to_email": ticket.assigned_to.email if ticket.assigned_to else None
+    response.headers["ETag"] = f'"{ticket.version}"'
+    return ticket_to_response(ticket)
+
+
+def ticket_filter_params(
+    status_filter: List[Literal["TODO", "IN_PROGRESS", "DONE"]] | None = Query(None),
+    issue_type: List[str] | None = Query(None),
+    priority: List[str] | None = Query(None),
+    assigned_to_id: List[int] | None = Query(None),
+    unassigned: bool = False,
+    created_by_id: List[int] | None = Query(None),
+    created_after: datetime | None = None,
+    created_before: datetime | None = None,
+    updated_after: datetime | None = None,
+    updated_before: datetime | None = None,
+    search: str | None = None,
+    parent_id: int | None = None,
+    ancestor_id: int | None = None,
+    top_level: bool = False,
+    label_id: List[int] | None = Query(None),
+    label_match: Literal["all", "any"] = "any",
+    sprint_id: int | None = None,
+    backlog: bool = False,
+) -> TicketFilter:
+    """
+    Query-string filters. List params can be repeated,
+    e.g. ?priority=HIGH&priority=URGENT
+
+    parent_id: direct sub-tasks; ancestor_id: sub-tasks at any depth;
+    top_level: tickets without a parent.
+    label_id: tickets with all (label_match=all) or any of the labels.
+    backlog: tickets not in a sprint.
+    """
+    return TicketFilter(
+        status=status_filter or [],
+        issue_type=issue_type or [],
+        priority=priority or [],
+        assigned_to_id=assigned_to_id or [],
+        unassigned=unassigned,
+        created_by_id=created_by_id or [],
+        created_after=created_after,
+        created_before=created_before,
+        updated_after=updated_after,
+        updated_before=updated_before,
+        search=search,
+        parent_id=parent_id,
+        ancestor_id=ancestor_id,
+        top_level=top_level,
+        label_id=label_id or [],
+        label_match=label_match,
+        sprint_id=sprint_id,
+        backlog=backlog,
+    )
+
+
+def apply_ticket_filter(qs, filters: TicketFilter):
+    if filters.status:
+        qs = qs.filter(status__in=filters.status)
+
+    if filters.issue_type:
+        qs = qs.filter(issue_type__in=filters.issue_type)
+
+    if filters.priority:
+        qs = qs.filter(priority__in=filters.priority)
+
+    if filters.assigned_to_id and filters.unassigned:
+        qs = qs.filter(
+            Q(assigned_to_id__in=filters.assigned_to_id) |
+            Q(assigned_to__isnull=True)
+        )
+    elif filters.assigned_to_id:
+        qs = qs.filter(assigned_to_id__in=filters.assigned_to_id)
+    elif filters.unassigned:
+        qs = qs.filter(assigned_to__isnull=True)
+
+    if filters.created_by_id:
+        qs = qs.filter(created_by_id__in=filters.created_by_id)
+
+    if filters.created_after:
+        qs = qs.filter(created_at__gte=filters.created_after)
+    if filters.created_before:
+        qs = qs.filter(created_at__lt=filters.created_before)
+    if filters.updated_after:
+        qs = qs.filter(updated_at__gte=filters.updated_after)
+    if filters.updated_before:
+        qs = qs.filter(updated_at__lt=filters.updated_before)
+
+    if filters.search:
+        qs = qs.filter(
+            Q(title__icontains=filters.search) |
+            Q(description__icontains=filters.search)
+        )
+
+    # Archived tickets have left the hierarchy and their sprint, so they
+    # are all top level and in the backlog, and have no labels
+    if qs.model is ArchivedTicket:
+        if (
+            filters.parent_id is not None
+            or filters.ancestor_id is not None
+            or filters.label_id
+            or filters.sprint_id is not None
+        ):
+            qs = qs.none()
+    else:
+        if filters.parent_id is not None:
+            qs = qs.filter(parent_id=filters.parent_id)
+        if filters.ancestor_id is not None:
+            qs = qs.filter(ancestor_links__ancestor_id=filters.ancestor_id)
+        if filters.top_level:
+            qs = qs.filter(parent__isnull=True)
+        if filters.label_id:
+            qs = filter_by_labels(qs, filters.label_id, filters.label_match)
+        if filters.sprint_id is not None:
+            qs = qs.filter(sprint_id=filters.sprint_id)
+        if filters.backlog:
+            qs = qs.filter(sprint__isnull=True)
+
+    return qs
+
+
+def ticket_facets(qs) -> dict:
+    """
+    Counts by status, priority, issue type and assignee from a single
+    GROUP BY (status, priority, issue_type, assigned_to_id) query.
+    """
+    facets = {
+        "status": {},
+        "priority": {},
+        "issue_type": {},
+        "assigned_to": {},
     }
 
+    rows = (
+        qs.order_by()
+        .values("status", "priority", "issue_type", "assigned_to_id")
+        .annotate(count=Count("id"))
+    )
+
+    for row in rows:
+        assignee = str(row["assigned_to_id"]) if row["assigned_to_id"] else "unassigned"
+
+        for facet, value in (
+            ("status", row["status"]),
+            ("priority", row["priority"]),
+            ("issue_type", row["issue_type"]),
+            ("assigned_to", assignee),
+        ):
+            facets[facet][value] = facets[facet].get(value, 0) + row["count"]
+
+    return facets
+
 
 @router.get("/project/{project_id}", response_model=List[TicketResponse])
 def get_project_tickets(
     project_id: int,
-    status_filter: str | None = None,
-    issue_type: str | None = None,
-    priority: str | None = None,
-    search: str | None = None,
+    filters: TicketFilter = Depends(ticket_filter_params),
     current_user=Depends(get_current_user)
 ):
     if not ProjectMember.objects.filter(
@@ -138,56 +458,161 @@ def get_project_tickets(
     ).exists():
         raise HTTPException(403, "Access denied.")
 
-    qs = (
-        Ticket.objects
-        .filter(project_id=project_id)
-        .select_related("assigned_to")
-        .order_by("status", "order")
+    def load():
+        qs = (
+            Ticket.objects
+            .filter(project_id=project_id)
+            .select_related("assigned_to")
+            .prefetch_related("labels")
+            .order_by("status", "order")
+        )
+
+        qs = apply_ticket_filter(qs, filters)
+
+        return [ticket_to_response(ticket) for ticket in qs]
+
+    # Membership is checked above, so the result depends on the project only
+    return singleflight.do(
+        "tickets.project",
+        (project_id, filters.model_dump_json()),
+        load
     )
 
-    if status_filter:
-        qs = qs.filter(status=status_filter)
 
-    if issue_type:
-        qs = qs.filter(issue_type=issue_type)
+@router.get("/project/{project_id}/search", response_model=TicketSearchResponse)
+def search_project_tickets(
+    project_id: int,
+    filters: TicketFilter = Depends(ticket_filter_params),
+    saved_filter_id: int | None = None,
+    include_archived: bool = False,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    current_user=Depends(get_current_user)
+):
+    """
+    Paginated ticket list with facet counts for the whole filtered set.
+    Query-string filters override the fields of a saved filter.
+    With include_archived, archived matches follow the live ones.
+    """
+    if not ProjectMember.objects.filter(
+        user=current_user,
+        project_id=project_id
+    ).exists():
+        raise HTTPException(403, "Access denied.")
+
+    if saved_filter_id is not None:
+        saved = SavedFilter.objects.filter(
+            id=saved_filter_id,
+            user=current_user,
+            project_id=project_id
+        ).first()
+
+        if not saved:
+            raise HTTPException(404, "Saved filter not found.")
 
-    if priority:
-        qs = qs.filter(priority=priority)
+        filters = TicketFilter(**{
+            **saved.filters,
+            **filters.model_dump(exclude_defaults=True),
+        })
 
-    if search:
-        qs = qs.filter(
-            Q(title__icontains=search) |  # ✅ FIXED: Double underscore
-            Q(description__icontains=search)  # ✅ FIXED: Double underscore
+    def load():
+        qs = apply_ticket_filter(Ticket.objects.filter(project_id=project_id), filters)
+
+        facets = ticket_facets(qs)
+        total = sum(facets["status"].values())
+
+        page = list(
+            qs.select_related("assigned_to")
+            .prefetch_related("labels")
+            .order_by("status", "order")[offset:offset + limit]
         )
 
-    tickets = []
-    for ticket in qs:
-        tickets.append({
-            "id": ticket.id,
-            "title": ticket.title,
-            "description": ticket.description,
-            "issue_type": ticket.issue_type,
-            "status": ticket.status,
-            "priority": ticket.priority,
-            "order": ticket.order,
-            "project_id": ticket.project_id,
-            "created_by_id": ticket.created_by_id,
-            "assigned_to_id": ticket.assigned_to_id,
-            "created_at": ticket.created_at,
-            "assigned_to_email": ticket.assigned_to.email if ticket.assigned_to else None
-        })
+        if include_archived:
+            archived = apply_ticket_filter(ArchivedTicket.objects.filter(project_id=project_id), filters)
 
-    return tickets
+            for facet, counts in ticket_facets(archived).items():
+                for value, count in counts.items():
+                    facets[facet][value] = facets[facet].get(value, 0) + count
 
+            archived_offset = max(offset - total, 0)
+            page += archived.select_related("assigned_to").order_by("-updated_at", "-id")[
+                archived_offset:archived_offset + limit - len(page)
+            ]
+            total = sum(facets["status"].values())
 
+        return {
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "results": [ticket_to_response(ticket) for ticket in page],
+            "facets": facets,
+        }
 
-@router.put("/{ticket_id}", response_model=TicketResponse)
-def update_ticket(
-    ticket_id: int,
-    data: TicketUpdate,
+    return singleflight.do(
+        "tickets.project_search",
+        (project_id, filters.model_dump_json(), include_archived, limit, offset),
+        load
+    )
+
+
+# -------------------------
+# Saved filters
+# -------------------------
+@router.get("/project/{project_id}/filters", response_model=List[SavedFilterResponse])
+def list_saved_filters(
+    project_id: int,
     current_user=Depends(get_current_user)
 ):
-    ticket = Ticket.objects.select_related("project", "assigned_to").get(id=ticket_id)
+    return SavedFilter.objects.filter(user=current_user, project_id=project_id)
+
+
+@router.post(
+    "/project/{project_id}/filters",
+    response_model=SavedFilterResponse,
+    status_code=status.HTTP_201_CREATED
+)
+def create_saved_filter(
+    project_id: int,
+    data: SavedFilterCreate,
+    current_user=Depends(get_current_user)
+):
+    if not ProjectMember.objects.filter(
+        user=current_user,
+        project_id=project_id
+    ).exists():
+        raise HTTPException(403, "Access denied.")
+
+    saved, _ = SavedFilter.objects.update_or_create(
+        user=current_user,
+        project_id=project_id,
+        name=data.name,
+        defaults={"filters": data.filters.model_dump(mode="json", exclude_defaults=True)},
+    )
+
+    return saved
+
+
+@router.delete("/filters/{filter_id}", status_code=204)
+def delete_saved_filter(
+    filter_id: int,
+    current_user=Depends(get_current_user)
+):
+    deleted, _ = SavedFilter.objects.filter(id=filter_id, user=current_user).delete()
+
+    if not deleted:
+        raise HTTPException(404, "Saved filter not found.")
+    return
+
+
+def apply_ticket_update(
+    ticket_id: int,
+    data: TicketUpdate,
+    current_user,
+    expected_version: int | None,
+) -> Ticket:
+    ticket = Ticket.objects.select_related("project", "assigned_to").filter(id=ticket_id).first()
+    if not ticket:
+        raise HTTPException(404, "Ticket not found")
 
     membership = ProjectMember.objects.filter(
         project=ticket.project,
@@ -197,65 +622,481 @@ def update_ticket(
     if not membership:
         raise HTTPException(403, "Access denied")
 
+    requested = data.model_dump(exclude_unset=True)
+
     if membership.role in ("ADMIN", "DEV"):
-        for field, value in data.model_dump(exclude_unset=True).items():
-            setattr(ticket, field, value)
-
-    elif ticket.assigned_to == current_user:
-        if data.status is not None:
-            ticket.status = data.status
-        if data.order is not None:
-            ticket.order = data.order
-        else:
+        allowed = requested
+
+    elif ticket.assigned_to_id == current_user.id:
+        if set(requested) - {"status", "order"}:
             raise HTTPException(403, "You can only update status/order")
+        allowed = requested
 
     else:
         raise HTTPException(403, "Permission denied")
 
-    ticket.save()
-
-    return {
-        "id": ticket.id,
-        "title": ticket.title,
-        "description": ticket.description,
-        "issue_type": ticket.issue_type,
-        "status": ticket.status,
-        "priority": ticket.priority,
-        "order": ticket.order,  # 🔥
-        "project_id": ticket.project_id,
-        "created_by_id": ticket.created_by_id,
-        "assigned_to_id": ticket.assigned_to_id,
-        "created_at": ticket.created_at,
-        "assigned_to_email": ticket.assigned_to.email if ticket.assigned_to else None
+    # Only columns whose value actually changes are written
+    changes = {
+        field: value
+        for field, value in allowed.items()
+        if getattr(ticket, field) != value
     }
 
+    if changes.get("assigned_to_id"):
+        validate_assignee(ticket.project_id, changes["assigned_to_id"])
+
+    try:
+        if "parent_id" in changes:
+            validate_parent(ticket, ticket.project_id, changes["parent_id"])
+        if "sprint_id" in changes:
+            validate_sprint(ticket.project_id, changes["sprint_id"])
+    except (HierarchyError, SprintError) as exc:
+        raise HTTPException(400, str(exc))
+
+    if expected_version is None:
+        expected_version = ticket.version
+    elif expected_version != ticket.version:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Ticket was modified by someone else. Reload and try again."
+        )
+
+    old_state = ticket_state(ticket)
+    old_sprint_id = ticket.sprint_id
+
+    try:
+        with transaction.atomic():
+            ticket = write_ticket_changes(ticket, changes, expected_version)
+
+            if "parent_id" in changes:
+                place(ticket, changes["parent_id"])
+
+            # Counted with the old status; record() then applies any status change
+            if "sprint_id" in changes:
+                count_moves([(old_sprint_id, ticket.sprint_id, old_state["status"])])
+
+            if changes:
+                record([change_entry(ticket.id, current_user, old_state, changes)])
+                record_change(ticket.project_id, ProjectChange.TICKET, ticket.id)
+    except HierarchyError as exc:
+        raise HTTPException(400, str(exc))
+
+    if changes.get("assigned_to_id"):
+        add_watchers([ticket.id], [ticket.assigned_to_id], "ASSIGNEE")
+        notify("ASSIGNED", current_user, [(ticket.id, [ticket.assigned_to_id])])
+
+    return ticket
+
+
+@router.put("/{ticket_id}", response_model=TicketResponse)
+def update_ticket(
+    ticket_id: int,
+    data: TicketUpdate,
+    response: Response,
+    if_match: str | None = Header(default=None),
+    current_user=Depends(get_current_user)
+):
+    ticket = apply_ticket_update(
+        ticket_id, data, current_user, parse_if_match(if_match)
+    )
+
+    response.headers["ETag"] = f'"{ticket.version}"'
+    return ticket_to_response(ticket)
+
 
 @router.patch("/reorder")
 def reorder_ticket(
     ticket_id: int,
-    status: str,
+    status: Literal["TODO", "IN_PROGRESS", "DONE"],
     order: int,
     user=Depends(get_current_user),
 ):
-    ticket = Ticket.objects.get(id=ticket_id)
+    with transaction.atomic():
+        ticket = Ticket.objects.select_for_update().filter(id=ticket_id).first()
+        if not ticket:
+            raise HTTPException(404, "Ticket not found")
+
+        # Same rule as PATCH: viewers may only move tickets assigned to them
+        membership = ProjectMember.objects.filter(
+            project_id=ticket.project_id,
+            user=user
+        ).first()
 
-    ticket.status = status
-    ticket.order = order
-    ticket.save()
+        if not membership:
+            raise HTTPException(403, "Access denied")
+
+        if membership.role not in ("ADMIN", "DEV") and ticket.assigned_to_id != user.id:
+            raise HTTPException(403, "Permission denied")
+
+        old_state = ticket_state(ticket)
+
+        ticket.status = status
+        ticket.order = order
+        ticket.version = F("version") + 1
+        ticket.save(update_fields=["status", "order", "version", "updated_at"])
+
+        record([change_entry(ticket.id, user, old_state, {"status": status})])
+        record_change(ticket.project_id, ProjectChange.TICKET, ticket.id)
 
     return {"success": True}
 
 
+@router.patch("/{ticket_id}", response_model=TicketResponse)
+def patch_ticket(
+    ticket_id: int,
+    data: TicketUpdate,
+    response: Response,
+    if_match: str | None = Header(default=None),
+    current_user=Depends(get_current_user)
+):
+    """
+    Partial update: only the fields sent are written.
+    Send the version from the ticket's ETag in If-Match to
+    get a 409 instead of overwriting a concurrent edit.
+    """
+    ticket = apply_ticket_update(
+        ticket_id, data, current_user, parse_if_match(if_match)
+    )
+
+    response.headers["ETag"] = f'"{ticket.version}"'
+    return ticket_to_response(ticket)
+
+
+def require_ticket_read_access(ticket_id: int, user) -> Ticket:
+    ticket = Ticket.objects.filter(id=ticket_id).first()
+    if not ticket:
+        raise HTTPException(404, "Ticket not found")
+
+    if not ProjectMember.objects.filter(user=user, project_id=ticket.project_id).exists():
+        raise HTTPException(403, "Access denied")
+
+    return ticket
+
+
+# -------------------------
+# History
+# -------------------------
+@router.get("/{ticket_id}/history", response_model=TicketHistoryPage)
+def get_ticket_history(
+    ticket_id: int,
+    cursor: int | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    current_user=Depends(get_current_user)
+):
+    """
+    Newest change first. Pass next_cursor back as cursor for the next page.
+    """
+    require_ticket_read_access(ticket_id, current_user)
+
+    entries = TicketChange.objects.filter(ticket_id=ticket_id)
+    if cursor is not None:
+        entries = entries.filter(id__lt=cursor)
+
+    page = list(entries.select_related("actor").order_by("-id")[:limit + 1])
+    next_cursor = page[limit - 1].id if len(page) > limit else None
+
+    return {
+        "results": [
+            {
+                "id": entry.id,
+                "action": entry.action,
+                "actor_email": entry.actor.email if entry.actor else None,
+                "created_at": entry.created_at,
+                "changes": entry.changes,
+            }
+            for entry in page[:limit]
+        ],
+        "next_cursor": next_cursor,
+    }
+
+
+@router.get("/{ticket_id}/history/at", response_model=TicketStateAt)
+def get_ticket_state_at(
+    ticket_id: int,
+    at: datetime,
+    current_user=Depends(get_current_user)
+):
+    """
+    Rebuild the ticket's tracked fields as they were at `at`.
+    """
+    require_ticket_read_access(ticket_id, current_user)
+
+    state = state_at(ticket_id, at)
+    if state is None:
+        raise HTTPException(404, "No history for this ticket at that time.")
+
+    return {"ticket_id": ticket_id, "at": at, "state": state}
+
+
+@router.get("/{ticket_id}/watchers", response_model=List[WatcherResponse])
+def list_ticket_watchers(
+    ticket_id: int,
+    current_user=Depends(get_current_user)
+):
+    require_ticket_read_access(ticket_id, current_user)
+
+    watchers = (
+        TicketWatcher.objects
+        .filter(ticket_id=ticket_id)
+        .select_related("user")
+        .order_by("created_at")
+    )
+
+    return [
+        {
+            "user_id": w.user_id,
+            "email": w.user.email,
+            "reason": w.reason,
+            "created_at": w.created_at,
+        }
+        for w in watchers
+    ]
+
+
+@router.post("/{ticket_id}/watch", status_code=204)
+def watch_ticket(
+    ticket_id: int,
+    current_user=Depends(get_current_user)
+):
+    require_ticket_read_access(ticket_id, current_user)
+    add_watchers([ticket_id], [current_user.id], "MANUAL")
+    return
+
+
+@router.delete("/{ticket_id}/watch", status_code=204)
+def unwatch_ticket(
+    ticket_id: int,
+    current_user=Depends(get_current_user)
+):
+    TicketWatcher.objects.filter(ticket_id=ticket_id, user=current_user).delete()
+    return
+
+
+# -------------------------
+# Labels
+# -------------------------
+@router.get("/project/{project_id}/labels", response_model=List[LabelResponse])
+def list_project_labels(
+    project_id: int,
+    current_user=Depends(get_current_user)
+):
+    if not ProjectMember.objects.filter(user=current_user, project_id=project_id).exists():
+        raise HTTPException(403, "Access denied.")
+
+    labels = Label.objects.filter(project_id=project_id).annotate(
+        ticket_count=Count("ticket_labels")
+    )
+
+    return [
+        {**label_to_response(label), "ticket_count": label.ticket_count}
+        for label in labels
+    ]
+
+
+@router.post("/project/{project_id}/labels", response_model=LabelResponse, status_code=201)
+def create_label(
+    project_id: int,
+    data: LabelCreate,
+    current_user=Depends(get_current_user)
+):
+    if not ProjectMember.objects.filter(
+        user=current_user,
+        project_id=project_id,
+        role__in=("ADMIN", "DEV")
+    ).exists():
+        raise HTTPException(403, "You do not have permission to manage labels in this project.")
+
+    label, created = Label.objects.get_or_create(
+        project_id=project_id,
+        name=data.name,
+        defaults={"color": data.color}
+    )
+    if not created:
+        raise HTTPException(409, "A label with this name already exists.")
+
+    return label_to_response(label)
+
+
+@router.delete("/labels/{label_id}", status_code=204)
+def remove_label(
+    label_id: int,
+    current_user=Depends(get_current_user)
+):
+    label = Label.objects.filter(id=label_id).first()
+    if not label:
+        raise HTTPException(404, "Label not found")
+
+    if not ProjectMember.objects.filter(
+        user=current_user,
+        project_id=label.project_id,
+        role="ADMIN"
+    ).exists():
+        raise HTTPException(403, "Only project admins can delete labels.")
+
+    ticket_ids = delete_label(label)
+    record_changes(ProjectChange.TICKET, [(label.project_id, ticket_id) for ticket_id in ticket_ids])
+    return
+
+
+@router.put("/{ticket_id}/labels", response_model=TicketResponse)
+def set_ticket_labels(
+    ticket_id: int,
+    data: TicketLabelsUpdate,
+    current_user=Depends(get_current_user)
+):
+    """Replace the ticket's labels with `label_ids`."""
+    ticket = require_ticket_write_access(ticket_id, current_user)
+
+    label_ids = set(data.label_ids)
+    if Label.objects.filter(project_id=ticket.project_id, id__in=label_ids).count() != len(label_ids):
+        raise HTTPException(400, "Labels must belong to the ticket's project.")
+
+    if set_labels(ticket, label_ids):
+        record_change(ticket.project_id, ProjectChange.TICKET, ticket.id)
+
+    return ticket_to_response(ticket)
+
+
+# -------------------------
+# Links / dependencies
+# -------------------------
+def link_to_response(link: TicketLink) -> dict:
+    return {
+        "id": link.id,
+        "source_id": link.source_id,
+        "target_id": link.target_id,
+        "kind": link.kind,
+        "created_at": link.created_at,
+    }
+
+
+@router.get("/{ticket_id}/links", response_model=List[TicketLinkResponse])
+def list_ticket_links(
+    ticket_id: int,
+    current_user=Depends(get_current_user)
+):
+    """Direct links in both directions."""
+    require_ticket_read_access(ticket_id, current_user)
+
+    links = TicketLink.objects.filter(
+        Q(source_id=ticket_id) | Q(target_id=ticket_id)
+    ).order_by("id")
+
+    return [link_to_response(link) for link in links]
+
+
+@router.post("/{ticket_id}/links", response_model=TicketLinkResponse, status_code=201)
+def create_ticket_link(
+    ticket_id: int,
+    data: TicketLinkCreate,
+    current_user=Depends(get_current_user)
+):
+    """Link this ticket to `target_id`, e.g. kind BLOCKS: this ticket blocks the target."""
+    source = require_ticket_write_access(ticket_id, current_user)
+
+    target = Ticket.objects.filter(id=data.target_id).first()
+    if not target:
+        raise HTTPException(404, "Target ticket not found")
+
+    try:
+        link = add_link(source, target, data.kind, current_user)
+    except LinkError as exc:
+        raise HTTPException(400, str(exc))
+
+    return link_to_response(link)
+
+
+@router.delete("/{ticket_id}/links/{link_id}", status_code=204)
+def delete_ticket_link(
+    ticket_id: int,
+    link_id: int,
+    current_user=Depends(get_current_user)
+):
+    require_ticket_write_access(ticket_id, current_user)
+
+    deleted, _ = TicketLink.objects.filter(
+        Q(source_id=ticket_id) | Q(target_id=ticket_id),
+        id=link_id
+    ).delete()
+
+    if not deleted:
+        raise HTTPException(404, "Link not found")
+    return
+
+
+@router.get("/{ticket_id}/dependencies", response_model=TicketDependencies)
+def get_ticket_dependencies(
+    ticket_id: int,
+    direction: Literal["blocked_by", "blocks"] = "blocked_by",
+    current_user=Depends(get_current_user)
+):
+    """
+    Transitive closure over BLOCKS links: every ticket this one is
+    (directly or indirectly) blocked by, or every ticket it blocks.
+    """
+    ticket = require_ticket_read_access(ticket_id, current_user)
+
+    tickets = list(
+        closure_tickets(
+            ticket,
+            TicketLink.BLOCKS,
+            UPSTREAM if direction == "blocked_by" else DOWNSTREAM
+        ).prefetch_related("labels").order_by("id")
+    )
+
+    return {
+        "ticket_id": ticket_id,
+        "direction": direction,
+        "open_count": sum(1 for t in tickets if t.status != "DONE"),
+        "tickets": [ticket_to_response(t) for t in tickets],
+    }
+
+
 @router.delete("/{ticket_id}", status_code=204)
 def delete_ticket(
     ticket_id: int,
     current_user=Depends(get_current_user)
 ):
     ticket = require_ticket_write_access(ticket_id, current_user)
-    ticket.delete()
+
+    with transaction.atomic():
+        record_deletions([ticket_id])
+        Attachment.objects.filter(ticket_id=ticket_id).delete()
+        forget_tickets([ticket_id])
+        detach([ticket_id])
+        tickets_deleted([ticket_id])
+        ticket.delete()
+        record_change(ticket.project_id, ProjectChange.TICKET, ticket_id, deleted=True)
     return
 
 
+@router.post("/{ticket_id}/restore", response_model=TicketResponse)
+def restore_archived_ticket(
+    ticket_id: int,
+    current_user=Depends(get_current_user)
+):
+    """Move an archived ticket back onto the board."""
+    archived = ArchivedTicket.objects.filter(id=ticket_id).first()
+    if not archived:
+        raise HTTPException(404, "Archived ticket not found")
+
+    if not ProjectMember.objects.filter(
+        user=current_user,
+        project_id=archived.project_id,
+        role__in=("ADMIN", "DEV")
+    ).exists():
+        raise HTTPException(403, "Permission denied")
+
+    try:
+        ticket = restore_ticket(ticket_id)
+    except ArchivedTicket.DoesNotExist:
+        raise HTTPException(404, "Archived ticket not found")
+    except RestoreConflict as exc:
+        raise HTTPException(status.HTTP_409_CONFLICT, str(exc))
+
+    return ticket_to_response(ticket)
+
+
 @router.get("/", response_model=List[TicketResponse])
 def get_all_tickets(current_user=Depends(get_current_user)):
     """
@@ -269,23 +1110,177 @@ def get_all_tickets(current_user=Depends(get_current_user)):
     # Get tickets from those projects
     tickets = Ticket.objects.filter(
         project_id__in=user_projects
-    ).select_related('assigned_to').order_by('-created_at')
-    
-    result = []
-    for ticket in tickets:
-        result.append({
-            "id": ticket.id,
-            "title": ticket.title,
-            "description": ticket.description,
-            "issue_type": ticket.issue_type,
-            "status": ticket.status,
-            "priority": ticket.priority,
-            "order": ticket.order,
-            "project_id": ticket.project_id,
-            "created_by_id": ticket.created_by_id,
-            "assigned_to_id": ticket.assigned_to_id,
-            "created_at": ticket.created_at,
-            "assigned_to_email": ticket.assigned_to.email if ticket.assigned_to else None
-        })
+    ).select_related('assigned_to').prefetch_related('labels').order_by('-created_at')
     
-    return result
\ No newline at end of file
+    return [ticket_to_response(ticket) for ticket in tickets]
+
+
+# -------------------------
+# Bulk operations
+# -------------------------
+def resolve_bulk_targets(ticket_ids: list[int] | None, ticket_filter: TicketBulkFilter | None):
+    """
+    Resolve a bulk request into {ticket_id: project_id} with one query.
+    """
+    if (ticket_ids is None) == (ticket_filter is None):
+        raise HTTPException(400, "Provide either ticket_ids or filter.")
+
+    if ticket_ids is not None:
+        qs = Ticket.objects.filter(id__in=ticket_ids)
+    else:
+        qs = Ticket.objects.filter(project_id=ticket_filter.project_id)
+
+        if ticket_filter.status:
+            qs = qs.filter(status=ticket_filter.status)
+        if ticket_filter.issue_type:
+            qs = qs.filter(issue_type=ticket_filter.issue_type)
+        if ticket_filter.priority:
+            qs = qs.filter(priority=ticket_filter.priority)
+        if ticket_filter.assigned_to_id:
+            qs = qs.filter(assigned_to_id=ticket_filter.assigned_to_id)
+        if ticket_filter.search:
+            qs = qs.filter(
+                Q(title__icontains=ticket_filter.search) |
+                Q(description__icontains=ticket_filter.search)
+            )
+
+    found = dict(qs.values_list("id", "project_id"))
+    requested = ticket_ids if ticket_ids is not None else list(found)
+
+    return requested, found
+
+
+def writable_projects(user, project_ids) -> set[int]:
+    """
+    Projects (out of project_ids) where the user may modify tickets,
+    checked once per project instead of once per ticket.
+    """
+    return set(
+        ProjectMember.objects.filter(
+            user=user,
+            project_id__in=set(project_ids),
+            role__in=("ADMIN", "DEV")
+        ).values_list("project_id", flat=True)
+    )
+
+
+@router.post("/bulk/update", response_model=TicketBulkResponse)
+def bulk_update_tickets(
+    data: TicketBulkUpdate,
+    current_user=Depends(get_current_user)
+):
+    changes = data.changes.model_dump(exclude_unset=True)
+    if not changes:
+        raise HTTPException(400, "No changes provided.")
+
+    requested, found = resolve_bulk_targets(data.ticket_ids, data.filter)
+    allowed_projects = writable_projects(current_user, found.values())
+
+    # Assignee must be a non-VIEWER member of each ticket's project
+    assignable_projects = allowed_projects
+    if changes.get("assigned_to_id"):
+        assignable_projects = set(
+            ProjectMember.objects.filter(
+                user_id=changes["assigned_to_id"],
+                project_id__in=allowed_projects
+            ).exclude(role="VIEWER").values_list("project_id", flat=True)
+        )
+
+    results = []
+    to_update = []
+    for ticket_id in requested:
+        project_id = found.get(ticket_id)
+
+        if project_id is None:
+            result = "not_found"
+        elif project_id not in allowed_projects:
+            result = "forbidden"
+        elif project_id not in assignable_projects:
+            result = "invalid_assignee"
+        else:
+            result = "updated"
+            to_update.append(ticket_id)
+
+        results.append({"ticket_id": ticket_id, "result": result})
+
+    if to_update:
+        with transaction.atomic():
+            old_states = {
+                row.pop("id"): row
+                for row in Ticket.objects.filter(id__in=to_update).values(
+                    "id", *TRACKED_FIELDS
+                )
+            }
+
+            Ticket.objects.filter(id__in=to_update).update(
+                **changes,
+                version=F("version") + 1,
+                updated_at=timezone.now()
+            )
+
+            record(
+                change_entry(ticket_id, current_user, state, changes)
+                for ticket_id, state in old_states.items()
+            )
+            record_changes(
+                ProjectChange.TICKET,
+                [(found[ticket_id], ticket_id) for ticket_id in to_update]
+            )
+
+            if changes.get("assigned_to_id"):
+                add_watchers(to_update, [changes["assigned_to_id"]], "ASSIGNEE")
+                notify(
+                    "ASSIGNED",
+                    current_user,
+                    [(ticket_id, [changes["assigned_to_id"]]) for ticket_id in to_update]
+                )
+
+    return {
+        "requested": len(requested),
+        "applied": len(to_update),
+        "results": results,
+    }
+
+
+@router.post("/bulk/delete", response_model=TicketBulkResponse)
+def bulk_delete_tickets(
+    data: TicketBulkDelete,
+    current_user=Depends(get_current_user)
+):
+    requested, found = resolve_bulk_targets(data.ticket_ids, data.filter)
+    allowed_projects = writable_projects(current_user, found.values())
+
+    results = []
+    to_delete = []
+    for ticket_id in requested:
+        project_id = found.get(ticket_id)
+
+        if project_id is None:
+            result = "not_found"
+        elif project_id not in allowed_projects:
+            result = "forbidden"
+        else:
+            result = "deleted"
+            to_delete.append(ticket_id)
+
+        results.append({"ticket_id": ticket_id, "result": result})
+
+    if to_delete:
+        with transaction.atomic():
+            record_deletions(to_delete)
+            Attachment.objects.filter(ticket_id__in=to_delete).delete()
+            forget_tickets(to_delete)
+            detach(to_delete)
+            tickets_deleted(to_delete)
+            Ticket.objects.filter(id__in=to_delete).delete()
+            record_changes(
+                ProjectChange.TICKET,
+                [(found[ticket_id], ticket_id) for ticket_id in to_delete],
+                deleted=True
+            )
+
+    return {
+        "requested": len(requested),
+        "applied": len(to_delete),
+        "results": results,
+    }
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional, Literal
+from pydantic import BaseModel, Field, field_validator
+from typing import Any, Dict, List, Optional, Literal
 from datetime import datetime
 
 
@@ -12,6 +12,15 @@ class TicketCreate(BaseModel):
     project_id: int
     assigned_to_id: Optional[int] = None
     order: int | None = None
+    parent_id: Optional[int] = None
+    sprint_id: Optional[int] = None
+
+class LabelResponse(BaseModel):
+    id: int
+    name: str
+    color: str = ""
+    ticket_count: Optional[int] = None
+
 
 class TicketResponse(BaseModel):
     id: int
@@ -25,7 +34,15 @@ class TicketResponse(BaseModel):
     assigned_to_id: Optional[int]
     created_at: datetime
     order: int
+    version: int = 1
     assigned_to_email: Optional[str] = None 
+    archived: bool = False
+    parent_id: Optional[int] = None
+    subtask_total: int = 0
+    subtask_done: int = 0
+    subtask_max_priority: str = ""
+    labels: List[LabelResponse] = []
+    sprint_id: Optional[int] = None
 
     class Config:
         from_attributes = True
@@ -35,7 +52,167 @@ class TicketUpdate(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
     issue_type: Optional[str] = None
-    status: Literal["TODO", "IN_PROGRESS", "DONE"] = "TODO"
+    status: Optional[Literal["TODO", "IN_PROGRESS", "DONE"]] = None
+    priority: Optional[str] = None
+    assigned_to_id: Optional[int] = None
+    order: Optional[int] = None
+    parent_id: Optional[int] = None
+    sprint_id: Optional[int] = None
+
+    # Fields may be omitted, but only the nullable columns accept null
+    @field_validator("title", "description", "issue_type", "status", "priority", "order")
+    @classmethod
+    def not_null(cls, value, info):
+        if value is None:
+            raise ValueError(f"{info.field_name} cannot be null")
+        return value
+
+class TicketFilter(BaseModel):
+    status: List[Literal["TODO", "IN_PROGRESS", "DONE"]] = []
+    issue_type: List[str] = []
+    priority: List[str] = []
+    assigned_to_id: List[int] = []
+    unassigned: bool = False
+    created_by_id: List[int] = []
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+    updated_after: Optional[datetime] = None
+    updated_before: Optional[datetime] = None
+    search: Optional[str] = None
+    parent_id: Optional[int] = None
+    ancestor_id: Optional[int] = None
+    top_level: bool = False
+    label_id: List[int] = []
+    label_match: Literal["all", "any"] = "any"
+    sprint_id: Optional[int] = None
+    backlog: bool = False
+
+
+class TicketSearchResponse(BaseModel):
+    total: int
+    limit: int
+    offset: int
+    results: List[TicketResponse]
+    facets: Dict[str, Dict[str, int]]
+
+
+class SavedFilterCreate(BaseModel):
+    name: str = Field(..., min_length=1, max_length=100)
+    filters: TicketFilter
+
+
+class SavedFilterResponse(BaseModel):
+    id: int
+    name: str
+    project_id: int
+    filters: TicketFilter
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class TicketBulkFilter(BaseModel):
+    project_id: int
+    status: Optional[Literal["TODO", "IN_PROGRESS", "DONE"]] = None
+    issue_type: Optional[str] = None
     priority: Optional[str] = None
     assigned_to_id: Optional[int] = None
-    order: Optional[int] = None
\ No newline at end of file
+    search: Optional[str] = None
+
+
+class TicketBulkChanges(BaseModel):
+    status: Optional[Literal["TODO", "IN_PROGRESS", "DONE"]] = None
+    issue_type: Optional[str] = None
+    priority: Optional[str] = None
+    assigned_to_id: Optional[int] = None
+
+    # assigned_to_id: null unassigns; the other columns are NOT NULL
+    @field_validator("status", "issue_type", "priority")
+    @classmethod
+    def not_null(cls, value, info):
+        if value is None:
+            raise ValueError(f"{info.field_name} cannot be null")
+        return value
+
+
+class TicketBulkUpdate(BaseModel):
+    ticket_ids: Optional[List[int]] = Field(default=None, max_length=1000)
+    filter: Optional[TicketBulkFilter] = None
+    changes: TicketBulkChanges
+
+
+class TicketBulkDelete(BaseModel):
+    ticket_ids: Optional[List[int]] = Field(default=None, max_length=1000)
+    filter: Optional[TicketBulkFilter] = None
+
+
+class TicketBulkItemResult(BaseModel):
+    ticket_id: int
+    result: Literal["updated", "deleted", "not_found", "forbidden", "invalid_assignee"]
+
+
+class TicketBulkResponse(BaseModel):
+    requested: int
+    applied: int
+    results: List[TicketBulkItemResult]
+
+
+class WatcherResponse(BaseModel):
+    user_id: int
+    email: str
+    reason: str
+    created_at: datetime
+
+
+class WatchedTicketsPage(BaseModel):
+    results: List[TicketResponse]
+    next_cursor: Optional[int] = None
+
+
+class TicketHistoryEntry(BaseModel):
+    id: int
+    action: str
+    actor_email: Optional[str] = None
+    created_at: datetime
+    changes: Dict[str, List[Any]]
+
+
+class TicketHistoryPage(BaseModel):
+    results: List[TicketHistoryEntry]
+    next_cursor: Optional[int] = None
+
+
+class TicketStateAt(BaseModel):
+    ticket_id: int
+    at: datetime
+    state: Dict[str, Any]
+
+
+class TicketLinkCreate(BaseModel):
+    target_id: int
+    kind: Literal["BLOCKS", "RELATES_TO", "DUPLICATES"] = "BLOCKS"
+
+
+class TicketLinkResponse(BaseModel):
+    id: int
+    source_id: int
+    target_id: int
+    kind: str
+    created_at: datetime
+
+
+class TicketDependencies(BaseModel):
+    ticket_id: int
+    direction: Literal["blocked_by", "blocks"]
+    open_count: int
+    tickets: List[TicketResponse]
+
+
+class LabelCreate(BaseModel):
+    name: str = Field(..., min_length=1, max_length=50)
+    color: str = Field("", pattern=r"^(#[0-9a-fA-F]{6})?$")
+
+
+class TicketLabelsUpdate(BaseModel):
+    label_ids: List[int] = Field(default_factory=list, max_length=50)
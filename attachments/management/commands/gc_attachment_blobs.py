@@ -0,0 +1,21 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from attachments.service import collect_garbage
+
+
+class Command(BaseCommand):
+    help = "Delete stored attachment files that no attachment refers to any more."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--grace-minutes",
+            type=int,
+            default=60,
+            help="Keep unreferenced blobs younger than this.",
+        )
+
+    def handle(self, *args, **options):
+        removed = collect_garbage(timedelta(minutes=options["grace_minutes"]))
+        self.stdout.write(self.style.SUCCESS(f"Removed {removed} unreferenced blobs"))
@@ -0,0 +1,75 @@
+from django.db import models
+
+from comments.models import Comments
+from projects.models import Project
+from tickets.models import Ticket
+from users.models import User
+
+
+class Blob(models.Model):
+    """
+    File content, stored once per SHA-256 by attachments.storage no
+    matter how many attachments point at it.
+    """
+    sha256 = models.CharField(max_length=64, primary_key=True)
+    size = models.PositiveBigIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.sha256[:12]} ({self.size} bytes)"
+
+
+class Attachment(models.Model):
+    """
+    File metadata for a ticket or one of its comments. The content lives
+    in the Blob; unreferenced blobs are removed by gc_attachment_blobs.
+
+    Like StatusTransition, ticket and comment references do not cascade
+    so attachments survive archiving (ids are kept); deleting a ticket or
+    comment removes its attachments explicitly.
+    """
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name="attachments"
+    )
+
+    ticket = models.ForeignKey(
+        Ticket,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="attachments"
+    )
+
+    comment = models.ForeignKey(
+        Comments,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        blank=True,
+        related_name="attachments"
+    )
+
+    blob = models.ForeignKey(Blob, on_delete=models.PROTECT, related_name="attachments")
+
+    uploaded_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+"
+    )
+
+    filename = models.CharField(max_length=255)
+    content_type = models.CharField(max_length=100)
+    size = models.PositiveBigIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["ticket", "comment"]),
+            models.Index(fields=["comment"]),
+        ]
+
+    def __str__(self):
+        return f"{self.filename} on #{self.ticket_id}"
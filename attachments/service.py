@@ -0,0 +1,55 @@
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from attachments.models import Attachment, Blob
+from attachments.storage import BlobWriter, delete_blob
+
+
+def save_attachment(writer: BlobWriter, *, project_id, ticket_id, comment_id, user, filename, content_type) -> Attachment:
+    """Record a finished upload; the blob row is locked while its file is placed."""
+    sha256, size = writer.finish()
+
+    with transaction.atomic():
+        Blob.objects.get_or_create(sha256=sha256, defaults={"size": size})
+        Blob.objects.select_for_update().get(sha256=sha256)
+
+        writer.store()
+
+        return Attachment.objects.create(
+            project_id=project_id,
+            ticket_id=ticket_id,
+            comment_id=comment_id,
+            blob_id=sha256,
+            uploaded_by=user,
+            filename=filename,
+            content_type=content_type,
+            size=size,
+        )
+
+
+def collect_garbage(grace: timedelta = timedelta(hours=1)) -> int:
+    """
+    Delete blobs no attachment points at, older than `grace`.
+    Returns the number removed.
+    """
+    unreferenced = Blob.objects.filter(
+        created_at__lt=timezone.now() - grace
+    ).exclude(
+        Exists(Attachment.objects.filter(blob_id=OuterRef("sha256")))
+    )
+
+    removed = 0
+    for sha256 in unreferenced.values_list("sha256", flat=True).iterator():
+        with transaction.atomic():
+            blob = Blob.objects.select_for_update().filter(sha256=sha256).first()
+            if blob is None or Attachment.objects.filter(blob=blob).exists():
+                continue
+
+            delete_blob(sha256)
+            blob.delete()
+            removed += 1
+
+    return removed
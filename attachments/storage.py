@@ -0,0 +1,77 @@
+"""
+Content-addressed local storage for attachment blobs.
+
+Uploads are written chunk by chunk to a temporary file while the SHA-256
+is computed, then renamed to <root>/<sha[:2]>/<sha[2:4]>/<sha>. If that
+path already exists the content is already stored and the temporary file
+is dropped, so identical uploads share one file.
+
+store() and delete_blob() are called while holding the Blob row lock
+(see attachments.service), so an upload never keeps a reference to a
+file that garbage collection is removing.
+"""
+import hashlib
+import os
+import uuid
+from pathlib import Path
+
+from django.conf import settings
+
+
+class BlobTooLarge(Exception):
+    pass
+
+
+def root() -> Path:
+    return Path(settings.ATTACHMENTS_ROOT)
+
+
+def blob_path(sha256: str) -> Path:
+    return root() / sha256[:2] / sha256[2:4] / sha256
+
+
+class BlobWriter:
+    """
+    Incremental writer: write() per chunk, finish() for (sha256, size),
+    then store() to move the content into place, or discard() on
+    failure. Only one chunk is held in memory at a time.
+    """
+
+    def __init__(self, max_bytes: int | None = None):
+        self.max_bytes = max_bytes if max_bytes is not None else settings.ATTACHMENT_MAX_BYTES
+        self.digest = hashlib.sha256()
+        self.size = 0
+
+        tmp_dir = root() / "tmp"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        self.tmp_path = tmp_dir / uuid.uuid4().hex
+        self.file = open(self.tmp_path, "wb")
+
+    def write(self, chunk: bytes):
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise BlobTooLarge(f"Attachments are limited to {self.max_bytes} bytes.")
+
+        self.digest.update(chunk)
+        self.file.write(chunk)
+
+    def finish(self) -> tuple[str, int]:
+        self.file.close()
+        return self.digest.hexdigest(), self.size
+
+    def store(self):
+        path = blob_path(self.digest.hexdigest())
+
+        if path.exists():
+            self.tmp_path.unlink()
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(self.tmp_path, path)
+
+    def discard(self):
+        self.file.close()
+        self.tmp_path.unlink(missing_ok=True)
+
+
+def delete_blob(sha256: str):
+    blob_path(sha256).unlink(missing_ok=True)
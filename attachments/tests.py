@@ -0,0 +1,103 @@
+import shutil
+import tempfile
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from api.attachments.routes import download_attachment, list_ticket_attachments
+from attachments.models import Attachment, Blob
+from attachments.service import collect_garbage, save_attachment
+from attachments.storage import BlobTooLarge, BlobWriter, blob_path
+from projects.models import Project, ProjectMember
+from tickets.models import Ticket
+from users.models import User
+
+
+class AttachmentTestCase(TestCase):
+    def setUp(self):
+        storage = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, storage, ignore_errors=True)
+        settings = override_settings(ATTACHMENTS_ROOT=storage)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        self.owner = User.objects.create_user("owner@example.com", "pw", name="Owner")
+        self.project = Project.objects.create(name="Files", owner=self.owner)
+        ProjectMember.objects.create(user=self.owner, project=self.project, role="ADMIN")
+        self.ticket = Ticket.objects.create(
+            title="T", description="", project=self.project, created_by=self.owner
+        )
+
+    def upload(self, content: bytes, filename="file.txt"):
+        writer = BlobWriter()
+        writer.write(content)
+        return save_attachment(
+            writer,
+            project_id=self.project.id,
+            ticket_id=self.ticket.id,
+            comment_id=None,
+            user=self.owner,
+            filename=filename,
+            content_type="text/plain",
+        )
+
+
+class AttachmentListTests(AttachmentTestCase):
+    def test_members_see_ticket_attachments(self):
+        self.upload(b"hello")
+
+        listed = list_ticket_attachments(self.ticket.id, current_user=self.owner)
+
+        self.assertEqual([item["filename"] for item in listed], ["file.txt"])
+
+    def test_missing_ticket_is_not_found(self):
+        with self.assertRaises(HTTPException) as ctx:
+            list_ticket_attachments(999999, current_user=self.owner)
+
+        self.assertEqual(ctx.exception.status_code, 404)
+
+    def test_non_member_is_forbidden_even_without_attachments(self):
+        outsider = User.objects.create_user("out@example.com", "pw", name="Out")
+
+        with self.assertRaises(HTTPException) as ctx:
+            list_ticket_attachments(self.ticket.id, current_user=outsider)
+
+        self.assertEqual(ctx.exception.status_code, 403)
+
+
+class AttachmentStorageTests(AttachmentTestCase):
+    def test_identical_uploads_share_one_blob(self):
+        first = self.upload(b"same bytes", "a.txt")
+        second = self.upload(b"same bytes", "b.txt")
+
+        self.assertEqual(first.blob_id, second.blob_id)
+        self.assertEqual(Blob.objects.count(), 1)
+        self.assertEqual(blob_path(first.blob_id).read_bytes(), b"same bytes")
+
+    def test_garbage_collection_keeps_referenced_blobs(self):
+        kept = self.upload(b"kept")
+        dropped = self.upload(b"dropped")
+        Attachment.objects.filter(id=dropped.id).delete()
+
+        self.assertEqual(collect_garbage(grace=timedelta(0)), 1)
+        self.assertEqual(list(Blob.objects.values_list("sha256", flat=True)), [kept.blob_id])
+        self.assertFalse(blob_path(dropped.blob_id).exists())
+
+    def test_oversized_upload_is_rejected(self):
+        writer = BlobWriter(max_bytes=4)
+
+        with self.assertRaises(BlobTooLarge):
+            writer.write(b"too long")
+        writer.discard()
+
+    def test_range_request_gets_partial_content(self):
+        attachment = self.upload(b"0123456789")
+        response = download_attachment(attachment.id, current_user=self.owner)
+
+        partial = TestClient(response).get("/", headers={"Range": "bytes=2-5"})
+
+        self.assertEqual(partial.status_code, 206)
+        self.assertEqual(partial.content, b"2345")
+        self.assertEqual(partial.headers["etag"], f'"{attachment.blob_id}"')
@@ -1,6 +1,6 @@
 from django.db import models
 from users.models import User
-from tickets.models import Ticket
+from tickets.models import ArchivedTicket, Ticket
 
 # Create your models here.
 
@@ -13,4 +13,17 @@ class Comments(models.Model):
 
 
     def __str__(self):
-        return f"Comment by {self.user} on Ticket #{self.ticket.id}"
\ No newline at end of file
+        return f"Comment by {self.user} on Ticket #{self.ticket.id}"
+
+
+class ArchivedComment(models.Model):
+    """A comment of an ArchivedTicket, under its original id."""
+
+    id = models.BigIntegerField(primary_key=True)
+    comment = models.TextField()
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="+")
+    ticket = models.ForeignKey(ArchivedTicket, on_delete=models.CASCADE, related_name="comments")
+    created_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"Archived comment by {self.user_id} on Ticket #{self.ticket_id}"
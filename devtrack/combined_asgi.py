@@ -0,0 +1,28 @@
+"""
+ASGI config serving the Django admin and the FastAPI API from one app.
+
+Requests under /admin/ and /static/ go to Django; everything else,
+including lifespan events, goes to FastAPI. Uses the full settings
+so the admin apps are installed.
+
+    python -m api.server --combined
+"""
+
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'devtrack.settings')
+
+django_application = get_asgi_application()
+
+from api.main import app as api_application  # noqa: E402
+
+DJANGO_PATH_PREFIXES = ('/admin', '/static/')
+
+
+async def application(scope, receive, send):
+    if scope['type'] == 'http' and scope['path'].startswith(DJANGO_PATH_PREFIXES):
+        await django_application(scope, receive, send)
+    else:
+        await api_application(scope, receive, send)
@@ -47,6 +47,11 @@ INSTALLED_APPS = [
     'projects',
     'tickets',
     'comments',
+    'jobs',
+    'notifications',
+    'analytics',
+    'attachments',
+    'sprints',
 ]
 
 INSTALLED_APPS += ["corsheaders"]
@@ -117,6 +122,50 @@ else:
         }
     }
 
+# Optional read replica. The API sends GET requests here (see
+# devtrack.db_router and api.core.db_routing); writes, and reads by a user
+# within READ_YOUR_WRITES_SECONDS of their last write, use 'default'.
+if 'REPLICA_DATABASE_URL' in os.environ:
+    DATABASES['replica'] = dj_database_url.config(
+        env='REPLICA_DATABASE_URL',
+        conn_max_age=600,
+        conn_health_checks=True,
+    )
+    DATABASES['replica']['TEST'] = {'MIRROR': 'default'}
+    DATABASE_ROUTERS = ['devtrack.db_router.PrimaryReplicaRouter']
+
+READ_YOUR_WRITES_SECONDS = int(os.environ.get('READ_YOUR_WRITES_SECONDS', '5'))
+
+# Per-worker connection pool, sized by api.server to the worker's threadpool.
+# Django's native pool needs psycopg 3; with psycopg2 each thread keeps
+# one persistent connection (CONN_MAX_AGE) instead.
+DB_POOL_MAX_SIZE = int(os.environ.get('DB_POOL_MAX_SIZE', '0'))
+
+if DB_POOL_MAX_SIZE:
+    try:
+        import psycopg_pool  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        for database in DATABASES.values():
+            if database['ENGINE'] != 'django.db.backends.postgresql':
+                continue
+            database['CONN_MAX_AGE'] = 0
+            database.setdefault('OPTIONS', {})['pool'] = {
+                'min_size': 1,
+                'max_size': DB_POOL_MAX_SIZE,
+            }
+
+# Shared cache for every worker (read-your-writes markers, dashboard
+# caches). Without REDIS_URL each process has its own in-memory cache.
+if 'REDIS_URL' in os.environ:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+
 AUTH_USER_MODEL = "users.user"
 
 # Password validation
@@ -155,6 +204,21 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Email (notification digests)
+# Console backend locally; set EMAIL_BACKEND to the SMTP backend in production
+
+EMAIL_BACKEND = os.environ.get('EMAIL_BACKEND', 'django.core.mail.backends.console.EmailBackend')
+EMAIL_FILE_PATH = os.environ.get('EMAIL_FILE_PATH', BASE_DIR / 'sent_emails')
+DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'DevTrack <noreply@devtrack.local>')
+
+# Attachment blobs (content-addressed, see attachments.storage)
+ATTACHMENTS_ROOT = os.environ.get('ATTACHMENTS_ROOT', BASE_DIR / 'attachments_data')
+ATTACHMENT_MAX_BYTES = int(os.environ.get('ATTACHMENT_MAX_BYTES', str(100 * 1024 * 1024)))
+
+# Tickets DONE and untouched this long are moved to the archive tables
+# by the archive_tickets command / "tickets.archive_done" job
+TICKET_ARCHIVE_DAYS = int(os.environ.get('TICKET_ARCHIVE_DAYS', '90'))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -0,0 +1,24 @@
+"""
+Lean Django settings for the FastAPI process.
+
+The API only uses the ORM and password hashing, so the admin, sessions,
+messages, staticfiles and corsheaders apps are not loaded and no Django
+middleware is configured. CORS is handled by FastAPI's CORSMiddleware.
+
+Use devtrack.settings for manage.py, migrations and the admin site.
+"""
+from devtrack.settings import *  # noqa: F401,F403
+
+UNUSED_API_APPS = {
+    'django.contrib.admin',
+    'django.contrib.sessions',
+    'django.contrib.messages',
+    'django.contrib.staticfiles',
+    'corsheaders',
+}
+
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in UNUSED_API_APPS]
+
+MIDDLEWARE = []
+
+TEMPLATES = []
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from jobs.worker import Worker
+
+
+class Command(BaseCommand):
+    help = "Run the background job worker."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrency", type=int, default=4)
+        parser.add_argument("--poll-interval", type=float, default=1.0)
+        parser.add_argument(
+            "--stale-after",
+            type=int,
+            default=900,
+            help="Requeue RUNNING jobs whose lock is older than this many seconds.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit when no due jobs are left.",
+        )
+
+    def handle(self, *args, **options):
+        Worker(
+            concurrency=options["concurrency"],
+            poll_interval=options["poll_interval"],
+            stale_after=options["stale_after"],
+        ).run(once=options["once"])
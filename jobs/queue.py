@@ -0,0 +1,232 @@
+"""
+Job registry, enqueueing and claiming.
+
+Handlers are registered from each app's tasks.py:
+
+    @register("projects.purge", max_attempts=5, concurrency=2)
+    def purge(project_id): ...
+
+and enqueued from request handlers:
+
+    job = enqueue("projects.purge", {"project_id": 3}, user=current_user)
+
+Workers claim due jobs with SELECT ... FOR UPDATE SKIP LOCKED where the
+database supports it (PostgreSQL). Elsewhere (SQLite) each candidate is
+claimed with a conditional UPDATE ... WHERE status = 'QUEUED', so two
+workers can never run the same job.
+
+Per-name concurrency caps are checked while holding a row lock on the
+name's JobCap row, so concurrent claimers see each other's claims.
+Running workers refresh locked_at with heartbeat(); a job whose lock
+went stale is requeued, and the original worker's late result is
+dropped because completion is conditional on locked_by.
+"""
+import logging
+import random
+import traceback
+from datetime import timedelta
+
+from django.db import close_old_connections, connection, transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+from jobs.models import Job, JobCap
+
+logger = logging.getLogger(__name__)
+
+REGISTRY = {}
+
+BACKOFF_BASE_SECONDS = 5
+BACKOFF_MAX_SECONDS = 600
+
+
+class UnknownJob(Exception):
+    pass
+
+
+def register(name: str, max_attempts: int = 3, concurrency: int | None = None):
+    """
+    Register a job handler. `concurrency` caps how many jobs with
+    this name may run at once across all workers.
+    """
+    def decorator(func):
+        REGISTRY[name] = {
+            "func": func,
+            "max_attempts": max_attempts,
+            "concurrency": concurrency,
+        }
+        return func
+
+    return decorator
+
+
+def enqueue(name: str, payload: dict | None = None, user=None, delay: int = 0) -> Job:
+    if name not in REGISTRY:
+        raise UnknownJob(name)
+
+    return Job.objects.create(
+        name=name,
+        payload=payload or {},
+        created_by=user,
+        max_attempts=REGISTRY[name]["max_attempts"],
+        run_at=timezone.now() + timedelta(seconds=delay),
+    )
+
+
+def backoff_seconds(attempt: int) -> float:
+    delay = min(BACKOFF_BASE_SECONDS * 2 ** (attempt - 1), BACKOFF_MAX_SECONDS)
+    return delay + random.uniform(0, delay / 10)
+
+
+def running_counts() -> dict:
+    return dict(
+        Job.objects.filter(status="RUNNING")
+        .order_by()
+        .values_list("name")
+        .annotate(count=Count("id"))
+    )
+
+
+def within_limits(candidates, running: dict, limit: int):
+    """Pick up to `limit` candidates without exceeding per-name concurrency."""
+    picked = []
+    running = dict(running)
+
+    for job_id, name in candidates:
+        spec = REGISTRY.get(name)
+        cap = spec["concurrency"] if spec else None
+
+        if cap is not None and running.get(name, 0) >= cap:
+            continue
+
+        running[name] = running.get(name, 0) + 1
+        picked.append(job_id)
+
+        if len(picked) == limit:
+            break
+
+    return picked
+
+
+def capped_names(names) -> list[str]:
+    return sorted(
+        name for name in set(names)
+        if name in REGISTRY and REGISTRY[name]["concurrency"] is not None
+    )
+
+
+def lock_caps(names: list[str]):
+    """
+    Lock the JobCap rows of capped names until the transaction ends.
+    Rows are locked in name order so claimers never deadlock.
+    """
+    if not names:
+        return
+
+    JobCap.objects.bulk_create([JobCap(name=name) for name in names], ignore_conflicts=True)
+    list(
+        JobCap.objects.select_for_update()
+        .filter(name__in=names)
+        .order_by("name")
+        .values_list("name", flat=True)
+    )
+
+
+def claim_jobs(worker_id: str, limit: int) -> list[Job]:
+    now = timezone.now()
+    due = (
+        Job.objects.filter(status="QUEUED", run_at__lte=now)
+        .order_by("run_at", "id")
+    )
+    # Over-fetch so per-name concurrency caps don't starve other jobs
+    window = limit * 4
+    claim = dict(
+        status="RUNNING",
+        locked_by=worker_id,
+        locked_at=now,
+        started_at=now,
+        attempts=F("attempts") + 1,
+    )
+
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            candidates = list(
+                due.select_for_update(skip_locked=True).values_list("id", "name")[:window]
+            )
+            # Counted after the lock, so it includes claims committed by others
+            lock_caps(capped_names(name for _, name in candidates))
+            ids = within_limits(candidates, running_counts(), limit)
+            Job.objects.filter(id__in=ids).update(**claim)
+    else:
+        with transaction.atomic():
+            # SQLite: the first write takes the database write lock, which
+            # has to happen before any read in the transaction
+            lock_caps(capped_names(REGISTRY))
+            candidates = list(due.values_list("id", "name")[:window])
+            ids = [
+                job_id
+                for job_id in within_limits(candidates, running_counts(), limit)
+                if Job.objects.filter(id=job_id, status="QUEUED").update(**claim)
+            ]
+
+    return list(Job.objects.filter(id__in=ids).order_by("run_at", "id"))
+
+
+def requeue_stale(stale_after: int) -> int:
+    """Return RUNNING jobs whose worker died (lock older than stale_after seconds) to the queue."""
+    return Job.objects.filter(
+        status="RUNNING",
+        locked_at__lt=timezone.now() - timedelta(seconds=stale_after)
+    ).update(status="QUEUED", locked_by="", locked_at=None)
+
+
+def heartbeat(worker_id: str, job_ids) -> int:
+    """Refresh the locks of jobs this worker is still running."""
+    return Job.objects.filter(
+        id__in=job_ids,
+        status="RUNNING",
+        locked_by=worker_id,
+    ).update(locked_at=timezone.now())
+
+
+def finish(job: Job, **fields):
+    """Record the outcome, unless the job was requeued and reclaimed meanwhile."""
+    updated = Job.objects.filter(
+        id=job.id,
+        status="RUNNING",
+        locked_by=job.locked_by,
+    ).update(locked_by="", locked_at=None, **fields)
+
+    if not updated:
+        logger.warning("Dropping result of job %s: lock held by %s was lost", job.id, job.locked_by)
+
+
+def run_job(job: Job):
+    close_old_connections()
+    spec = REGISTRY.get(job.name)
+
+    try:
+        if spec is None:
+            raise UnknownJob(job.name)
+
+        result = spec["func"](**job.payload)
+
+    except Exception:
+        error = traceback.format_exc()
+        now = timezone.now()
+
+        if spec is not None and job.attempts < job.max_attempts:
+            finish(
+                job,
+                status="QUEUED",
+                run_at=now + timedelta(seconds=backoff_seconds(job.attempts)),
+                last_error=error,
+            )
+        else:
+            finish(job, status="FAILED", finished_at=now, last_error=error)
+
+    else:
+        finish(job, status="SUCCEEDED", result=result, finished_at=timezone.now())
+
+    finally:
+        close_old_connections()
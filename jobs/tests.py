@@ -0,0 +1,62 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from jobs import queue
+from jobs.models import Job, JobCap
+
+
+class JobQueueTests(TestCase):
+    def setUp(self):
+        patcher = mock.patch.dict(queue.REGISTRY, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        queue.register("test.capped", concurrency=1)(lambda n: n)
+        queue.register("test.free")(lambda n: n)
+
+    def test_claim_respects_concurrency_cap(self):
+        for n in range(3):
+            queue.enqueue("test.capped", {"n": n})
+        queue.enqueue("test.free", {"n": 0})
+
+        claimed = queue.claim_jobs("w1", limit=4)
+
+        self.assertEqual(sorted(job.name for job in claimed), ["test.capped", "test.free"])
+        self.assertTrue(JobCap.objects.filter(name="test.capped").exists())
+        self.assertEqual(queue.claim_jobs("w2", limit=4), [])
+
+    def test_run_job_records_result(self):
+        queue.enqueue("test.capped", {"n": 7})
+        [job] = queue.claim_jobs("w1", limit=1)
+
+        queue.run_job(job)
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.result, job.locked_by), ("SUCCEEDED", 7, ""))
+
+    def test_heartbeat_keeps_job_from_going_stale(self):
+        queue.enqueue("test.free", {"n": 1})
+        queue.enqueue("test.free", {"n": 2})
+        mine, theirs = queue.claim_jobs("w1", limit=2)
+        Job.objects.filter(id=theirs.id).update(locked_by="w2")
+        Job.objects.update(locked_at=timezone.now() - timedelta(hours=1))
+
+        self.assertEqual(queue.heartbeat("w1", [mine.id, theirs.id]), 1)
+        self.assertEqual(queue.requeue_stale(900), 1)
+        self.assertEqual(Job.objects.get(id=mine.id).status, "RUNNING")
+        self.assertEqual(Job.objects.get(id=theirs.id).status, "QUEUED")
+
+    def test_result_dropped_after_job_was_reclaimed(self):
+        queue.enqueue("test.capped", {"n": 1})
+        [stale] = queue.claim_jobs("w1", limit=1)
+        Job.objects.update(locked_at=timezone.now() - timedelta(hours=1))
+        queue.requeue_stale(900)
+        [current] = queue.claim_jobs("w2", limit=1)
+
+        queue.run_job(stale)
+
+        current.refresh_from_db()
+        self.assertEqual((current.status, current.locked_by), ("RUNNING", "w2"))
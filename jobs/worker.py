@@ -0,0 +1,71 @@
+"""
+Job worker loop: `python manage.py run_jobs`.
+
+Claims due jobs up to `concurrency` at a time and runs them on a
+thread pool, refreshing their locks every `heartbeat_interval` seconds
+so long jobs aren't requeued as stale. SIGINT/SIGTERM stop claiming
+and let running jobs finish.
+"""
+import logging
+import os
+import signal
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from jobs.queue import claim_jobs, heartbeat, requeue_stale, run_job
+
+logger = logging.getLogger(__name__)
+
+
+class Worker:
+    def __init__(
+        self,
+        concurrency: int = 4,
+        poll_interval: float = 1.0,
+        stale_after: int = 900,
+        heartbeat_interval: float | None = None,
+    ):
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+        self.heartbeat_interval = heartbeat_interval or min(60, stale_after / 3)
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.stopping = False
+
+    def stop(self, *args):
+        self.stopping = True
+
+    def run(self, once: bool = False):
+        """
+        Process jobs until stopped. With once=True, return as soon
+        as the queue has no due jobs and nothing is running.
+        """
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        running = {}
+        last_beat = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            while not self.stopping:
+                requeue_stale(self.stale_after)
+                running = {future: job_id for future, job_id in running.items() if not future.done()}
+
+                if running and time.monotonic() - last_beat >= self.heartbeat_interval:
+                    heartbeat(self.worker_id, list(running.values()))
+                    last_beat = time.monotonic()
+
+                claimed = []
+                free = self.concurrency - len(running)
+                if free:
+                    claimed = claim_jobs(self.worker_id, free)
+
+                for job in claimed:
+                    logger.info("Running job %s (%s), attempt %s", job.id, job.name, job.attempts)
+                    running[executor.submit(run_job, job)] = job.id
+
+                if once and not claimed and not running:
+                    break
+
+                if not claimed:
+                    time.sleep(self.poll_interval)
@@ -0,0 +1,71 @@
+"""
+Batched email digests of unread notifications.
+
+Delivery goes through Django's EMAIL_BACKEND, so the transport is
+pluggable: SMTP in production, the console or file backend locally
+and in tests. All digests of a batch share one backend connection.
+"""
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.utils import timezone
+
+from notifications.models import Notification
+
+DEFAULT_BATCH_SIZE = 500
+
+LINES = {
+    "ASSIGNED": '{actor} assigned you to "{title}"',
+    "COMMENTED": '{actor} commented on "{title}"',
+}
+
+
+def render_digest(user, notifications) -> EmailMessage:
+    lines = [
+        "- " + LINES[n.verb].format(
+            actor=n.actor.email if n.actor else "Someone",
+            title=n.ticket.title,
+        )
+        for n in notifications
+    ]
+
+    return EmailMessage(
+        subject=f"DevTrack: {len(notifications)} new notification(s)",
+        body="\n".join(lines),
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[user.email],
+    )
+
+
+def send_digests(batch_size: int = DEFAULT_BATCH_SIZE, connection=None) -> int:
+    """
+    Email every user their unread, not yet emailed notifications.
+    Returns the number of digests sent.
+    """
+    connection = connection or get_connection()
+    sent = 0
+
+    while True:
+        pending = list(
+            Notification.objects.filter(emailed_at__isnull=True, read_at__isnull=True)
+            .select_related("user", "actor", "ticket")
+            .order_by("id")[:batch_size]
+        )
+        if not pending:
+            break
+
+        per_user = defaultdict(list)
+        for notification in pending:
+            per_user[notification.user].append(notification)
+
+        sent += connection.send_messages([
+            render_digest(user, notifications)
+            for user, notifications in per_user.items()
+        ]) or 0
+
+        Notification.objects.filter(id__in=[n.id for n in pending]).update(
+            emailed_at=timezone.now()
+        )
+
+    return sent
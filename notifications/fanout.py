@@ -0,0 +1,99 @@
+"""
+Notification fan-out.
+
+One event (assignment, comment, bulk assignment) becomes one
+bulk_create across all recipients, plus one UPDATE per distinct
+increment on the unread counters, regardless of audience size.
+"""
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import Count, F, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from notifications.models import Notification, UnreadCounter
+
+
+def notify(verb: str, actor, targets):
+    """
+    targets: iterable of (ticket_id, recipient_ids). The actor is never
+    notified about their own action.
+    """
+    rows = [
+        Notification(user_id=user_id, actor=actor, ticket_id=ticket_id, verb=verb)
+        for ticket_id, recipient_ids in targets
+        for user_id in set(recipient_ids)
+        if user_id and user_id != actor.id
+    ]
+    if not rows:
+        return 0
+
+    with transaction.atomic():
+        Notification.objects.bulk_create(rows)
+        bump_unread(Counter(row.user_id for row in rows))
+
+    return len(rows)
+
+
+def bump_unread(increments: dict):
+    UnreadCounter.objects.bulk_create(
+        [UnreadCounter(user_id=user_id) for user_id in increments],
+        ignore_conflicts=True,
+    )
+
+    by_amount = defaultdict(list)
+    for user_id, amount in increments.items():
+        by_amount[amount].append(user_id)
+
+    for amount, user_ids in by_amount.items():
+        UnreadCounter.objects.filter(user_id__in=user_ids).update(count=F("count") + amount)
+
+
+def mark_read(user, ids=None) -> int:
+    qs = Notification.objects.filter(user=user, read_at__isnull=True)
+    if ids is not None:
+        qs = qs.filter(id__in=ids)
+
+    with transaction.atomic():
+        marked = qs.update(read_at=timezone.now())
+        if marked:
+            UnreadCounter.objects.filter(user=user).update(
+                count=Greatest(F("count") - marked, Value(0))
+            )
+
+    return marked
+
+
+def forget_tickets(ticket_ids) -> int:
+    """
+    Delete the notifications about these tickets, taking their unread
+    ones off the counters first. Returns the number deleted.
+    """
+    notifications = Notification.objects.filter(ticket_id__in=ticket_ids)
+
+    with transaction.atomic():
+        unread = Counter(dict(
+            notifications.filter(read_at__isnull=True)
+            .values("user_id")
+            .annotate(count=Count("id"))
+            .values_list("user_id", "count")
+        ))
+
+        by_amount = defaultdict(list)
+        for user_id, amount in unread.items():
+            by_amount[amount].append(user_id)
+
+        for amount, user_ids in by_amount.items():
+            UnreadCounter.objects.filter(user_id__in=user_ids).update(
+                count=Greatest(F("count") - amount, Value(0))
+            )
+
+        deleted, _ = notifications.delete()
+
+    return deleted
+
+
+def unread_count(user) -> int:
+    counter = UnreadCounter.objects.filter(user=user).values_list("count", flat=True).first()
+    return counter or 0
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from notifications.digest import DEFAULT_BATCH_SIZE, send_digests
+
+
+class Command(BaseCommand):
+    help = "Email unread notification digests through EMAIL_BACKEND."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        sent = send_digests(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Sent {sent} digest(s)"))
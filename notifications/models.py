@@ -0,0 +1,61 @@
+from django.db import models
+from tickets.models import Ticket
+from users.models import User
+
+
+class Notification(models.Model):
+    VERBS = [
+        ("ASSIGNED", "Assigned"),
+        ("COMMENTED", "Commented"),
+    ]
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="notifications"
+    )
+
+    actor = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+"
+    )
+
+    ticket = models.ForeignKey(
+        Ticket,
+        on_delete=models.CASCADE,
+        related_name="notifications"
+    )
+
+    verb = models.CharField(max_length=20, choices=VERBS)
+    created_at = models.DateTimeField(auto_now_add=True)
+    read_at = models.DateTimeField(null=True, blank=True)
+    emailed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-id"]
+        indexes = [
+            # Inbox listing: user_id = ... ORDER BY id DESC
+            models.Index(fields=["user", "-id"]),
+        ]
+
+    def __str__(self):
+        return f"{self.verb} #{self.ticket_id} -> {self.user_id}"
+
+
+class UnreadCounter(models.Model):
+    """Per-user unread notification count, kept in step by notifications.fanout."""
+
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="unread_counter"
+    )
+
+    count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.user_id}: {self.count}"
@@ -0,0 +1,7 @@
+from jobs.queue import register
+from notifications.digest import send_digests
+
+
+@register("notifications.send_digests", concurrency=1)
+def send_notification_digests():
+    return {"sent": send_digests()}
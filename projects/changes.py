@@ -0,0 +1,50 @@
+"""
+Per-project change sequence for delta sync.
+
+Every write to a ticket, comment or membership appends a ProjectChange
+row with the next seq of its project. The seq is taken by incrementing
+Project.change_seq with an UPDATE, whose row lock is held until the
+surrounding transaction commits, so a higher seq never becomes visible
+before a lower one and clients polling with `since` cannot skip a row.
+Call these after the write they describe, inside the same transaction
+where there is one.
+"""
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import F
+
+from projects.models import Project, ProjectChange
+
+
+def record_changes(kind: str, pairs, deleted: bool = False):
+    """Log (project_id, object_id) pairs of one kind."""
+    per_project = defaultdict(dict)
+    for project_id, object_id in pairs:
+        per_project[project_id][object_id] = None
+
+    # Fixed lock order across projects
+    for project_id in sorted(per_project):
+        object_ids = list(per_project[project_id])
+
+        with transaction.atomic():
+            Project.all_objects.filter(id=project_id).update(
+                change_seq=F("change_seq") + len(object_ids)
+            )
+            last = Project.all_objects.values_list("change_seq", flat=True).get(id=project_id)
+
+            first = last - len(object_ids) + 1
+            ProjectChange.objects.bulk_create([
+                ProjectChange(
+                    project_id=project_id,
+                    seq=first + i,
+                    kind=kind,
+                    object_id=object_id,
+                    deleted=deleted,
+                )
+                for i, object_id in enumerate(object_ids)
+            ])
+
+
+def record_change(project_id: int, kind: str, object_id: int, deleted: bool = False):
+    record_changes(kind, [(project_id, object_id)], deleted)
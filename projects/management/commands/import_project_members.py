@@ -0,0 +1,46 @@
+import csv
+from collections import Counter
+
+from django.core.management.base import BaseCommand, CommandError
+
+from projects.members import ROLES, bulk_add_members
+from projects.models import Project
+
+
+class Command(BaseCommand):
+    help = "Add members to a project from a CSV file with an email column and an optional role column."
+
+    def add_arguments(self, parser):
+        parser.add_argument("project_id", type=int)
+        parser.add_argument("csv_path")
+        parser.add_argument(
+            "--role",
+            default="DEV",
+            choices=sorted(ROLES),
+            help="Role for rows without a role column.",
+        )
+
+    def handle(self, *args, **options):
+        if not Project.objects.filter(id=options["project_id"]).exists():
+            raise CommandError(f"Project {options['project_id']} not found")
+
+        with open(options["csv_path"], newline="", encoding="utf-8-sig") as f:
+            reader = csv.DictReader(f)
+            if not reader.fieldnames or "email" not in reader.fieldnames:
+                raise CommandError("CSV needs an 'email' column")
+
+            invites = [
+                (row["email"], (row.get("role") or options["role"]).strip().upper())
+                for row in reader
+                if row["email"] and row["email"].strip()
+            ]
+
+        results = bulk_add_members(options["project_id"], invites)
+
+        for result in results:
+            if result["status"] != "added":
+                self.stdout.write(f"{result['email']}: {result['status']}")
+
+        totals = Counter(result["status"] for result in results)
+        summary = ", ".join(f"{count} {outcome}" for outcome, count in sorted(totals.items()))
+        self.stdout.write(self.style.SUCCESS(f"{len(results)} rows: {summary or 'nothing to do'}"))
@@ -0,0 +1,42 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from projects.models import Project
+from projects.purge import DEFAULT_BATCH_SIZE, PurgeCancelled, purge_project
+
+
+class Command(BaseCommand):
+    help = "Purge soft-deleted projects and their tickets in bounded batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+        parser.add_argument(
+            "--min-age",
+            type=int,
+            default=0,
+            help="Only purge projects deleted at least this many minutes ago.",
+        )
+        parser.add_argument("--project", type=int, help="Purge a single project.")
+
+    def handle(self, *args, **options):
+        projects = Project.all_objects.filter(
+            deleted_at__lte=timezone.now() - timedelta(minutes=options["min_age"])
+        )
+        if options["project"]:
+            projects = projects.filter(id=options["project"])
+
+        for project_id in projects.values_list("id", flat=True):
+            def progress(deleted, remaining):
+                self.stdout.write(
+                    f"project {project_id}: {deleted} tickets deleted, {remaining} remaining"
+                )
+
+            try:
+                deleted = purge_project(project_id, options["batch_size"], progress)
+            except PurgeCancelled:
+                self.stdout.write(self.style.WARNING(f"project {project_id}: restored, skipped"))
+                continue
+
+            self.stdout.write(self.style.SUCCESS(f"project {project_id}: purged {deleted} tickets"))
@@ -0,0 +1,95 @@
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+
+from projects.changes import record_changes
+from projects.models import ProjectChange, ProjectMember
+
+User = get_user_model()
+
+ROLES = {role for role, _ in ProjectMember.ROLE_CHOICES}
+
+INSERT_BATCH_SIZE = 1000
+
+
+def insert_members(members) -> set[int]:
+    """
+    Insert memberships, skipping users who are members by now (a
+    concurrent add can win the race on the unique (user, project)
+    constraint). Returns the user ids of the rows actually inserted,
+    which bulk_create(ignore_conflicts=True) cannot tell.
+    """
+    qn = connection.ops.quote_name
+    table = qn(ProjectMember._meta.db_table)
+    user, project, role = (
+        qn(ProjectMember._meta.get_field(name).column) for name in ("user", "project", "role")
+    )
+
+    inserted = set()
+    with connection.cursor() as cursor:
+        for start in range(0, len(members), INSERT_BATCH_SIZE):
+            batch = members[start:start + INSERT_BATCH_SIZE]
+            cursor.execute(
+                f"INSERT INTO {table} ({user}, {project}, {role}) "
+                f"VALUES {', '.join(['(%s, %s, %s)'] * len(batch))} "
+                f"ON CONFLICT ({user}, {project}) DO NOTHING RETURNING {user}",
+                [value for member in batch for value in (member.user_id, member.project_id, member.role)],
+            )
+            inserted.update(row[0] for row in cursor.fetchall())
+
+    return inserted
+
+
+def bulk_add_members(project_id: int, invites) -> list[dict]:
+    """
+    Add (email, role) pairs to a project in three queries: resolve the
+    emails, read the existing memberships, insert the rest. Users who
+    became members between the read and the insert are reported as
+    already_member.
+
+    Returns one {"email", "status", "user_id"} per invite, in order, with
+    status one of added, already_member, user_not_found, invalid_role or
+    duplicate (the email appeared earlier in the same batch).
+    """
+    invites = [(email.strip(), role) for email, role in invites]
+
+    users = dict(
+        User.objects.filter(email__in={email for email, _ in invites}).values_list("email", "id")
+    )
+    existing = set(
+        ProjectMember.all_objects.filter(
+            project_id=project_id,
+            user_id__in=users.values()
+        ).values_list("user_id", flat=True)
+    )
+
+    results, new_members, seen = [], [], set()
+    for email, role in invites:
+        user_id = users.get(email)
+
+        if email in seen:
+            outcome = "duplicate"
+        elif role not in ROLES:
+            outcome = "invalid_role"
+        elif user_id is None:
+            outcome = "user_not_found"
+        elif user_id in existing:
+            outcome = "already_member"
+        else:
+            outcome = "added"
+            new_members.append(ProjectMember(project_id=project_id, user_id=user_id, role=role))
+
+        seen.add(email)
+        results.append({"email": email, "status": outcome, "user_id": user_id})
+
+    with transaction.atomic():
+        inserted = insert_members(new_members)
+        record_changes(
+            ProjectChange.MEMBER,
+            [(project_id, user_id) for user_id in sorted(inserted)]
+        )
+
+    for result in results:
+        if result["status"] == "added" and result["user_id"] not in inserted:
+            result["status"] = "already_member"
+
+    return results
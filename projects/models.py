@@ -3,12 +3,35 @@ from users.models import User
 
 # Create your models here.
 
+class ActiveProjectManager(models.Manager):
+    """Hides soft-deleted projects."""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
+
+
+class ActiveMemberManager(models.Manager):
+    """Hides memberships of soft-deleted projects, so access checks fail for them."""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(project__deleted_at__isnull=True)
+
+
 class Project(models.Model):
     name = models.CharField(max_length=200)
     description = models.TextField(blank=True)
     owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name="owned_prjects")
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # Set on delete; rows are removed later by projects.purge
+    deleted_at = models.DateTimeField(null=True, blank=True, db_index=True)
+
+    # Last ProjectChange.seq handed out; bumped by projects.changes
+    change_seq = models.PositiveBigIntegerField(default=0)
+
+    objects = ActiveProjectManager()
+    all_objects = models.Manager()
+
     def __str__(self):
         return self.name
     
@@ -23,8 +46,42 @@ class ProjectMember(models.Model):
     project = models.ForeignKey(Project, on_delete=models.CASCADE)
     role = models.CharField(max_length=20, choices=ROLE_CHOICES)
 
+    objects = ActiveMemberManager()
+    all_objects = models.Manager()
+
     class Meta:
         unique_together = ("user", "project")
 
     def __str__(self):
-        return f"{self.user.email} -> {self.project.name} ({self.role})"
\ No newline at end of file
+        return f"{self.user.email} -> {self.project.name} ({self.role})"
+
+
+class ProjectChange(models.Model):
+    """
+    Append-only log of writes to a project's tickets, comments and
+    memberships, numbered per project. Clients sync by asking for
+    everything after the last seq they saw.
+    """
+    TICKET = "ticket"
+    COMMENT = "comment"
+    MEMBER = "member"
+
+    KIND_CHOICES = (
+        (TICKET, "Ticket"),
+        (COMMENT, "Comment"),
+        (MEMBER, "Member"),
+    )
+
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="changes")
+    seq = models.PositiveBigIntegerField()
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    # Ticket or comment id; user id for memberships
+    object_id = models.PositiveBigIntegerField()
+    deleted = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ("project", "seq")
+
+    def __str__(self):
+        return f"{self.project_id}#{self.seq} {self.kind} {self.object_id}"
@@ -0,0 +1,173 @@
+"""
+Background purge of soft-deleted projects.
+
+Tickets, then the rows of every other table that cascades from the
+project (status transitions, change log, archive, attachments, ...),
+are removed in bounded batches, each in its own transaction,
+using raw DELETE ... WHERE id IN (...) statements instead of Django's
+cascade collector (which loads every related row into memory). Rows
+that reference a ticket are found from the model metadata, so new
+models with a ForeignKey to Ticket are purged without changes here.
+
+Notifications about purged tickets are taken off the recipients'
+unread counters in the same transaction as each ticket batch.
+
+Restoring the project (clearing deleted_at) cancels a running purge
+at the next batch boundary. Runs as the "projects.purge" job
+(see projects/tasks.py).
+"""
+import logging
+
+from django.db import connection, models, transaction
+
+from notifications.fanout import forget_tickets
+from projects.models import Project
+from tickets.models import Ticket
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+
+
+class PurgeCancelled(Exception):
+    pass
+
+
+def chunks(ids, size):
+    for start in range(0, len(ids), size):
+        yield ids[start:start + size]
+
+
+def delete_rows(cursor, model, ids, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Delete model rows by primary key, handling reverse foreign keys first:
+    CASCADE children are deleted recursively, SET_NULL columns are cleared.
+    Returns the number of `model` rows deleted.
+    """
+    if not ids:
+        return 0
+
+    qn = connection.ops.quote_name
+    deleted = 0
+
+    for chunk in chunks(list(ids), batch_size):
+        placeholders = ", ".join(["%s"] * len(chunk))
+
+        for rel in model._meta.get_fields(include_hidden=True):
+            if not (rel.auto_created and not rel.concrete and (rel.one_to_many or rel.one_to_one)):
+                continue
+
+            child = rel.related_model
+            table = qn(child._meta.db_table)
+            column = qn(rel.field.column)
+
+            if rel.on_delete is models.CASCADE:
+                cursor.execute(
+                    f"SELECT {qn(child._meta.pk.column)} FROM {table} WHERE {column} IN ({placeholders})",
+                    chunk,
+                )
+                child_ids = [row[0] for row in cursor.fetchall()]
+                delete_rows(cursor, child, child_ids, batch_size)
+
+            elif rel.on_delete is models.SET_NULL:
+                cursor.execute(
+                    f"UPDATE {table} SET {column} = NULL WHERE {column} IN ({placeholders})",
+                    chunk,
+                )
+
+            elif rel.on_delete is not models.DO_NOTHING:
+                raise ValueError(
+                    f"Cannot purge {model.__name__}: unsupported on_delete for {child.__name__}.{rel.field.name}"
+                )
+
+        cursor.execute(
+            f"DELETE FROM {qn(model._meta.db_table)} WHERE {qn(model._meta.pk.column)} IN ({placeholders})",
+            chunk,
+        )
+        deleted += cursor.rowcount
+
+    return deleted
+
+
+def is_still_deleted(project_id: int) -> bool:
+    return Project.all_objects.filter(id=project_id, deleted_at__isnull=False).exists()
+
+
+def cascading_children():
+    """(model, field) of every foreign key that cascades from Project."""
+    return [
+        (rel.related_model, rel.field)
+        for rel in Project._meta.get_fields(include_hidden=True)
+        if rel.auto_created and not rel.concrete and rel.one_to_many
+        and rel.on_delete is models.CASCADE
+    ]
+
+
+def purge_rows(project_id: int, model, field, batch_size: int) -> int:
+    """Delete `model` rows of the project a batch per transaction."""
+    deleted = 0
+
+    while True:
+        if not is_still_deleted(project_id):
+            raise PurgeCancelled(f"Project {project_id} is no longer marked deleted.")
+
+        ids = list(
+            model._base_manager.filter(**{field.name: project_id})
+            .order_by("pk")
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not ids:
+            return deleted
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            deleted += delete_rows(cursor, model, ids, batch_size)
+
+
+def purge_project(project_id: int, batch_size: int = DEFAULT_BATCH_SIZE, progress=None) -> int:
+    """
+    Remove a soft-deleted project with its tickets, comments and members.
+    `progress(deleted, remaining)` is called after each batch.
+    Returns the number of tickets deleted; raises PurgeCancelled if the
+    project was restored meanwhile.
+    """
+    deleted_tickets = 0
+
+    while True:
+        if not is_still_deleted(project_id):
+            raise PurgeCancelled(f"Project {project_id} is no longer marked deleted.")
+
+        ticket_ids = list(
+            Ticket.objects.filter(project_id=project_id)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+
+        if not ticket_ids:
+            break
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            forget_tickets(ticket_ids)
+            deleted_tickets += delete_rows(cursor, Ticket, ticket_ids, batch_size)
+
+        if progress:
+            progress(deleted_tickets, Ticket.objects.filter(project_id=project_id).count())
+
+    # Everything else hanging off the project, so the final delete stays small
+    for model, field in cascading_children():
+        purge_rows(project_id, model, field, batch_size)
+
+    with transaction.atomic():
+        project = (
+            Project.all_objects.select_for_update()
+            .filter(id=project_id, deleted_at__isnull=False)
+            .first()
+        )
+        if project is None:
+            raise PurgeCancelled(f"Project {project_id} is no longer marked deleted.")
+
+        with connection.cursor() as cursor:
+            delete_rows(cursor, Project, [project_id], batch_size)
+
+    logger.info("Purged project %s (%s tickets)", project_id, deleted_tickets)
+    return deleted_tickets
+
@@ -0,0 +1,12 @@
+from jobs.queue import register
+from projects.purge import PurgeCancelled, purge_project
+
+
+@register("projects.purge", max_attempts=5, concurrency=2)
+def purge(project_id: int):
+    try:
+        deleted = purge_project(project_id)
+    except PurgeCancelled:
+        return {"cancelled": True}
+
+    return {"deleted_tickets": deleted}
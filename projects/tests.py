@@ -1,3 +1,346 @@
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
 from django.test import TestCase
+from django.utils import timezone
+from fastapi import HTTPException
+
+from api.comments.routes import create_comment
+from api.comments.schemas import CommentCreate
+from api.projects.routes import (
+    bulk_add_project_members,
+    get_project_board,
+    get_project_changes,
+    list_my_projects_overview,
+)
+from api.projects.schemas import BulkAddProjectMembers
+from api.tickets.routes import create_ticket, delete_ticket
+from api.tickets.schemas import TicketCreate
+from notifications.fanout import notify, unread_count
+from projects import members, purge
+from projects.changes import record_change
+from projects.models import Project, ProjectChange, ProjectMember
+from tickets.archive import archive_done_tickets, restore_ticket
+from tickets.models import ArchivedTicket, Label, StatusTransition, Ticket, TicketLabel
+from users.models import User
+
+
+class ProjectBoardTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user("owner@example.com", "pw", name="Owner")
+        self.dev = User.objects.create_user("dev@example.com", "pw", name="Dev")
+        self.project = Project.objects.create(name="Board", owner=self.owner)
+        ProjectMember.objects.create(user=self.owner, project=self.project, role="ADMIN")
+        ProjectMember.objects.create(user=self.dev, project=self.project, role="DEV")
+
+    def add_tickets(self, count, status):
+        Ticket.objects.bulk_create([
+            Ticket(
+                title=f"{status} {i}",
+                description="",
+                status=status,
+                order=i,
+                project=self.project,
+                created_by=self.owner,
+                assigned_to=self.dev,
+            )
+            for i in range(count)
+        ])
+
+    def test_board_query_count_is_fixed(self):
+        self.add_tickets(3, "TODO")
+        self.add_tickets(2, "DONE")
+
+        with self.assertNumQueries(5):
+            small = get_project_board(self.project.id, per_column=200, current_user=self.owner)
+
+        self.add_tickets(20, "IN_PROGRESS")
+        label = Label.objects.create(project=self.project, name="bug")
+        TicketLabel.objects.bulk_create([
+            TicketLabel(ticket=ticket, label=label)
+            for ticket in Ticket.objects.filter(project=self.project)
+        ])
+
+        with self.assertNumQueries(5):
+            large = get_project_board(self.project.id, per_column=200, current_user=self.owner)
+
+        self.assertEqual(len(small["members"]), 2)
+        self.assertEqual(
+            [column["count"] for column in large["columns"]],
+            [3, 20, 2],
+        )
+        self.assertEqual(large["columns"][1]["tickets"][0]["labels"][0]["name"], "bug")
+
+    def test_columns_are_capped_and_ordered(self):
+        self.add_tickets(5, "TODO")
+
+        board = get_project_board(self.project.id, per_column=2, current_user=self.owner)
+        todo = board["columns"][0]
+
+        self.assertEqual(todo["count"], 5)
+        self.assertEqual([ticket["order"] for ticket in todo["tickets"]], [0, 1])
+        self.assertEqual(todo["tickets"][0]["assigned_to_email"], "dev@example.com")
+
+
+class ProjectOverviewTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user("owner@example.com", "pw", name="Owner")
+        self.dev = User.objects.create_user("dev@example.com", "pw", name="Dev")
+
+    def add_project(self, name, statuses=(), member=True):
+        project = Project.objects.create(name=name, owner=self.owner)
+        ProjectMember.objects.create(user=self.dev, project=project, role="DEV")
+        if member:
+            ProjectMember.objects.create(user=self.owner, project=project, role="ADMIN")
+        Ticket.objects.bulk_create([
+            Ticket(title=f"T{i}", description="", status=status, project=project, created_by=self.owner)
+            for i, status in enumerate(statuses)
+        ])
+        return project
+
+    def overview(self, limit=50, offset=0):
+        return list_my_projects_overview(limit=limit, offset=offset, current_user=self.owner)
+
+    def test_overview_query_count_is_fixed(self):
+        self.add_project("Alpha", ["TODO", "DONE"])
+
+        with self.assertNumQueries(2):
+            small = self.overview()
+
+        self.add_project("Beta", ["TODO", "IN_PROGRESS", "DONE", "DONE"])
+        self.add_project("Gamma")
+        for i in range(10):
+            self.add_project(f"Other {i}", ["TODO"])
+        self.add_project("Foreign", ["TODO"], member=False)
+        deleted = self.add_project("Deleted", ["TODO"])
+        Project.all_objects.filter(id=deleted.id).update(deleted_at=timezone.now())
+
+        with self.assertNumQueries(2):
+            large = self.overview(limit=3)
+
+        self.assertEqual(small["total"], 1)
+        self.assertEqual(large["total"], 13)
+        self.assertEqual(
+            [
+                (p["name"], p["ticket_count"], p["open_ticket_count"], p["member_count"])
+                for p in large["results"]
+            ],
+            [("Alpha", 2, 1, 2), ("Beta", 4, 2, 2), ("Gamma", 0, 0, 2)],
+        )
+        self.assertEqual(
+            [p["name"] for p in self.overview(limit=3, offset=12)["results"]],
+            ["Other 9"],
+        )
+
+
+class ProjectPurgeTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user("owner@example.com", "pw", name="Owner")
+        self.project = Project.objects.create(name="Doomed", owner=self.owner)
+        ProjectMember.objects.create(user=self.owner, project=self.project, role="ADMIN")
+
+        for i in range(5):
+            ticket = Ticket.objects.create(
+                title=f"T{i}", description="", project=self.project, created_by=self.owner
+            )
+            StatusTransition.objects.create(ticket=ticket, project=self.project, to_status="TODO")
+            record_change(self.project.id, ProjectChange.TICKET, ticket.id)
+            ArchivedTicket.objects.create(
+                id=1000 + i, title=f"A{i}", description="", project=self.project,
+                created_by=self.owner, created_at=timezone.now(), updated_at=timezone.now(),
+            )
+        Label.objects.create(project=self.project, name="bug")
+
+        self.dev = User.objects.create_user("dev@example.com", "pw", name="Dev")
+        notify("ASSIGNED", self.owner, [(t.id, [self.dev.id]) for t in Ticket.objects.all()])
+
+        Project.all_objects.filter(id=self.project.id).update(deleted_at=timezone.now())
+
+    def test_children_are_purged_in_batches_before_the_project(self):
+        final_batches = []
+        delete_rows = purge.delete_rows
+
+        def spy(cursor, model, ids, batch_size=purge.DEFAULT_BATCH_SIZE):
+            if model is Project:
+                # Only the project row itself is left for the last transaction
+                final_batches.append((
+                    StatusTransition.objects.count(),
+                    ProjectChange.objects.count(),
+                    ArchivedTicket.objects.count(),
+                ))
+            return delete_rows(cursor, model, ids, batch_size)
+
+        with mock.patch.object(purge, "delete_rows", side_effect=spy):
+            self.assertEqual(purge.purge_project(self.project.id, batch_size=2), 5)
+
+        self.assertEqual(final_batches, [(0, 0, 0)])
+        self.assertFalse(Project.all_objects.filter(id=self.project.id).exists())
+        self.assertFalse(Label.objects.exists())
+        self.assertEqual(unread_count(self.dev), 0)
+
+
+class ProjectChangeFeedTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user("owner@example.com", "pw", name="Owner")
+        self.project = Project.objects.create(name="Feed", owner=self.owner)
+        ProjectMember.objects.create(user=self.owner, project=self.project, role="ADMIN")
+
+    def add_ticket(self, title, status="TODO"):
+        data = TicketCreate(title=title, description="", status=status, project_id=self.project.id)
+        return create_ticket(data, current_user=self.owner)["id"]
+
+    def add_comment(self, ticket_id):
+        data = CommentCreate(comment="note", ticket_id=ticket_id)
+        return create_comment(ticket_id, data, current_user=self.owner)["id"]
+
+    def changes(self, since=0, limit=500):
+        return get_project_changes(self.project.id, since=since, limit=limit, current_user=self.owner)
+
+    def test_changes_follow_seq_order(self):
+        first = self.add_ticket("First")
+        start = self.changes()["seq"]
+        second = self.add_ticket("Second")
+        comment = self.add_comment(first)
+
+        everything = self.changes()
+        later = self.changes(since=start)
+
+        entries = ProjectChange.objects.filter(project=self.project).order_by("seq")
+        self.assertEqual(
+            list(entries.values_list("kind", "object_id")),
+            [(ProjectChange.TICKET, first), (ProjectChange.TICKET, second), (ProjectChange.COMMENT, comment)],
+        )
+        self.assertEqual(everything["seq"], 3)
+        self.assertEqual(sorted(t["id"] for t in everything["tickets"]), [first, second])
+        self.assertEqual((later["since"], later["seq"]), (start, 3))
+        self.assertEqual([t["id"] for t in later["tickets"]], [second])
+        self.assertEqual([c["id"] for c in later["comments"]], [comment])
+        self.assertEqual(self.changes(since=3)["seq"], 3)
+
+    def test_pages_cover_every_change_once(self):
+        ids = [self.add_ticket(f"T{i}") for i in range(5)]
+
+        seen, since, pages = [], 0, []
+        while True:
+            page = self.changes(since=since, limit=2)
+            pages.append((page["since"], page["seq"], page["has_more"]))
+            seen += [t["id"] for t in page["tickets"]]
+            since = page["seq"]
+            if not page["has_more"]:
+                break
+
+        self.assertEqual(pages, [(0, 2, True), (2, 4, True), (4, 5, False)])
+        self.assertEqual(sorted(seen), ids)
+
+    def test_deleted_and_archived_tickets_become_tombstones(self):
+        deleted = self.add_ticket("Deleted")
+        comment = self.add_comment(deleted)
+        archived = self.add_ticket("Archived", status="DONE")
+        kept = self.add_ticket("Kept")
+        start = self.changes()["seq"]
+
+        delete_ticket(deleted, current_user=self.owner)
+        archive_done_tickets(older_than_days=0)
+
+        feed = self.changes()
+        self.assertEqual([t["id"] for t in feed["tickets"]], [kept])
+        self.assertEqual(
+            feed["deleted"],
+            {"tickets": [deleted, archived], "comments": [comment], "members": []},
+        )
+        self.assertEqual(self.changes(since=start)["deleted"]["tickets"], [deleted, archived])
+
+        restore_ticket(archived)
+        since_restore = self.changes(since=feed["seq"])
+        self.assertEqual([t["id"] for t in since_restore["tickets"]], [archived])
+        self.assertEqual(since_restore["deleted"]["tickets"], [])
+
+    def test_non_members_are_refused(self):
+        outsider = User.objects.create_user("outsider@example.com", "pw", name="Outsider")
+
+        with self.assertRaises(HTTPException) as ctx:
+            get_project_changes(self.project.id, since=0, limit=500, current_user=outsider)
+
+        self.assertEqual(ctx.exception.status_code, 403)
+
+
+class ProjectMemberImportTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user("owner@example.com", "pw", name="Owner")
+        self.project = Project.objects.create(name="Team", owner=self.owner)
+        ProjectMember.objects.create(user=self.owner, project=self.project, role="ADMIN")
+
+        self.dev = User.objects.create_user("dev@example.com", "pw", name="Dev")
+        self.old = User.objects.create_user("old@example.com", "pw", name="Old")
+        self.late = User.objects.create_user("late@example.com", "pw", name="Late")
+        ProjectMember.objects.create(user=self.old, project=self.project, role="DEV")
+
+        # late@ is added by someone else between the membership read and the insert
+        insert_members = members.insert_members
+
+        def racing_insert(new_members):
+            ProjectMember.objects.create(user=self.late, project=self.project, role="VIEWER")
+            return insert_members(new_members)
+
+        patcher = mock.patch.object(members, "insert_members", side_effect=racing_insert)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def assert_only_dev_was_added(self):
+        self.assertEqual(
+            list(ProjectChange.objects.filter(project=self.project).values_list("kind", "object_id")),
+            [(ProjectChange.MEMBER, self.dev.id)],
+        )
+        self.assertEqual(
+            ProjectMember.objects.get(project=self.project, user=self.late).role, "VIEWER"
+        )
+
+    def test_bulk_endpoint_reports_only_created_rows(self):
+        data = BulkAddProjectMembers(members=[
+            {"email": email, "role": "DEV"}
+            for email in ("dev@example.com", "old@example.com", "ghost@example.com",
+                          "dev@example.com", "late@example.com")
+        ])
+
+        response = bulk_add_project_members(self.project.id, data, current_user=self.owner)
+
+        self.assertEqual(response["added"], 1)
+        self.assertEqual(
+            [(result["email"], result["status"]) for result in response["results"]],
+            [
+                ("dev@example.com", "added"),
+                ("old@example.com", "already_member"),
+                ("ghost@example.com", "user_not_found"),
+                ("dev@example.com", "duplicate"),
+                ("late@example.com", "already_member"),
+            ],
+        )
+        self.assert_only_dev_was_added()
+
+    def test_csv_import_logs_only_created_rows(self):
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, "w", newline="") as f:
+            f.write(
+                "email,role\n"
+                "dev@example.com,dev\n"
+                "old@example.com,\n"
+                "ghost@example.com,viewer\n"
+                "late@example.com,\n"
+                "new@example.com,owner\n"
+            )
+
+        out = StringIO()
+        call_command("import_project_members", self.project.id, path, stdout=out)
 
-# Create your tests here.
+        self.assertEqual(out.getvalue().splitlines(), [
+            "old@example.com: already_member",
+            "ghost@example.com: user_not_found",
+            "late@example.com: already_member",
+            "new@example.com: invalid_role",
+            "5 rows: 1 added, 2 already_member, 1 invalid_role, 1 user_not_found",
+        ])
+        self.assert_only_dev_was_added()
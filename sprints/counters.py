@@ -0,0 +1,216 @@
+"""
+Sprint counters, maintained on ticket writes.
+
+Every path that moves tickets in or out of a sprint, changes their
+status or deletes them reports it here, and the sprint's per-status
+counters (plus, once it has started, its added/removed scope counters)
+are adjusted with F() updates. Boards and progress then read one row
+instead of counting tickets. Closed sprints are left untouched so their
+numbers stay as they were at close.
+"""
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from sprints.models import Sprint
+from tickets.models import Ticket
+
+STATUS_FIELDS = {
+    "TODO": "todo_count",
+    "IN_PROGRESS": "in_progress_count",
+    "DONE": "done_count",
+}
+
+SCOPE_FIELDS = ("added_count", "removed_count")
+
+
+class SprintError(Exception):
+    pass
+
+
+def apply_deltas(deltas):
+    """deltas: {sprint_id: Counter(counter field -> change)}"""
+    for sprint_id, counts in deltas.items():
+        status_changes = {
+            field: F(field) + change
+            for field, change in counts.items()
+            if change and field not in SCOPE_FIELDS
+        }
+        if status_changes:
+            Sprint.objects.filter(id=sprint_id).exclude(state=Sprint.CLOSED).update(**status_changes)
+
+        scope_changes = {
+            field: F(field) + counts[field]
+            for field in SCOPE_FIELDS
+            if counts[field]
+        }
+        if scope_changes:
+            Sprint.objects.filter(id=sprint_id, state=Sprint.ACTIVE).update(**scope_changes)
+
+
+def count_moves(moves):
+    """moves: (old_sprint_id, new_sprint_id, status) per ticket; None is the backlog."""
+    deltas = defaultdict(Counter)
+
+    for old_sprint_id, new_sprint_id, status in moves:
+        if old_sprint_id == new_sprint_id:
+            continue
+
+        field = STATUS_FIELDS.get(status)
+        if old_sprint_id is not None:
+            if field:
+                deltas[old_sprint_id][field] -= 1
+            deltas[old_sprint_id]["removed_count"] += 1
+        if new_sprint_id is not None:
+            if field:
+                deltas[new_sprint_id][field] += 1
+            deltas[new_sprint_id]["added_count"] += 1
+
+    apply_deltas(deltas)
+
+
+def apply_status_changes(transitions):
+    """transitions: (ticket_id, from_status, to_status) of existing tickets."""
+    sprints = dict(
+        Ticket.objects
+        .filter(id__in={ticket_id for ticket_id, _, _ in transitions}, sprint__isnull=False)
+        .values_list("id", "sprint_id")
+    )
+    if not sprints:
+        return
+
+    deltas = defaultdict(Counter)
+    for ticket_id, from_status, to_status in transitions:
+        sprint_id = sprints.get(ticket_id)
+        if sprint_id is None or from_status == to_status:
+            continue
+
+        if from_status in STATUS_FIELDS:
+            deltas[sprint_id][STATUS_FIELDS[from_status]] -= 1
+        if to_status in STATUS_FIELDS:
+            deltas[sprint_id][STATUS_FIELDS[to_status]] += 1
+
+    apply_deltas(deltas)
+
+
+def tickets_deleted(ticket_ids):
+    """Call before deleting or archiving tickets."""
+    count_moves(
+        (sprint_id, None, status)
+        for sprint_id, status in Ticket.objects
+        .filter(id__in=ticket_ids, sprint__isnull=False)
+        .values_list("sprint_id", "status")
+    )
+
+
+def validate_sprint(project_id: int, sprint_id: int | None):
+    """Raise SprintError unless tickets of `project_id` can join `sprint_id`."""
+    if sprint_id is None:
+        return
+
+    sprint = Sprint.objects.filter(id=sprint_id).values("project_id", "state").first()
+    if sprint is None:
+        raise SprintError("Sprint not found.")
+
+    if sprint["project_id"] != project_id:
+        raise SprintError("Sprint must belong to the ticket's project.")
+
+    if sprint["state"] == Sprint.CLOSED:
+        raise SprintError("Tickets cannot be added to a closed sprint.")
+
+
+def move_tickets(ticket_ids, sprint_id: int | None) -> list[int]:
+    """Move tickets into `sprint_id` (None: backlog). Returns the ids that moved."""
+    with transaction.atomic():
+        rows = list(
+            Ticket.objects.select_for_update()
+            .filter(id__in=ticket_ids)
+            .exclude(sprint_id=sprint_id)
+            .values_list("id", "sprint_id", "status")
+        )
+        moved = [ticket_id for ticket_id, _, _ in rows]
+
+        Ticket.objects.filter(id__in=moved).update(
+            sprint_id=sprint_id,
+            version=F("version") + 1,
+            updated_at=timezone.now()
+        )
+        count_moves((old_sprint_id, sprint_id, status) for _, old_sprint_id, status in rows)
+
+    return moved
+
+
+def start_sprint(sprint_id: int) -> Sprint:
+    """Activate a planned sprint and snapshot its scope."""
+    with transaction.atomic():
+        sprint = Sprint.objects.select_for_update().get(id=sprint_id)
+
+        if sprint.state != Sprint.PLANNED:
+            raise SprintError("Only a planned sprint can be started.")
+
+        if Sprint.objects.filter(project_id=sprint.project_id, state=Sprint.ACTIVE).exists():
+            raise SprintError("Another sprint of this project is already active.")
+
+        sprint.committed_ticket_ids = list(
+            Ticket.objects.filter(sprint_id=sprint.id).order_by("id").values_list("id", flat=True)
+        )
+        sprint.committed_count = sprint.ticket_count
+        sprint.committed_done_count = sprint.done_count
+        sprint.state = Sprint.ACTIVE
+        sprint.started_at = timezone.now()
+        sprint.save(update_fields=[
+            "committed_ticket_ids", "committed_count", "committed_done_count",
+            "state", "started_at",
+        ])
+
+    return sprint
+
+
+def close_sprint(sprint_id: int, move_open_to: int | None = None) -> tuple[Sprint, list[int]]:
+    """
+    Close an active sprint, freezing its counters, and move its
+    unfinished tickets to `move_open_to` (None: backlog).
+    Returns the sprint and the moved ticket ids.
+    """
+    with transaction.atomic():
+        sprint = Sprint.objects.select_for_update().get(id=sprint_id)
+
+        if sprint.state != Sprint.ACTIVE:
+            raise SprintError("Only an active sprint can be closed.")
+
+        if move_open_to is not None:
+            if move_open_to == sprint.id:
+                raise SprintError("Unfinished tickets must move to another sprint.")
+            validate_sprint(sprint.project_id, move_open_to)
+
+        sprint.state = Sprint.CLOSED
+        sprint.closed_at = timezone.now()
+        sprint.save(update_fields=["state", "closed_at"])
+
+        open_ids = list(
+            Ticket.objects.filter(sprint_id=sprint.id).exclude(status="DONE").values_list("id", flat=True)
+        )
+        moved = move_tickets(open_ids, move_open_to)
+
+    return sprint, moved
+
+
+def progress(sprint: Sprint, today=None) -> dict:
+    """Remaining work, completion and scope change, from the counters alone."""
+    today = today or timezone.localdate()
+    total = sprint.ticket_count
+
+    return {
+        "total": total,
+        "done": sprint.done_count,
+        "remaining": sprint.remaining_count,
+        "completion_percent": round(100 * sprint.done_count / total, 1) if total else 0.0,
+        "committed": sprint.committed_count,
+        "committed_done": sprint.committed_done_count,
+        "added": sprint.added_count,
+        "removed": sprint.removed_count,
+        "days_total": (sprint.end_date - sprint.start_date).days + 1,
+        "days_left": max((sprint.end_date - today).days + 1, 0) if sprint.state != Sprint.CLOSED else 0,
+    }
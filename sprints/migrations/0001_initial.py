@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('projects', '0003_project_change_seq'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Sprint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('goal', models.TextField(blank=True)),
+                ('start_date', models.DateField()),
+                ('end_date', models.DateField()),
+                ('state', models.CharField(choices=[('PLANNED', 'Planned'), ('ACTIVE', 'Active'), ('CLOSED', 'Closed')], default='PLANNED', max_length=20)),
+                ('todo_count', models.IntegerField(default=0)),
+                ('in_progress_count', models.IntegerField(default=0)),
+                ('done_count', models.IntegerField(default=0)),
+                ('committed_count', models.IntegerField(default=0)),
+                ('committed_done_count', models.IntegerField(default=0)),
+                ('committed_ticket_ids', models.JSONField(blank=True, default=list)),
+                ('added_count', models.IntegerField(default=0)),
+                ('removed_count', models.IntegerField(default=0)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('closed_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sprints', to='projects.project')),
+            ],
+            options={
+                'ordering': ['start_date', 'id'],
+                'indexes': [models.Index(fields=['project', 'state'], name='sprints_spr_project_a5ed24_idx')],
+            },
+        ),
+    ]
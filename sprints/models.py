@@ -0,0 +1,68 @@
+from django.db import models
+
+from projects.models import Project
+
+
+class Sprint(models.Model):
+    """
+    A project iteration / milestone. Tickets join through Ticket.sprint.
+
+    The per-status counters are maintained on ticket writes by
+    sprints.counters, so boards and progress never count tickets.
+    Starting a sprint snapshots its scope (committed_*); tickets joining
+    or leaving afterwards are counted in added_count / removed_count.
+    Counters freeze when the sprint is closed.
+    """
+    PLANNED = "PLANNED"
+    ACTIVE = "ACTIVE"
+    CLOSED = "CLOSED"
+
+    STATES = [
+        (PLANNED, "Planned"),
+        (ACTIVE, "Active"),
+        (CLOSED, "Closed"),
+    ]
+
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name="sprints"
+    )
+
+    name = models.CharField(max_length=100)
+    goal = models.TextField(blank=True)
+    start_date = models.DateField()
+    end_date = models.DateField()
+    state = models.CharField(max_length=20, choices=STATES, default=PLANNED)
+
+    todo_count = models.IntegerField(default=0)
+    in_progress_count = models.IntegerField(default=0)
+    done_count = models.IntegerField(default=0)
+
+    # Scope snapshot taken by start_sprint()
+    committed_count = models.IntegerField(default=0)
+    committed_done_count = models.IntegerField(default=0)
+    committed_ticket_ids = models.JSONField(default=list, blank=True)
+    added_count = models.IntegerField(default=0)
+    removed_count = models.IntegerField(default=0)
+
+    started_at = models.DateTimeField(null=True, blank=True)
+    closed_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["start_date", "id"]
+        indexes = [
+            models.Index(fields=["project", "state"]),
+        ]
+
+    @property
+    def ticket_count(self) -> int:
+        return self.todo_count + self.in_progress_count + self.done_count
+
+    @property
+    def remaining_count(self) -> int:
+        return self.todo_count + self.in_progress_count
+
+    def __str__(self):
+        return f"{self.name} ({self.state})"
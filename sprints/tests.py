@@ -0,0 +1,93 @@
+from datetime import date
+
+from django.test import TestCase
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from api.sprints.routes import update_sprint
+from api.sprints.schemas import SprintUpdate
+from api.tickets.routes import apply_ticket_update, delete_ticket
+from api.tickets.schemas import TicketUpdate
+from projects.models import Project, ProjectMember
+from sprints.counters import SprintError, close_sprint, move_tickets, progress, start_sprint
+from sprints.models import Sprint
+from tickets.models import Ticket
+from users.models import User
+
+
+class SprintTestCase(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user("owner@example.com", "pw", name="Owner")
+        self.project = Project.objects.create(name="Sprints", owner=self.owner)
+        ProjectMember.objects.create(user=self.owner, project=self.project, role="ADMIN")
+        self.sprint = Sprint.objects.create(
+            project=self.project, name="S1", start_date=date(2026, 1, 5), end_date=date(2026, 1, 16)
+        )
+        self.tickets = [
+            Ticket.objects.create(title=f"T{i}", description="", project=self.project, created_by=self.owner)
+            for i in range(3)
+        ]
+
+
+class SprintCounterTests(SprintTestCase):
+    def test_counters_follow_moves_status_changes_and_deletes(self):
+        first, second, third = (ticket.id for ticket in self.tickets)
+        move_tickets([first, second, third], self.sprint.id)
+        apply_ticket_update(first, TicketUpdate(status="DONE"), self.owner, None)
+        apply_ticket_update(second, TicketUpdate(status="IN_PROGRESS"), self.owner, None)
+        delete_ticket(third, current_user=self.owner)
+
+        self.sprint.refresh_from_db()
+        self.assertEqual(
+            (self.sprint.todo_count, self.sprint.in_progress_count, self.sprint.done_count),
+            (0, 1, 1),
+        )
+
+    def test_scope_change_is_counted_after_start(self):
+        first, second, third = (ticket.id for ticket in self.tickets)
+        move_tickets([first, second], self.sprint.id)
+        start_sprint(self.sprint.id)
+        move_tickets([third], self.sprint.id)
+        move_tickets([first], None)
+        apply_ticket_update(second, TicketUpdate(status="DONE"), self.owner, None)
+
+        self.sprint.refresh_from_db()
+        result = progress(self.sprint, today=date(2026, 1, 14))
+        self.assertEqual(
+            {key: result[key] for key in ("total", "done", "committed", "added", "removed", "days_left")},
+            {"total": 2, "done": 1, "committed": 2, "added": 1, "removed": 1, "days_left": 3},
+        )
+
+    def test_close_moves_unfinished_tickets_to_the_backlog(self):
+        first, second, _ = (ticket.id for ticket in self.tickets)
+        move_tickets([first, second], self.sprint.id)
+        start_sprint(self.sprint.id)
+        apply_ticket_update(first, TicketUpdate(status="DONE"), self.owner, None)
+
+        sprint, moved = close_sprint(self.sprint.id)
+
+        self.assertEqual(moved, [second])
+        self.assertEqual((sprint.state, sprint.done_count, sprint.todo_count), (Sprint.CLOSED, 1, 1))
+        with self.assertRaises(SprintError):
+            start_sprint(sprint.id)
+
+
+class SprintUpdateTests(SprintTestCase):
+    def test_null_is_rejected(self):
+        for field in ("name", "goal", "start_date", "end_date"):
+            with self.assertRaises(ValidationError):
+                SprintUpdate(**{field: None})
+
+    def test_dates_are_checked_before_anything_changes(self):
+        data = SprintUpdate(name="Renamed", start_date=date(2026, 2, 1))
+
+        with self.assertRaises(HTTPException) as ctx:
+            update_sprint(self.sprint.id, data, current_user=self.owner)
+
+        self.assertEqual(ctx.exception.status_code, 400)
+        self.sprint.refresh_from_db()
+        self.assertEqual((self.sprint.name, self.sprint.start_date), ("S1", date(2026, 1, 5)))
+
+        update_sprint(self.sprint.id, SprintUpdate(end_date=date(2026, 1, 20)), current_user=self.owner)
+        self.sprint.refresh_from_db()
+        self.assertEqual(self.sprint.end_date, date(2026, 1, 20))
@@ -0,0 +1,266 @@
+"""
+Cold archive for finished tickets.
+
+Tickets that have been DONE and untouched for `older_than_days` are moved,
+with their comments and history, from the hot tables into ArchivedTicket
+and ArchivedComment, a batch per transaction, so board and list queries
+only scan live work. Ids are kept: get_ticket and search fall through to
+the archive, and restore_ticket() moves a ticket back on demand.
+
+Archived tickets leave the epic hierarchy (their sub-tasks become
+top-level tickets) and their sprint, and are restored without either.
+Their label ids are kept and re-applied on restore, minus labels that
+were deleted meanwhile. Dependency links are kept too and recreated on
+restore once both ends are live again (a link between two archived
+tickets comes back with whichever is restored second).
+
+Watchers and notifications of archived tickets are dropped; a restore
+re-subscribes the creator, assignee and commenters. Status transitions
+stay in place so flow charts keep counting archived tickets.
+
+Runs as the "tickets.archive_done" job and the archive_tickets command.
+"""
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from comments.models import ArchivedComment, Comments
+from notifications.fanout import forget_tickets
+from projects.changes import record_change, record_changes
+from projects.models import ProjectChange
+from projects.purge import delete_rows
+from sprints.counters import tickets_deleted
+from tickets.hierarchy import detach
+from tickets.labels import set_labels
+from tickets.links import DIRECTED_KINDS, DOWNSTREAM, closure_ids
+from tickets.models import ArchivedTicket, Label, Ticket, TicketChange, TicketLabel, TicketLink
+from tickets.watchers import add_watchers
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+
+TICKET_FIELDS = [
+    "title", "description", "issue_type", "status", "order", "priority",
+    "project_id", "created_by_id", "assigned_to_id",
+    "created_at", "updated_at", "version",
+]
+
+
+class RestoreConflict(Exception):
+    pass
+
+
+def archive_cutoff(older_than_days: int | None = None) -> datetime:
+    if older_than_days is None:
+        older_than_days = settings.TICKET_ARCHIVE_DAYS
+    return timezone.now() - timedelta(days=older_than_days)
+
+
+def serialize_history(ticket_ids) -> dict:
+    history = defaultdict(list)
+    for change in (
+        TicketChange.objects.filter(ticket_id__in=ticket_ids)
+        .order_by("id")
+        .values("ticket_id", "actor_id", "action", "changes", "snapshot", "created_at")
+    ):
+        ticket_id = change.pop("ticket_id")
+        change["created_at"] = change["created_at"].isoformat()
+        history[ticket_id].append(change)
+    return history
+
+
+def serialize_links(ticket_ids) -> dict:
+    links = defaultdict(list)
+    for link in (
+        TicketLink.objects.filter(Q(source_id__in=ticket_ids) | Q(target_id__in=ticket_ids))
+        .order_by("id")
+        .values_list("source_id", "target_id", "kind", "created_by_id")
+    ):
+        for ticket_id in {link[0], link[1]} & set(ticket_ids):
+            links[ticket_id].append(list(link))
+    return links
+
+
+def restore_links(ticket: Ticket, links):
+    """Recreate the archived links whose other end is a live ticket."""
+    live = set(
+        Ticket.objects.filter(
+            id__in={ticket_id for source_id, target_id, _, _ in links for ticket_id in (source_id, target_id)}
+        ).values_list("id", flat=True)
+    )
+
+    for source_id, target_id, kind, created_by_id in links:
+        if source_id not in live or target_id not in live:
+            continue
+
+        if TicketLink.objects.filter(source_id=source_id, target_id=target_id, kind=kind).exists():
+            continue
+
+        target = Ticket(id=target_id, project_id=ticket.project_id)
+        if kind in DIRECTED_KINDS and source_id in closure_ids(target, kind, DOWNSTREAM):
+            logger.warning("Not restoring %s link #%s -> #%s: it would close a cycle", kind, source_id, target_id)
+            continue
+
+        TicketLink.objects.create(
+            project_id=ticket.project_id,
+            source_id=source_id,
+            target_id=target_id,
+            kind=kind,
+            created_by_id=created_by_id,
+        )
+
+
+def archive_batch(ticket_ids, cutoff) -> int:
+    """Move one batch; tickets reopened or edited meanwhile are skipped."""
+    with transaction.atomic():
+        tickets = list(
+            Ticket.objects.select_for_update()
+            .filter(id__in=ticket_ids, status="DONE", updated_at__lte=cutoff)
+            .values("id", *TICKET_FIELDS)
+        )
+        if not tickets:
+            return 0
+
+        ids = [ticket["id"] for ticket in tickets]
+        history = serialize_history(ids)
+        label_ids = defaultdict(list)
+        for ticket_id, label_id in (
+            TicketLabel.objects.filter(ticket_id__in=ids)
+            .order_by("label_id")
+            .values_list("ticket_id", "label_id")
+        ):
+            label_ids[ticket_id].append(label_id)
+        links = serialize_links(ids)
+
+        ArchivedTicket.objects.bulk_create([
+            ArchivedTicket(
+                **ticket,
+                history=history[ticket["id"]],
+                label_ids=label_ids[ticket["id"]],
+                links=links[ticket["id"]],
+            )
+            for ticket in tickets
+        ])
+        ArchivedComment.objects.bulk_create([
+            ArchivedComment(**comment)
+            for comment in Comments.objects.filter(ticket_id__in=ids).values(
+                "id", "comment", "user_id", "ticket_id", "created_at"
+            )
+        ])
+
+        forget_tickets(ids)
+        detach(ids)
+        tickets_deleted(ids)
+
+        with connection.cursor() as cursor:
+            delete_rows(cursor, Ticket, ids)
+
+        record_changes(
+            ProjectChange.TICKET,
+            [(ticket["project_id"], ticket["id"]) for ticket in tickets],
+            deleted=True
+        )
+
+    return len(tickets)
+
+
+def archive_done_tickets(
+    older_than_days: int | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress=None,
+) -> int:
+    """
+    Archive every eligible ticket. `progress(archived)` is called after
+    each batch. Returns the number of tickets archived.
+    """
+    cutoff = archive_cutoff(older_than_days)
+    archived = 0
+    last_id = 0
+
+    while True:
+        ticket_ids = list(
+            Ticket.objects.filter(status="DONE", updated_at__lte=cutoff, id__gt=last_id)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ticket_ids:
+            break
+
+        archived += archive_batch(ticket_ids, cutoff)
+        last_id = ticket_ids[-1]
+
+        if progress:
+            progress(archived)
+
+    logger.info("Archived %s tickets", archived)
+    return archived
+
+
+def restore_ticket(ticket_id: int) -> Ticket:
+    """
+    Move an archived ticket, its comments and history back into the hot
+    tables. Raises ArchivedTicket.DoesNotExist, or RestoreConflict when a
+    live ticket in the project has taken its title.
+    """
+    with transaction.atomic():
+        archived = ArchivedTicket.objects.select_for_update().get(id=ticket_id)
+
+        if Ticket.objects.filter(project_id=archived.project_id, title=archived.title).exists():
+            raise RestoreConflict(
+                f"Project already has a ticket titled {archived.title!r}."
+            )
+
+        ticket = Ticket.objects.create(
+            id=archived.id,
+            **{field: getattr(archived, field) for field in TICKET_FIELDS if field != "created_at"}
+        )
+        # created_at is auto_now_add; put the original back
+        Ticket.objects.filter(id=ticket.id).update(created_at=archived.created_at)
+        ticket.created_at = archived.created_at
+
+        changes = TicketChange.objects.bulk_create([
+            TicketChange(
+                ticket_id=ticket.id,
+                actor_id=entry["actor_id"],
+                action=entry["action"],
+                changes=entry["changes"],
+                snapshot=entry["snapshot"],
+            )
+            for entry in archived.history
+        ])
+        for change, entry in zip(changes, archived.history):
+            change.created_at = datetime.fromisoformat(entry["created_at"])
+        TicketChange.objects.bulk_update(changes, ["created_at"])
+
+        archived_comments = list(archived.comments.all())
+        comments = Comments.objects.bulk_create([
+            Comments(id=comment.id, comment=comment.comment, user_id=comment.user_id, ticket_id=ticket.id)
+            for comment in archived_comments
+        ])
+        for comment, original in zip(comments, archived_comments):
+            comment.created_at = original.created_at
+        Comments.objects.bulk_update(comments, ["created_at"])
+
+        # Labels deleted while the ticket was archived are skipped
+        set_labels(ticket, Label.objects.filter(
+            id__in=archived.label_ids,
+            project_id=ticket.project_id,
+        ).values_list("id", flat=True))
+
+        restore_links(ticket, archived.links)
+
+        archived.delete()
+
+        add_watchers([ticket.id], [ticket.created_by_id], "CREATOR")
+        add_watchers([ticket.id], [ticket.assigned_to_id], "ASSIGNEE")
+        add_watchers([ticket.id], [comment.user_id for comment in comments], "COMMENTER")
+
+        record_change(ticket.project_id, ProjectChange.TICKET, ticket.id)
+
+    return ticket
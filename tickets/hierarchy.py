@@ -0,0 +1,228 @@
+"""
+Epic / sub-task hierarchy.
+
+Ticket.parent holds the direct parent; TicketClosure holds every
+(ancestor, descendant) pair so subtree and path queries are one indexed
+lookup. Each ticket carries rollups over all of its descendants
+(subtask_total, subtask_done, subtask_max_priority):
+
+- status changes adjust subtask_done on the ancestors with one UPDATE
+  per distinct delta (apply_status_changes, called from history.record);
+- priority changes raise the maximum in place and only recompute the
+  ancestors whose maximum was the old priority;
+- structural changes (create, move, delete) recompute the affected
+  ancestors with one aggregate UPDATE (refresh_rollups).
+
+Every ancestor whose rollups are written, and every child detached from
+a deleted parent, is logged to the project change feed, since these
+bulk UPDATEs bypass the callers' own record_change.
+"""
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import Case, Count, Exists, F, IntegerField, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce
+
+from projects.changes import record_changes
+from projects.models import Project, ProjectChange
+from tickets.models import Ticket, TicketClosure
+
+PRIORITY_RANK = {priority: rank for rank, (priority, _) in enumerate(Ticket.PRIORITY, 1)}
+
+
+class HierarchyError(Exception):
+    pass
+
+
+def ancestor_ids(ticket_ids) -> list[int]:
+    return list(
+        TicketClosure.objects
+        .filter(descendant_id__in=ticket_ids)
+        .values_list("ancestor_id", flat=True)
+        .distinct()
+    )
+
+
+def descendants(ticket_id: int):
+    """Queryset of every ticket below `ticket_id`, at any depth."""
+    return Ticket.objects.filter(ancestor_links__ancestor_id=ticket_id)
+
+
+def record_touched(ticket_ids):
+    """Log tickets written here in the change feed of their projects."""
+    record_changes(
+        ProjectChange.TICKET,
+        Ticket.objects.filter(id__in=ticket_ids).values_list("project_id", "id").order_by("id")
+    )
+
+
+def refresh_rollups(ticket_ids):
+    """Recompute the rollups of `ticket_ids` from the closure table."""
+    ticket_ids = list(ticket_ids)
+    if not ticket_ids:
+        return
+
+    below = TicketClosure.objects.filter(ancestor_id=OuterRef("pk")).order_by()
+
+    def count(rows):
+        return Coalesce(
+            Subquery(rows.values("ancestor_id").annotate(n=Count("*")).values("n")),
+            0
+        )
+
+    rank = Case(
+        *[When(descendant__priority=priority, then=Value(r)) for priority, r in PRIORITY_RANK.items()],
+        default=Value(0),
+        output_field=IntegerField(),
+    )
+    highest = below.annotate(rank=rank).order_by("-rank").values("descendant__priority")[:1]
+
+    Ticket.objects.filter(id__in=ticket_ids).update(
+        subtask_total=count(below),
+        subtask_done=count(below.filter(descendant__status="DONE")),
+        subtask_max_priority=Coalesce(Subquery(highest), Value("")),
+    )
+    record_touched(ticket_ids)
+
+
+def validate_parent(ticket: Ticket | None, project_id: int, parent_id: int | None):
+    """
+    Raise HierarchyError unless `parent_id` can be the parent of `ticket`
+    (None for a ticket that is being created).
+    """
+    if parent_id is None:
+        return
+
+    parent = Ticket.objects.filter(id=parent_id).values("project_id").first()
+    if parent is None:
+        raise HierarchyError("Parent ticket not found.")
+
+    if parent["project_id"] != project_id:
+        raise HierarchyError("Parent ticket must belong to the same project.")
+
+    if ticket is not None and (
+        parent_id == ticket.id
+        or TicketClosure.objects.filter(ancestor_id=ticket.id, descendant_id=parent_id).exists()
+    ):
+        raise HierarchyError("A ticket cannot be moved under itself or one of its sub-tasks.")
+
+
+def place(ticket: Ticket, parent_id: int | None):
+    """
+    Rewrite the closure rows of `ticket` and its subtree for the parent
+    now stored in Ticket.parent, and refresh the old and new ancestors.
+    Moves are serialized per project so two of them cannot form a cycle.
+    """
+    with transaction.atomic():
+        Project.objects.select_for_update().filter(id=ticket.project_id).first()
+        validate_parent(ticket, ticket.project_id, parent_id)
+
+        subtree = [(ticket.id, 0)] + list(
+            TicketClosure.objects.filter(ancestor_id=ticket.id).values_list("descendant_id", "depth")
+        )
+        old_ancestors = ancestor_ids([ticket.id])
+
+        TicketClosure.objects.filter(
+            descendant_id__in=[ticket_id for ticket_id, _ in subtree],
+            ancestor_id__in=old_ancestors,
+        ).delete()
+
+        new_ancestors = []
+        if parent_id is not None:
+            new_ancestors = [(parent_id, 1)] + [
+                (ancestor_id, depth + 1)
+                for ancestor_id, depth in TicketClosure.objects
+                .filter(descendant_id=parent_id)
+                .values_list("ancestor_id", "depth")
+            ]
+            TicketClosure.objects.bulk_create([
+                TicketClosure(ancestor_id=ancestor_id, descendant_id=ticket_id, depth=up + down)
+                for ancestor_id, up in new_ancestors
+                for ticket_id, down in subtree
+            ])
+
+        refresh_rollups(set(old_ancestors) | {ancestor_id for ancestor_id, _ in new_ancestors})
+
+
+def detach(ticket_ids):
+    """
+    Take tickets that are about to be deleted or archived out of the
+    hierarchy: their ancestors stop counting them and their subtrees,
+    and their children become top-level tickets.
+    """
+    ticket_ids = list(ticket_ids)
+    affected = set(ancestor_ids(ticket_ids)) - set(ticket_ids)
+
+    # Rows whose path runs through one of the tickets
+    through = TicketClosure.objects.filter(
+        ancestor_id=OuterRef("ancestor_id"),
+        descendant_id__in=ticket_ids,
+        descendant__descendant_links__descendant_id=OuterRef("descendant_id"),
+    )
+    TicketClosure.objects.filter(
+        Q(descendant_id__in=ticket_ids) | Q(ancestor_id__in=ticket_ids) | Exists(through)
+    ).delete()
+
+    children = list(
+        Ticket.objects.filter(parent_id__in=ticket_ids)
+        .exclude(id__in=ticket_ids)
+        .values_list("id", flat=True)
+    )
+    Ticket.objects.filter(parent_id__in=ticket_ids).update(parent=None)
+    record_touched(children)
+    refresh_rollups(affected)
+
+
+def apply_status_changes(transitions):
+    """transitions: (ticket_id, from_status, to_status) of existing tickets."""
+    delta = {}
+    for ticket_id, from_status, to_status in transitions:
+        change = (to_status == "DONE") - (from_status == "DONE")
+        if change:
+            delta[ticket_id] = delta.get(ticket_id, 0) + change
+
+    if not delta:
+        return
+
+    per_ancestor = Counter()
+    for ancestor_id, descendant_id in TicketClosure.objects.filter(
+        descendant_id__in=delta
+    ).values_list("ancestor_id", "descendant_id"):
+        per_ancestor[ancestor_id] += delta[descendant_id]
+
+    by_delta = defaultdict(list)
+    for ancestor_id, change in per_ancestor.items():
+        if change:
+            by_delta[change].append(ancestor_id)
+
+    for change, ancestors in by_delta.items():
+        Ticket.objects.filter(id__in=ancestors).update(subtask_done=F("subtask_done") + change)
+    record_touched([ancestor_id for ancestors in by_delta.values() for ancestor_id in ancestors])
+
+
+def apply_priority_changes(changes):
+    """changes: (ticket_id, old_priority, new_priority)."""
+    by_change = defaultdict(list)
+    for ticket_id, old, new in changes:
+        by_change[(old, new)].append(ticket_id)
+
+    stale = set()
+    for (old, new), ticket_ids in by_change.items():
+        ancestors = TicketClosure.objects.filter(descendant_id__in=ticket_ids).values("ancestor_id")
+        lower = [""] + [p for p, rank in PRIORITY_RANK.items() if rank < PRIORITY_RANK.get(new, 0)]
+
+        raised = list(
+            Ticket.objects.filter(id__in=ancestors, subtask_max_priority__in=lower)
+            .values_list("id", flat=True)
+        )
+        Ticket.objects.filter(id__in=raised).update(subtask_max_priority=new)
+        record_touched(raised)
+
+        # The old priority may have been the maximum; only those ancestors are recomputed
+        if PRIORITY_RANK.get(new, 0) < PRIORITY_RANK.get(old, 0):
+            stale.update(
+                Ticket.objects.filter(id__in=ancestors, subtask_max_priority=old)
+                .values_list("id", flat=True)
+            )
+
+    refresh_rollups(stale)
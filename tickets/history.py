@@ -0,0 +1,189 @@
+"""
+Ticket history: compact diffs plus periodic snapshots.
+
+Every write appends one TicketChange holding only the changed fields.
+Creation, and every SNAPSHOT_EVERY-th history row after the latest
+snapshot, also stores the full tracked state, so state_at() replays at
+most SNAPSHOT_EVERY - 1 diffs instead of the whole history. The rows
+are counted rather than derived from Ticket.version, which untracked
+writes (reorders, sprint moves) also bump.
+
+Board order is not tracked; drag-and-drop reorders would drown out
+the meaningful changes. Status changes are also written to
+StatusTransition for the analytics rollups (deleted tickets get a
+closing transition to no status, see record_deletions), and status and priority
+changes update the parent tickets' rollups (tickets.hierarchy) and
+sprint counters (sprints.counters).
+"""
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from sprints import counters as sprint_counters
+from tickets.hierarchy import apply_priority_changes, apply_status_changes
+from tickets.models import Ticket, TicketChange, StatusTransition
+
+TRACKED_FIELDS = (
+    "title",
+    "description",
+    "issue_type",
+    "status",
+    "priority",
+    "assigned_to_id",
+)
+
+SNAPSHOT_EVERY = 20
+
+
+def ticket_state(ticket) -> dict:
+    return {field: getattr(ticket, field) for field in TRACKED_FIELDS}
+
+
+def created_entry(ticket, actor) -> TicketChange:
+    return TicketChange(
+        ticket_id=ticket.id,
+        actor=actor,
+        action="CREATED",
+        snapshot=ticket_state(ticket),
+    )
+
+
+def change_entry(ticket_id: int, actor, old_state: dict, changes: dict) -> TicketChange | None:
+    """History row for a write, or None when no tracked field changed."""
+    diff = {
+        field: [old_state[field], value]
+        for field, value in changes.items()
+        if field in TRACKED_FIELDS and old_state[field] != value
+    }
+    if not diff:
+        return None
+
+    entry = TicketChange(ticket_id=ticket_id, actor=actor, changes=diff)
+    # Kept as the snapshot if record() finds one is due
+    entry.state = {**old_state, **{field: new for field, (_, new) in diff.items()}}
+    return entry
+
+
+def diffs_since_snapshot(ticket_ids) -> dict:
+    """{ticket_id: history rows written after the ticket's latest snapshot}"""
+    latest = (
+        TicketChange.objects
+        .filter(ticket_id=OuterRef("ticket_id"), snapshot__isnull=False)
+        .order_by("-id")
+        .values("id")[:1]
+    )
+    return dict(
+        TicketChange.objects
+        .filter(ticket_id__in=ticket_ids)
+        .annotate(base=Coalesce(Subquery(latest), 0))
+        .filter(id__gt=F("base"))
+        .values("ticket_id")
+        .annotate(count=Count("id"))
+        .values_list("ticket_id", "count")
+        .order_by()
+    )
+
+
+def add_due_snapshots(entries):
+    updates = [entry for entry in entries if entry.action != "CREATED" and entry.snapshot is None]
+    if not updates:
+        return
+
+    pending = diffs_since_snapshot({entry.ticket_id for entry in updates})
+    for entry in updates:
+        pending[entry.ticket_id] = pending.get(entry.ticket_id, 0) + 1
+        state = getattr(entry, "state", None)
+
+        if pending[entry.ticket_id] >= SNAPSHOT_EVERY and state is not None:
+            entry.snapshot = state
+            pending[entry.ticket_id] = 0
+
+
+def record(entries):
+    entries = [entry for entry in entries if entry is not None]
+    if not entries:
+        return
+
+    add_due_snapshots(entries)
+    TicketChange.objects.bulk_create(entries)
+
+    apply_priority_changes([
+        (entry.ticket_id, *entry.changes["priority"])
+        for entry in entries
+        if entry.action != "CREATED" and "priority" in entry.changes
+    ])
+
+    transitions = []
+    for entry in entries:
+        if entry.action == "CREATED":
+            transitions.append((entry.ticket_id, "", entry.snapshot["status"]))
+        elif "status" in entry.changes:
+            transitions.append((entry.ticket_id, *entry.changes["status"]))
+
+    # New tickets are counted when they are placed in the hierarchy / sprint
+    changed = [transition for transition in transitions if transition[1]]
+    apply_status_changes(changed)
+    sprint_counters.apply_status_changes(changed)
+
+    if transitions:
+        projects = dict(
+            Ticket.objects.filter(
+                id__in={ticket_id for ticket_id, _, _ in transitions}
+            ).values_list("id", "project_id")
+        )
+        StatusTransition.objects.bulk_create([
+            StatusTransition(
+                ticket_id=ticket_id,
+                project_id=projects[ticket_id],
+                from_status=from_status,
+                to_status=to_status,
+            )
+            for ticket_id, from_status, to_status in transitions
+        ])
+
+
+def record_deletions(ticket_ids):
+    """
+    Take tickets about to be deleted out of their status column: their
+    transitions are kept and a final one to no status is appended.
+    """
+    StatusTransition.objects.bulk_create([
+        StatusTransition(
+            ticket_id=ticket_id,
+            project_id=project_id,
+            from_status=status,
+            to_status="",
+        )
+        for ticket_id, project_id, status in (
+            Ticket.objects.filter(id__in=ticket_ids)
+            .order_by("id")
+            .values_list("id", "project_id", "status")
+        )
+    ])
+
+
+def state_at(ticket_id: int, timestamp) -> dict | None:
+    """
+    Tracked fields of a ticket as they were at `timestamp`, or None if
+    there is no history that far back.
+    """
+    entries = TicketChange.objects.filter(ticket_id=ticket_id, created_at__lte=timestamp)
+
+    base = (
+        entries.filter(snapshot__isnull=False)
+        .order_by("-created_at", "-id")
+        .values("id", "snapshot")
+        .first()
+    )
+    if base is None:
+        return None
+
+    state = dict(base["snapshot"])
+    for changes in (
+        entries.filter(id__gt=base["id"])
+        .order_by("id")
+        .values_list("changes", flat=True)
+    ):
+        for field, (_, new) in changes.items():
+            state[field] = new
+
+    return state
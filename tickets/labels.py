@@ -0,0 +1,101 @@
+"""
+Ticket labels.
+
+TicketLabel rows are the source of truth, indexed both ways. On
+PostgreSQL each ticket also carries its label ids in an integer[] column
+with a GIN index (migration 0016), so an AND / OR filter over any number
+of labels is a single index containment / overlap check. Elsewhere the
+filters use the (label, ticket) index. Label writes go through this
+module so the array stays in sync.
+"""
+from django.db import connection, transaction
+from django.db.models import BooleanField, Count, Exists, OuterRef
+from django.db.models.expressions import RawSQL
+
+from tickets.models import Ticket, TicketLabel
+
+ALL = "all"
+ANY = "any"
+
+
+def uses_label_array() -> bool:
+    return connection.vendor == "postgresql"
+
+
+def sync_label_array(ticket_ids):
+    ticket_ids = list(ticket_ids)
+    if not ticket_ids or not uses_label_array():
+        return
+
+    table = connection.ops.quote_name(Ticket._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            UPDATE {table} SET label_ids = ARRAY(
+                SELECT label_id FROM {TicketLabel._meta.db_table}
+                WHERE ticket_id = {table}.id ORDER BY label_id
+            )
+            WHERE id = ANY(%s)
+            """,
+            [ticket_ids],
+        )
+
+
+def set_labels(ticket: Ticket, label_ids) -> bool:
+    """Replace the ticket's labels. Returns whether anything changed."""
+    wanted = set(label_ids)
+
+    with transaction.atomic():
+        current = set(
+            TicketLabel.objects.filter(ticket=ticket).values_list("label_id", flat=True)
+        )
+        if current == wanted:
+            return False
+
+        TicketLabel.objects.filter(ticket=ticket, label_id__in=current - wanted).delete()
+        TicketLabel.objects.bulk_create(
+            [TicketLabel(ticket=ticket, label_id=label_id) for label_id in wanted - current],
+            ignore_conflicts=True,
+        )
+        sync_label_array([ticket.id])
+
+    return True
+
+
+def delete_label(label) -> list[int]:
+    """Delete a label; returns the ids of the tickets that had it."""
+    with transaction.atomic():
+        ticket_ids = list(label.ticket_labels.values_list("ticket_id", flat=True))
+        label.delete()
+        sync_label_array(ticket_ids)
+
+    return ticket_ids
+
+
+def filter_by_labels(qs, label_ids, match: str = ANY):
+    """Tickets with all (AND) or any (OR) of `label_ids`."""
+    label_ids = sorted(set(label_ids))
+
+    if uses_label_array():
+        table = connection.ops.quote_name(Ticket._meta.db_table)
+        operator = "@>" if match == ALL else "&&"
+        return qs.filter(RawSQL(
+            f"{table}.label_ids {operator} %s::integer[]",
+            (label_ids,),
+            output_field=BooleanField(),
+        ))
+
+    if match == ALL:
+        matching = (
+            TicketLabel.objects
+            .filter(label_id__in=label_ids)
+            .values("ticket_id")
+            .annotate(matched=Count("label_id"))
+            .filter(matched=len(label_ids))
+            .values("ticket_id")
+        )
+        return qs.filter(id__in=matching)
+
+    return qs.filter(Exists(
+        TicketLabel.objects.filter(ticket_id=OuterRef("pk"), label_id__in=label_ids)
+    ))
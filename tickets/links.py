@@ -0,0 +1,127 @@
+"""
+Ticket dependency graph.
+
+Transitive queries ("everything this ticket is blocked by") run as a
+single recursive CTE on PostgreSQL. Other databases load the project's
+links of that kind as an adjacency list in one query and walk it
+breadth-first in memory. Either way a chain of any length costs one
+round trip.
+"""
+from collections import defaultdict, deque
+
+from django.db import connection, transaction
+from django.db.models.expressions import RawSQL
+
+from projects.models import Project
+from tickets.models import Ticket, TicketLink
+
+# Kinds whose links must not form a cycle
+DIRECTED_KINDS = (TicketLink.BLOCKS, TicketLink.DUPLICATES)
+
+UPSTREAM = "upstream"      # sources pointing at the ticket (blocked by)
+DOWNSTREAM = "downstream"  # targets the ticket points at (blocks)
+
+
+class LinkError(Exception):
+    pass
+
+
+class LinkCycle(LinkError):
+    pass
+
+
+def closure_sql(direction: str) -> str:
+    """Recursive CTE selecting the ids reachable from %s; params (kind, start, kind)."""
+    table = TicketLink._meta.db_table
+    start, step = ("target_id", "source_id") if direction == UPSTREAM else ("source_id", "target_id")
+
+    # UNION (not UNION ALL) drops revisited ids, so this terminates even on a cycle
+    return f"""
+        WITH RECURSIVE closure(id) AS (
+            SELECT {step} FROM {table} WHERE kind = %s AND {start} = %s
+            UNION
+            SELECT l.{step} FROM {table} l JOIN closure c ON l.{start} = c.id
+            WHERE l.kind = %s
+        )
+        SELECT id FROM closure
+    """
+
+
+def closure_bfs(project_id: int, ticket_id: int, kind: str, direction: str) -> set[int]:
+    adjacency = defaultdict(list)
+    for source_id, target_id in (
+        TicketLink.objects
+        .filter(project_id=project_id, kind=kind)
+        .values_list("source_id", "target_id")
+    ):
+        if direction == UPSTREAM:
+            adjacency[target_id].append(source_id)
+        else:
+            adjacency[source_id].append(target_id)
+
+    seen = set()
+    queue = deque([ticket_id])
+    while queue:
+        for neighbour in adjacency[queue.popleft()]:
+            if neighbour not in seen:
+                seen.add(neighbour)
+                queue.append(neighbour)
+
+    return seen
+
+
+def closure_ids(ticket: Ticket, kind: str, direction: str) -> set[int]:
+    """Ids of every ticket reachable from `ticket` over `kind` links."""
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute(closure_sql(direction), [kind, ticket.id, kind])
+            ids = {row[0] for row in cursor.fetchall()}
+    else:
+        ids = closure_bfs(ticket.project_id, ticket.id, kind, direction)
+
+    ids.discard(ticket.id)
+    return ids
+
+
+def closure_tickets(ticket: Ticket, kind: str, direction: str):
+    """Queryset of the closure; on PostgreSQL the CTE runs as its subquery."""
+    if connection.vendor == "postgresql":
+        ids = RawSQL(closure_sql(direction), [kind, ticket.id, kind])
+        return Ticket.objects.filter(id__in=ids).exclude(id=ticket.id)
+
+    return Ticket.objects.filter(id__in=closure_ids(ticket, kind, direction))
+
+
+def add_link(source: Ticket, target: Ticket, kind: str, user=None) -> TicketLink:
+    """
+    Create a link, rejecting self links, cross-project links and, for
+    blocks/duplicates, links that would close a cycle. Inserts are
+    serialized per project so two concurrent links cannot form a cycle
+    between them.
+    """
+    if source.id == target.id:
+        raise LinkError("A ticket cannot be linked to itself.")
+
+    if source.project_id != target.project_id:
+        raise LinkError("Linked tickets must belong to the same project.")
+
+    with transaction.atomic():
+        Project.objects.select_for_update().filter(id=source.project_id).first()
+
+        existing = TicketLink.objects.filter(source=source, target=target, kind=kind)
+        if kind == TicketLink.RELATES_TO:
+            existing = existing | TicketLink.objects.filter(source=target, target=source, kind=kind)
+        if existing.exists():
+            raise LinkError("These tickets are already linked.")
+
+        # source -> target closes a cycle if source is already reachable from target
+        if kind in DIRECTED_KINDS and source.id in closure_ids(target, kind, DOWNSTREAM):
+            raise LinkCycle(f"Ticket #{target.id} already leads back to #{source.id}; this link would create a cycle.")
+
+        return TicketLink.objects.create(
+            project_id=source.project_id,
+            source=source,
+            target=target,
+            kind=kind,
+            created_by=user,
+        )
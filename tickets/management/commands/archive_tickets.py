@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from tickets.archive import DEFAULT_BATCH_SIZE, archive_done_tickets
+
+
+class Command(BaseCommand):
+    help = "Move tickets that have been DONE for a while, with their comments, into the archive tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.TICKET_ARCHIVE_DAYS,
+            help="Archive tickets DONE and untouched for at least this many days.",
+        )
+        parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        def progress(archived):
+            self.stdout.write(f"{archived} tickets archived")
+
+        archived = archive_done_tickets(options["days"], options["batch_size"], progress)
+        self.stdout.write(self.style.SUCCESS(f"Archived {archived} tickets"))
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:22
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0005_savedfilter'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketWatcher',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('reason', models.CharField(choices=[('CREATOR', 'Creator'), ('ASSIGNEE', 'Assignee'), ('COMMENTER', 'Commenter'), ('MANUAL', 'Manual')], default='MANUAL', max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('ticket', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='watchers', to='tickets.ticket')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='watched_tickets', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'ticket'], name='tickets_tic_user_id_ca4dd7_idx')],
+                'unique_together': {('ticket', 'user')},
+            },
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:22
+
+from django.db import migrations
+
+BATCH_SIZE = 1000
+
+
+def backfill_watchers(apps, schema_editor):
+    Ticket = apps.get_model('tickets', 'Ticket')
+    Comments = apps.get_model('comments', 'Comments')
+    TicketWatcher = apps.get_model('tickets', 'TicketWatcher')
+
+    rows = []
+
+    def flush():
+        TicketWatcher.objects.bulk_create(rows, ignore_conflicts=True)
+        rows.clear()
+
+    for ticket_id, created_by_id, assigned_to_id in (
+        Ticket.objects.values_list('id', 'created_by_id', 'assigned_to_id').iterator()
+    ):
+        rows.append(TicketWatcher(ticket_id=ticket_id, user_id=created_by_id, reason='CREATOR'))
+        if assigned_to_id:
+            rows.append(TicketWatcher(ticket_id=ticket_id, user_id=assigned_to_id, reason='ASSIGNEE'))
+        if len(rows) >= BATCH_SIZE:
+            flush()
+
+    for ticket_id, user_id in (
+        Comments.objects.values_list('ticket_id', 'user_id').distinct().iterator()
+    ):
+        rows.append(TicketWatcher(ticket_id=ticket_id, user_id=user_id, reason='COMMENTER'))
+        if len(rows) >= BATCH_SIZE:
+            flush()
+
+    flush()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comments', '0001_initial'),
+        ('tickets', '0006_ticketwatcher'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_watchers, migrations.RunPython.noop),
+    ]
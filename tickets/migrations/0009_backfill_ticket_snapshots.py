@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:23
+
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+BATCH_SIZE = 1000
+
+# Same as tickets.history.TRACKED_FIELDS when this migration was written
+TRACKED_FIELDS = (
+    'title',
+    'description',
+    'issue_type',
+    'status',
+    'priority',
+    'assigned_to_id',
+)
+
+
+def backfill_snapshots(apps, schema_editor):
+    """
+    Existing tickets get a snapshot of their current state, dated at
+    their last update, as the starting point for time-travel reads.
+    """
+    Ticket = apps.get_model('tickets', 'Ticket')
+    TicketChange = apps.get_model('tickets', 'TicketChange')
+
+    rows = []
+    for state in Ticket.objects.values('id', *TRACKED_FIELDS).iterator():
+        ticket_id = state.pop('id')
+        rows.append(TicketChange(ticket_id=ticket_id, action='CREATED', snapshot=state))
+
+        if len(rows) >= BATCH_SIZE:
+            TicketChange.objects.bulk_create(rows)
+            rows = []
+
+    TicketChange.objects.bulk_create(rows)
+
+    TicketChange.objects.update(
+        created_at=Subquery(
+            Ticket.objects.filter(id=OuterRef('ticket_id')).values('updated_at')[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0008_ticketchange'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_snapshots, migrations.RunPython.noop),
+    ]
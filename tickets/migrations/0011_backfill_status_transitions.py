@@ -0,0 +1,65 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:25
+
+from django.db import migrations
+
+BATCH_SIZE = 1000
+
+
+def backfill_transitions(apps, schema_editor):
+    """
+    Derive status transitions from the existing ticket history.
+    """
+    TicketChange = apps.get_model('tickets', 'TicketChange')
+    StatusTransition = apps.get_model('tickets', 'StatusTransition')
+
+    def flush(rows, times):
+        StatusTransition.objects.bulk_create(rows)
+        # `at` is auto_now_add; restore the original times afterwards
+        for row, at in zip(rows, times):
+            row.at = at
+        StatusTransition.objects.bulk_update(rows, ['at'])
+
+    rows, times = [], []
+    history = (
+        TicketChange.objects
+        .select_related('ticket')
+        .order_by('id')
+        .only('action', 'changes', 'snapshot', 'created_at', 'ticket__project_id')
+    )
+
+    for change in history.iterator():
+        if change.action == 'CREATED':
+            state = change.snapshot or {}
+            if 'status' not in state:
+                continue
+            from_status, to_status = '', state['status']
+        elif 'status' in change.changes:
+            from_status, to_status = change.changes['status']
+        else:
+            continue
+
+        rows.append(StatusTransition(
+            ticket_id=change.ticket_id,
+            project_id=change.ticket.project_id,
+            from_status=from_status,
+            to_status=to_status,
+        ))
+        times.append(change.created_at)
+
+        if len(rows) >= BATCH_SIZE:
+            flush(rows, times)
+            rows, times = [], []
+
+    if rows:
+        flush(rows, times)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0010_statustransition'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_transitions, migrations.RunPython.noop),
+    ]
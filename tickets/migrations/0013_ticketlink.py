@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:45
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0003_project_change_seq'),
+        ('tickets', '0012_archivedticket'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketLink',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('BLOCKS', 'Blocks'), ('RELATES_TO', 'Relates to'), ('DUPLICATES', 'Duplicates')], max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='projects.project')),
+                ('source', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='outgoing_links', to='tickets.ticket')),
+                ('target', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='incoming_links', to='tickets.ticket')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['target', 'kind'], name='tickets_tic_target__842e58_idx'), models.Index(fields=['project', 'kind'], name='tickets_tic_project_e8a7a3_idx')],
+                'unique_together': {('source', 'target', 'kind')},
+            },
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0013_ticketlink'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticket',
+            name='parent',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='children', to='tickets.ticket'),
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='subtask_done',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='subtask_max_priority',
+            field=models.CharField(blank=True, choices=[('LOW', 'Low'), ('MEDIUM', 'Medium'), ('HIGH', 'High'), ('URGENT', 'Urgent')], max_length=20),
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='subtask_total',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='TicketClosure',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('depth', models.PositiveIntegerField()),
+                ('ancestor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='descendant_links', to='tickets.ticket')),
+                ('descendant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ancestor_links', to='tickets.ticket')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['descendant', 'ancestor'], name='tickets_tic_descend_fcc31b_idx')],
+                'unique_together': {('ancestor', 'descendant')},
+            },
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:49
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0003_project_change_seq'),
+        ('tickets', '0014_ticket_hierarchy'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Label',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50)),
+                ('color', models.CharField(blank=True, max_length=7)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='labels', to='projects.project')),
+            ],
+            options={
+                'ordering': ['name'],
+                'unique_together': {('project', 'name')},
+            },
+        ),
+        migrations.CreateModel(
+            name='TicketLabel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('label', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ticket_labels', to='tickets.label')),
+                ('ticket', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ticket_labels', to='tickets.ticket')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='labels',
+            field=models.ManyToManyField(blank=True, related_name='tickets', through='tickets.TicketLabel', to='tickets.label'),
+        ),
+        migrations.AddIndex(
+            model_name='ticketlabel',
+            index=models.Index(fields=['label', 'ticket'], name='tickets_tic_label_i_5710d7_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='ticketlabel',
+            unique_together={('ticket', 'label')},
+        ),
+    ]
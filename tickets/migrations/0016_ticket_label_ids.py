@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:05
+
+from django.db import migrations
+
+
+def add_label_ids(apps, schema_editor):
+    """
+    PostgreSQL only: denormalized integer[] of label ids with a GIN index,
+    for containment (@>) and overlap (&&) filters. Not a model field;
+    kept in sync by tickets.labels.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute(
+        "ALTER TABLE tickets_ticket ADD COLUMN label_ids integer[] NOT NULL DEFAULT '{}'"
+    )
+    schema_editor.execute(
+        "CREATE INDEX tickets_ticket_label_ids_gin ON tickets_ticket USING GIN (label_ids)"
+    )
+    schema_editor.execute(
+        "UPDATE tickets_ticket SET label_ids = ARRAY("
+        "SELECT label_id FROM tickets_ticketlabel "
+        "WHERE ticket_id = tickets_ticket.id ORDER BY label_id)"
+    )
+
+
+def drop_label_ids(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute("ALTER TABLE tickets_ticket DROP COLUMN label_ids")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0015_labels'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_label_ids, drop_label_ids),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sprints', '0001_initial'),
+        ('tickets', '0016_ticket_label_ids'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticket',
+            name='sprint',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='tickets', to='sprints.sprint'),
+        ),
+    ]
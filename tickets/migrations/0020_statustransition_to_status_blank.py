@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0019_archivedticket_links'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='statustransition',
+            name='to_status',
+            field=models.CharField(blank=True, max_length=20),
+        ),
+    ]
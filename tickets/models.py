@@ -65,9 +65,44 @@ class Ticket(models.Model):
         related_name="assigned_tickets"
     )
 
+    # Epic / sub-task hierarchy; all levels are indexed in TicketClosure
+    parent = models.ForeignKey(
+        "self",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="children"
+    )
+
+    # Iteration; counted into the sprint by sprints.counters
+    sprint = models.ForeignKey(
+        "sprints.Sprint",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="tickets"
+    )
+
+    # Rollups over all descendants, maintained by tickets.hierarchy
+    subtask_total = models.PositiveIntegerField(default=0)
+    subtask_done = models.PositiveIntegerField(default=0)
+    subtask_max_priority = models.CharField(max_length=20, choices=PRIORITY, blank=True)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Bumped on every write; used as the If-Match / ETag precondition
+    version = models.PositiveIntegerField(default=1)
+
+    # On PostgreSQL the label ids are also kept in an integer[] column
+    # with a GIN index (see tickets.labels)
+    labels = models.ManyToManyField(
+        "Label",
+        through="TicketLabel",
+        blank=True,
+        related_name="tickets"
+    )
+
     class Meta:
         unique_together = ('title', 'project')
         ordering = ['-created_at']
@@ -76,7 +111,331 @@ class Ticket(models.Model):
             models.Index(fields=["priority"]),
             models.Index(fields=["project"]),
             models.Index(fields=["issue_type"]),
+            # Archive candidates: status = 'DONE' AND updated_at <= cutoff
+            models.Index(fields=["status", "updated_at"]),
         ]
 
     def __str__(self):
         return f"{self.title} [{self.issue_type}]"
+
+
+class Label(models.Model):
+    """Free-form, per-project ticket label."""
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name="labels"
+    )
+
+    name = models.CharField(max_length=50)
+    color = models.CharField(max_length=7, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ("project", "name")
+        ordering = ["name"]
+
+    def __str__(self):
+        return self.name
+
+
+class TicketLabel(models.Model):
+    ticket = models.ForeignKey(
+        Ticket,
+        on_delete=models.CASCADE,
+        related_name="ticket_labels"
+    )
+
+    label = models.ForeignKey(
+        Label,
+        on_delete=models.CASCADE,
+        related_name="ticket_labels"
+    )
+
+    class Meta:
+        # (ticket, label): labels of a ticket; (label, ticket): tickets with a label
+        unique_together = ("ticket", "label")
+        indexes = [
+            models.Index(fields=["label", "ticket"]),
+        ]
+
+    def __str__(self):
+        return f"#{self.ticket_id} {self.label_id}"
+
+
+class TicketClosure(models.Model):
+    """
+    One row per (ancestor, descendant) pair at any depth, excluding the
+    ticket itself, so "all descendants" or "all ancestors" is a single
+    indexed lookup. Maintained by tickets.hierarchy.
+    """
+    ancestor = models.ForeignKey(
+        Ticket,
+        on_delete=models.CASCADE,
+        related_name="descendant_links"
+    )
+
+    descendant = models.ForeignKey(
+        Ticket,
+        on_delete=models.CASCADE,
+        related_name="ancestor_links"
+    )
+
+    depth = models.PositiveIntegerField()
+
+    class Meta:
+        # (ancestor, descendant): subtree; (descendant, ancestor): path to the root
+        unique_together = ("ancestor", "descendant")
+        indexes = [
+            models.Index(fields=["descendant", "ancestor"]),
+        ]
+
+    def __str__(self):
+        return f"#{self.ancestor_id} > #{self.descendant_id} ({self.depth})"
+
+
+class ArchivedTicket(models.Model):
+    """
+    A DONE ticket moved out of the hot Ticket table by tickets.archive,
+    under its original id. `history` holds its TicketChange rows,
+    `label_ids` its labels and `links` its dependency links as
+    [source_id, target_id, kind, created_by_id], so a restore can put
+    them back.
+    """
+    id = models.BigIntegerField(primary_key=True)
+
+    title = models.CharField(max_length=100)
+    description = models.TextField(blank=True)
+    issue_type = models.CharField(max_length=20, choices=Ticket.ISSUE_TYPE)
+    status = models.CharField(max_length=20, choices=Ticket.STATUS)
+    order = models.IntegerField(default=0)
+    priority = models.CharField(max_length=20, choices=Ticket.PRIORITY)
+
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name="archived_tickets"
+    )
+
+    created_by = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="+"
+    )
+
+    assigned_to = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+"
+    )
+
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    version = models.PositiveIntegerField(default=1)
+
+    history = models.JSONField(default=list)
+    label_ids = models.JSONField(default=list)
+    links = models.JSONField(default=list)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.title} [archived]"
+
+
+class SavedFilter(models.Model):
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="saved_filters"
+    )
+
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name="saved_filters"
+    )
+
+    name = models.CharField(max_length=100)
+    filters = models.JSONField(default=dict)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ("user", "project", "name")
+        ordering = ["name"]
+
+    def __str__(self):
+        return f"{self.name} ({self.user.email})"
+
+
+class TicketWatcher(models.Model):
+    REASONS = [
+        ("CREATOR", "Creator"),
+        ("ASSIGNEE", "Assignee"),
+        ("COMMENTER", "Commenter"),
+        ("MANUAL", "Manual"),
+    ]
+
+    ticket = models.ForeignKey(
+        Ticket,
+        on_delete=models.CASCADE,
+        related_name="watchers"
+    )
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="watched_tickets"
+    )
+
+    reason = models.CharField(max_length=20, choices=REASONS, default="MANUAL")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        # (ticket, user): audience of a ticket; (user, ticket): tickets a user watches
+        unique_together = ("ticket", "user")
+        indexes = [
+            models.Index(fields=["user", "ticket"]),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} watches #{self.ticket_id}"
+
+
+class TicketChange(models.Model):
+    """
+    Append-only ticket history. `changes` holds only the fields that
+    changed, as {field: [old, new]}; `snapshot` holds the full tracked
+    state after the change on creation and every few changes, so a
+    past state is rebuilt from the nearest snapshot (see tickets.history).
+    """
+    ACTIONS = [
+        ("CREATED", "Created"),
+        ("UPDATED", "Updated"),
+    ]
+
+    ticket = models.ForeignKey(
+        Ticket,
+        on_delete=models.CASCADE,
+        related_name="history"
+    )
+
+    actor = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+"
+    )
+
+    action = models.CharField(max_length=20, choices=ACTIONS, default="UPDATED")
+    changes = models.JSONField(default=dict)
+    snapshot = models.JSONField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["ticket", "created_at"]),
+        ]
+
+    def __str__(self):
+        return f"#{self.ticket_id} {self.action} {self.created_at}"
+
+
+class StatusTransition(models.Model):
+    """
+    One row per status change (from_status is empty on creation,
+    to_status on deletion). Kept narrow so analytics can consume new
+    rows incrementally by id; written by tickets.history.
+
+    Rows outlive an archived ticket so flow charts keep counting it;
+    a deleted ticket keeps its rows plus the closing one, so counts
+    already rolled up are compensated instead of going stale.
+    """
+    ticket = models.ForeignKey(
+        Ticket,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="transitions"
+    )
+
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name="+"
+    )
+
+    from_status = models.CharField(max_length=20, blank=True)
+    to_status = models.CharField(max_length=20, blank=True)
+    at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["project", "at"]),
+            models.Index(fields=["ticket", "to_status"]),
+        ]
+
+    def __str__(self):
+        return f"#{self.ticket_id} {self.from_status or '-'} -> {self.to_status or '-'}"
+
+
+class TicketLink(models.Model):
+    """
+    Directed relation between two tickets of the same project: `source`
+    blocks / duplicates / relates to `target`. Blocks and duplicates
+    links never form a cycle (checked by tickets.links.add_link).
+    """
+    BLOCKS = "BLOCKS"
+    RELATES_TO = "RELATES_TO"
+    DUPLICATES = "DUPLICATES"
+
+    KINDS = [
+        (BLOCKS, "Blocks"),
+        (RELATES_TO, "Relates to"),
+        (DUPLICATES, "Duplicates"),
+    ]
+
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name="+"
+    )
+
+    source = models.ForeignKey(
+        Ticket,
+        on_delete=models.CASCADE,
+        related_name="outgoing_links"
+    )
+
+    target = models.ForeignKey(
+        Ticket,
+        on_delete=models.CASCADE,
+        related_name="incoming_links"
+    )
+
+    kind = models.CharField(max_length=20, choices=KINDS)
+
+    created_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+"
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        # (source, ...): walking down a chain; (target, kind): walking up
+        unique_together = ("source", "target", "kind")
+        indexes = [
+            models.Index(fields=["target", "kind"]),
+            models.Index(fields=["project", "kind"]),
+        ]
+
+    def __str__(self):
+        return f"#{self.source_id} {self.kind} #{self.target_id}"
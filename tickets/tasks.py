@@ -0,0 +1,7 @@
+from jobs.queue import register
+from tickets.archive import archive_done_tickets
+
+
+@register("tickets.archive_done", concurrency=1)
+def archive_done(older_than_days=None, batch_size=500):
+    return {"archived": archive_done_tickets(older_than_days, batch_size)}
@@ -1,3 +1,445 @@
+from datetime import timedelta
+
 from django.test import TestCase
+from django.utils import timezone
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from api.comments.routes import create_comment
+from api.comments.schemas import CommentCreate
+from api.projects.routes import get_project_changes
+from api.tickets.routes import (
+    apply_ticket_update,
+    bulk_delete_tickets,
+    bulk_update_tickets,
+    create_saved_filter,
+    create_ticket,
+    delete_ticket,
+    get_ticket_dependencies,
+    list_ticket_watchers,
+    list_watched_tickets,
+    reorder_ticket,
+    search_project_tickets,
+)
+from api.tickets.schemas import (
+    SavedFilterCreate,
+    TicketBulkChanges,
+    TicketBulkDelete,
+    TicketBulkUpdate,
+    TicketCreate,
+    TicketFilter,
+    TicketUpdate,
+)
+from notifications.fanout import notify, unread_count
+from notifications.models import Notification
+from projects.models import Project, ProjectMember
+from tickets.archive import archive_done_tickets, restore_ticket
+from tickets.history import SNAPSHOT_EVERY, state_at
+from tickets.labels import ALL, ANY, delete_label, filter_by_labels, set_labels
+from tickets.links import LinkCycle, LinkError, add_link
+from tickets.models import ArchivedTicket, Label, Ticket, TicketChange, TicketLink
+from tickets.watchers import add_watchers
+from users.models import User
+
+
+class TicketTestCase(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user("owner@example.com", "pw", name="Owner")
+        self.project = Project.objects.create(name="Tickets", owner=self.owner)
+        ProjectMember.objects.create(user=self.owner, project=self.project, role="ADMIN")
+
+    def make_ticket(self, title="Ticket", **fields):
+        return Ticket.objects.create(
+            title=title,
+            description="",
+            project=self.project,
+            created_by=self.owner,
+            **fields
+        )
+
+
+class TicketPatchTests(TicketTestCase):
+    def test_partial_update_writes_only_sent_fields(self):
+        ticket = self.make_ticket(priority="LOW")
+
+        updated = apply_ticket_update(
+            ticket.id, TicketUpdate(status="IN_PROGRESS"), self.owner, None
+        )
+
+        ticket.refresh_from_db()
+        self.assertEqual((ticket.status, ticket.priority, ticket.version), ("IN_PROGRESS", "LOW", 2))
+        self.assertEqual(updated.version, 2)
+        self.assertEqual(
+            TicketChange.objects.get(ticket=ticket).changes,
+            {"status": ["TODO", "IN_PROGRESS"]},
+        )
+
+    def test_stale_version_is_a_conflict(self):
+        ticket = self.make_ticket()
+        apply_ticket_update(ticket.id, TicketUpdate(title="First"), self.owner, 1)
+
+        with self.assertRaises(HTTPException) as ctx:
+            apply_ticket_update(ticket.id, TicketUpdate(title="Second"), self.owner, 1)
+
+        self.assertEqual(ctx.exception.status_code, 409)
+        ticket.refresh_from_db()
+        self.assertEqual((ticket.title, ticket.version), ("First", 2))
+
+    def test_null_for_required_field_is_rejected(self):
+        for field in ("title", "status", "priority", "order"):
+            with self.assertRaises(ValidationError):
+                TicketUpdate(**{field: None})
+
+        # Nullable columns can still be cleared
+        self.assertEqual(
+            TicketUpdate(assigned_to_id=None).model_dump(exclude_unset=True),
+            {"assigned_to_id": None},
+        )
+
+    def test_missing_ticket_is_not_found(self):
+        with self.assertRaises(HTTPException) as ctx:
+            apply_ticket_update(999999, TicketUpdate(title="x"), self.owner, None)
+
+        self.assertEqual(ctx.exception.status_code, 404)
+
+
+class TicketBulkTests(TicketTestCase):
+    def test_null_for_required_field_is_rejected(self):
+        for field in ("status", "issue_type", "priority"):
+            with self.assertRaises(ValidationError):
+                TicketBulkChanges(**{field: None})
+
+        self.assertEqual(
+            TicketBulkChanges(assigned_to_id=None).model_dump(exclude_unset=True),
+            {"assigned_to_id": None},
+        )
+
+    def test_bulk_update_reports_per_ticket_results(self):
+        ticket = self.make_ticket()
+        outsider = User.objects.create_user("out@example.com", "pw", name="Out")
+        other = Project.objects.create(name="Other", owner=outsider)
+        foreign = Ticket.objects.create(title="Foreign", description="", project=other, created_by=outsider)
+
+        result = bulk_update_tickets(
+            TicketBulkUpdate(ticket_ids=[ticket.id, foreign.id, 999999], changes={"status": "DONE"}),
+            current_user=self.owner,
+        )
+
+        self.assertEqual(
+            [item["result"] for item in result["results"]],
+            ["updated", "forbidden", "not_found"],
+        )
+        ticket.refresh_from_db()
+        self.assertEqual((ticket.status, ticket.version), ("DONE", 2))
+
+
+class TicketDeleteTests(TicketTestCase):
+    def setUp(self):
+        super().setUp()
+        self.dev = User.objects.create_user("dev@example.com", "pw", name="Dev")
+        ProjectMember.objects.create(user=self.dev, project=self.project, role="DEV")
+        self.tickets = [self.make_ticket(f"T{i}", assigned_to=self.dev) for i in range(3)]
+        notify("ASSIGNED", self.owner, [(t.id, [self.dev.id]) for t in self.tickets])
+
+    def test_delete_takes_notifications_off_unread_counter(self):
+        delete_ticket(self.tickets[0].id, current_user=self.owner)
+
+        self.assertEqual(unread_count(self.dev), 2)
+        self.assertEqual(Notification.objects.filter(user=self.dev).count(), 2)
+
+    def test_bulk_delete_takes_notifications_off_unread_counter(self):
+        bulk_delete_tickets(
+            TicketBulkDelete(ticket_ids=[t.id for t in self.tickets[1:]]),
+            current_user=self.owner,
+        )
+
+        self.assertEqual(unread_count(self.dev), 1)
+        self.assertEqual(Notification.objects.filter(user=self.dev).count(), 1)
+
+
+class TicketReorderTests(TicketTestCase):
+    def setUp(self):
+        super().setUp()
+        self.viewer = User.objects.create_user("viewer@example.com", "pw", name="Viewer")
+        ProjectMember.objects.create(user=self.viewer, project=self.project, role="VIEWER")
+
+    def test_viewer_can_only_move_own_tickets(self):
+        theirs = self.make_ticket("Theirs", assigned_to=self.viewer)
+        other = self.make_ticket("Other")
+
+        reorder_ticket(theirs.id, "DONE", 3, user=self.viewer)
+        with self.assertRaises(HTTPException) as ctx:
+            reorder_ticket(other.id, "DONE", 3, user=self.viewer)
+
+        self.assertEqual(ctx.exception.status_code, 403)
+        theirs.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual((theirs.status, theirs.order, theirs.version), ("DONE", 3, 2))
+        self.assertEqual(other.status, "TODO")
+
+    def test_missing_ticket_is_not_found(self):
+        with self.assertRaises(HTTPException) as ctx:
+            reorder_ticket(999999, "DONE", 1, user=self.owner)
+
+        self.assertEqual(ctx.exception.status_code, 404)
+
+
+class TicketArchiveTests(TicketTestCase):
+    def test_restore_brings_back_history_and_surviving_labels(self):
+        ticket = self.make_ticket(status="DONE")
+        bug, ui = (Label.objects.create(project=self.project, name=name) for name in ("bug", "ui"))
+        set_labels(ticket, [bug.id, ui.id])
+        TicketChange.objects.create(ticket=ticket, actor=self.owner, action="CREATED", snapshot={})
+
+        self.assertEqual(archive_done_tickets(older_than_days=0), 1)
+        self.assertFalse(Ticket.objects.filter(id=ticket.id).exists())
+        self.assertEqual(ArchivedTicket.objects.get(id=ticket.id).label_ids, [bug.id, ui.id])
+
+        delete_label(ui)
+        restored = restore_ticket(ticket.id)
+
+        self.assertEqual(list(restored.labels.values_list("name", flat=True)), ["bug"])
+        self.assertEqual(TicketChange.objects.filter(ticket=restored).count(), 1)
+        self.assertFalse(ArchivedTicket.objects.filter(id=ticket.id).exists())
+
+
+class TicketHistoryTests(TicketTestCase):
+    def test_state_at_replays_changes_onto_the_snapshot(self):
+        created = create_ticket(TicketCreate(title="T", description="", project_id=self.project.id), current_user=self.owner)
+        before_update = timezone.now()
+        apply_ticket_update(created["id"], TicketUpdate(status="DONE", priority="HIGH"), self.owner, None)
+
+        self.assertEqual(
+            [change.action for change in TicketChange.objects.filter(ticket_id=created["id"]).order_by("id")],
+            ["CREATED", "UPDATED"],
+        )
+        self.assertEqual(state_at(created["id"], before_update)["status"], "TODO")
+        self.assertEqual(state_at(created["id"], timezone.now())["priority"], "HIGH")
+        self.assertIsNone(state_at(created["id"], before_update - timedelta(days=1)))
+
+    def test_snapshots_follow_history_rows_not_versions(self):
+        created = create_ticket(TicketCreate(title="T", description="", project_id=self.project.id), current_user=self.owner)
+        edits = 2 * SNAPSHOT_EVERY + 5
+        for i in range(edits):
+            # Order-only reorders bump the version without writing history
+            reorder_ticket(created["id"], "TODO", i, user=self.owner)
+            apply_ticket_update(created["id"], TicketUpdate(title=f"T{i}"), self.owner, None)
+
+        history = list(TicketChange.objects.filter(ticket_id=created["id"]).order_by("id"))
+        snapshots = [i for i, change in enumerate(history) if change.snapshot is not None]
+
+        self.assertEqual(snapshots, [0, SNAPSHOT_EVERY, 2 * SNAPSHOT_EVERY])
+        self.assertEqual(state_at(created["id"], timezone.now())["title"], f"T{edits - 1}")
+
+
+class TicketHierarchyTests(TicketTestCase):
+    def create(self, title, parent_id=None):
+        data = TicketCreate(title=title, description="", project_id=self.project.id, parent_id=parent_id)
+        return create_ticket(data, current_user=self.owner)["id"]
+
+    def test_rollups_follow_status_priority_and_deletes(self):
+        epic = self.create("Epic")
+        story = self.create("Story", parent_id=epic)
+        task = self.create("Task", parent_id=story)
+        other = self.create("Other", parent_id=epic)
+
+        apply_ticket_update(task, TicketUpdate(status="DONE", priority="HIGH"), self.owner, None)
+        epic_row = Ticket.objects.get(id=epic)
+        self.assertEqual((epic_row.subtask_total, epic_row.subtask_done), (3, 1))
+        self.assertEqual(epic_row.subtask_max_priority, "HIGH")
+
+        delete_ticket(other, current_user=self.owner)
+        epic_row.refresh_from_db()
+        self.assertEqual((epic_row.subtask_total, epic_row.subtask_done), (2, 1))
+
+    def test_rollup_and_detach_writes_reach_the_change_feed(self):
+        epic = self.create("Epic")
+        story = self.create("Story", parent_id=epic)
+        since = get_project_changes(self.project.id, since=0, limit=500, current_user=self.owner)["seq"]
+
+        apply_ticket_update(story, TicketUpdate(status="DONE"), self.owner, None)
+        feed = get_project_changes(self.project.id, since=since, limit=500, current_user=self.owner)
+        self.assertEqual(sorted(ticket["id"] for ticket in feed["tickets"]), [epic, story])
+
+        delete_ticket(epic, current_user=self.owner)
+        feed = get_project_changes(self.project.id, since=feed["seq"], limit=500, current_user=self.owner)
+        self.assertEqual([ticket["id"] for ticket in feed["tickets"]], [story])
+        self.assertIsNone(feed["tickets"][0]["parent_id"])
+        self.assertEqual(feed["deleted"]["tickets"], [epic])
+
+    def test_cycles_are_rejected(self):
+        epic = self.create("Epic")
+        story = self.create("Story", parent_id=epic)
+
+        with self.assertRaises(HTTPException) as ctx:
+            apply_ticket_update(epic, TicketUpdate(parent_id=story), self.owner, None)
+
+        self.assertEqual(ctx.exception.status_code, 400)
+        self.assertIsNone(Ticket.objects.get(id=epic).parent_id)
+
+
+class TicketWatcherTests(TicketTestCase):
+    def watched_page(self, cursor=None):
+        page = list_watched_tickets(cursor=cursor, limit=3, current_user=self.owner)
+        return [ticket["id"] for ticket in page["results"]], page["next_cursor"]
+
+    def test_watched_pages_survive_new_watches(self):
+        unwatched = self.make_ticket("Unwatched")
+        tickets = [self.make_ticket(f"T{i}").id for i in range(6)]
+        add_watchers(tickets, [self.owner.id], "MANUAL")
+
+        first, cursor = self.watched_page()
+        self.assertEqual(first, tickets[:-4:-1])
+        self.assertEqual(self.watched_page(), (first, cursor))
+
+        # Watches added mid-way: newer ones show up on a fresh first page
+        newer = self.make_ticket("Newer")
+        add_watchers([unwatched.id, newer.id], [self.owner.id], "MANUAL")
+
+        second, cursor = self.watched_page(cursor)
+        third, last = self.watched_page(cursor)
+
+        self.assertEqual(second, tickets[2::-1])
+        self.assertEqual((third, last), ([unwatched.id], None))
+        self.assertEqual(self.watched_page()[0][0], newer.id)
+
+    def test_watchers_are_subscribed_with_their_reason(self):
+        dev = User.objects.create_user("dev@example.com", "pw", name="Dev")
+        viewer = User.objects.create_user("viewer@example.com", "pw", name="Viewer")
+        ProjectMember.objects.create(user=dev, project=self.project, role="DEV")
+        ProjectMember.objects.create(user=viewer, project=self.project, role="VIEWER")
+
+        ticket_id = create_ticket(
+            TicketCreate(title="T", description="", project_id=self.project.id, assigned_to_id=dev.id),
+            current_user=self.owner,
+        )["id"]
+        for user in (viewer, self.owner):
+            create_comment(ticket_id, CommentCreate(comment="note", ticket_id=ticket_id), current_user=user)
+
+        watchers = list_ticket_watchers(ticket_id, current_user=self.owner)
+
+        # The creator's subscription is kept when they comment
+        self.assertEqual(
+            sorted((watcher["email"], watcher["reason"]) for watcher in watchers),
+            [
+                ("dev@example.com", "ASSIGNEE"),
+                ("owner@example.com", "CREATOR"),
+                ("viewer@example.com", "COMMENTER"),
+            ],
+        )
+
+
+class TicketLabelTests(TicketTestCase):
+    def test_filter_by_all_or_any_label(self):
+        bug, ui = (Label.objects.create(project=self.project, name=name) for name in ("bug", "ui"))
+        both, only_bug, _ = (self.make_ticket(title) for title in ("Both", "Bug", "None"))
+        set_labels(both, [bug.id, ui.id])
+        set_labels(only_bug, [bug.id])
+
+        def titles(match):
+            return sorted(filter_by_labels(Ticket.objects.all(), [bug.id, ui.id], match).values_list("title", flat=True))
+
+        self.assertEqual(titles(ALL), ["Both"])
+        self.assertEqual(titles(ANY), ["Both", "Bug"])
+        self.assertFalse(set_labels(only_bug, [bug.id]))
+
+
+class TicketSearchTests(TicketTestCase):
+    def setUp(self):
+        super().setUp()
+        self.dev = User.objects.create_user("dev@example.com", "pw", name="Dev")
+        ProjectMember.objects.create(user=self.dev, project=self.project, role="DEV")
+        self.make_ticket("A", status="TODO", priority="HIGH", assigned_to=self.dev)
+        self.make_ticket("B", status="TODO", priority="LOW")
+        self.make_ticket("C", status="IN_PROGRESS", priority="HIGH", assigned_to=self.dev)
+        self.make_ticket("D", status="DONE", priority="HIGH")
+
+    def search(self, project_id=None, saved_filter_id=None, **filters):
+        return search_project_tickets(
+            project_id or self.project.id,
+            filters=TicketFilter(**filters),
+            saved_filter_id=saved_filter_id,
+            include_archived=False,
+            limit=50,
+            offset=0,
+            current_user=self.owner,
+        )
+
+    def titles(self, result):
+        return sorted(ticket["title"] for ticket in result["results"])
+
+    def test_facets_count_the_whole_filtered_set(self):
+        result = self.search(status=["TODO", "IN_PROGRESS"])
+
+        self.assertEqual(result["total"], 3)
+        self.assertEqual(self.titles(result), ["A", "B", "C"])
+        self.assertEqual(result["facets"]["status"], {"TODO": 2, "IN_PROGRESS": 1})
+        self.assertEqual(result["facets"]["priority"], {"HIGH": 2, "LOW": 1})
+        self.assertEqual(result["facets"]["assigned_to"], {str(self.dev.id): 2, "unassigned": 1})
+
+    def test_query_string_overrides_saved_filter_fields(self):
+        saved = create_saved_filter(
+            self.project.id,
+            SavedFilterCreate(name="Hot", filters={"status": ["TODO"], "priority": ["HIGH"]}),
+            current_user=self.owner,
+        )
+
+        self.assertEqual(self.titles(self.search(saved_filter_id=saved.id)), ["A"])
+        self.assertEqual(self.titles(self.search(saved_filter_id=saved.id, status=["DONE"])), ["D"])
+
+    def test_saved_filter_of_another_project_is_not_found(self):
+        other = Project.objects.create(name="Other", owner=self.owner)
+        ProjectMember.objects.create(user=self.owner, project=other, role="ADMIN")
+        saved = create_saved_filter(
+            other.id, SavedFilterCreate(name="Mine", filters={}), current_user=self.owner
+        )
+
+        with self.assertRaises(HTTPException) as ctx:
+            self.search(saved_filter_id=saved.id)
+
+        self.assertEqual(ctx.exception.status_code, 404)
+
+
+class TicketLinkTests(TicketTestCase):
+    def setUp(self):
+        super().setUp()
+        # a blocks b blocks c; d blocks c
+        self.a, self.b, self.c, self.d = (self.make_ticket(title) for title in "abcd")
+        for source, target in ((self.a, self.b), (self.b, self.c), (self.d, self.c)):
+            add_link(source, target, TicketLink.BLOCKS)
+
+    def dependencies(self, ticket, direction):
+        return get_ticket_dependencies(ticket.id, direction=direction, current_user=self.owner)
+
+    def test_links_that_close_a_cycle_are_rejected(self):
+        with self.assertRaises(LinkCycle):
+            add_link(self.c, self.a, TicketLink.BLOCKS)
+        with self.assertRaises(LinkError):
+            add_link(self.a, self.a, TicketLink.BLOCKS)
+
+        # Relates-to links are undirected and may loop
+        add_link(self.c, self.a, TicketLink.RELATES_TO)
+
+    def test_transitive_blocked_by_and_blocks(self):
+        Ticket.objects.filter(id=self.a.id).update(status="DONE")
+
+        blocked_by = self.dependencies(self.c, "blocked_by")
+        self.assertEqual([t["title"] for t in blocked_by["tickets"]], ["a", "b", "d"])
+        self.assertEqual(blocked_by["open_count"], 2)
+
+        blocks = self.dependencies(self.a, "blocks")
+        self.assertEqual([t["title"] for t in blocks["tickets"]], ["b", "c"])
+        self.assertEqual(blocks["open_count"], 2)
+
+    def test_archive_and_restore_keep_links(self):
+        Ticket.objects.filter(id__in=[self.a.id, self.b.id]).update(status="DONE")
+        self.assertEqual(archive_done_tickets(older_than_days=0), 2)
+        self.assertEqual(TicketLink.objects.count(), 1)
+
+        restore_ticket(self.b.id)
+        self.assertEqual([t["title"] for t in self.dependencies(self.c, "blocked_by")["tickets"]], ["b", "d"])
 
-# Create your tests here.
+        # a -> b comes back once both ends are live
+        restore_ticket(self.a.id)
+        self.assertEqual([t["title"] for t in self.dependencies(self.c, "blocked_by")["tickets"]], ["a", "b", "d"])
+        self.assertEqual(TicketLink.objects.count(), 3)
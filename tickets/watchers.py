@@ -0,0 +1,27 @@
+"""
+Ticket subscriptions.
+
+Creators, assignees and commenters are subscribed automatically;
+anyone can unsubscribe. Notification audiences are read back with a
+single query on the (ticket, user) unique index.
+"""
+from tickets.models import TicketWatcher
+
+
+def add_watchers(ticket_ids, user_ids, reason: str):
+    """Subscribe every user to every ticket; existing subscriptions are kept."""
+    TicketWatcher.objects.bulk_create(
+        [
+            TicketWatcher(ticket_id=ticket_id, user_id=user_id, reason=reason)
+            for ticket_id in ticket_ids
+            for user_id in set(user_ids)
+            if user_id
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def ticket_audience(ticket_id: int) -> set[int]:
+    return set(
+        TicketWatcher.objects.filter(ticket_id=ticket_id).values_list("user_id", flat=True)
+    )